@@ -159,6 +159,10 @@ job_statuses : List[JobStatus] = list(get_args(JobStatus))
 
 benchmark_cycle_count_range : Sequence[int] = create_int_range(1, 10, 1)
 execution_thread_count_range : Sequence[int] = create_int_range(1, 32, 1)
+execution_process_count_range : Sequence[int] = create_int_range(1, 32, 1)
+execution_thread_budget_range : Sequence[int] = create_int_range(0, 256, 1)
+execution_replica_count_range : Sequence[int] = create_int_range(1, 8, 1)
+face_store_memory_limit_range : Sequence[int] = create_int_range(0, 4096, 64)
 face_detector_margin_range : Sequence[int] = create_int_range(0, 100, 1)
 face_detector_angles : Sequence[Angle] = create_int_range(0, 270, 90)
 face_detector_score_range : Sequence[Score] = create_float_range(0.0, 1.0, 0.05)
@@ -175,3 +179,5 @@ output_audio_quality_range : Sequence[int] = create_int_range(0, 100, 1)
 output_audio_volume_range : Sequence[int] = create_int_range(0, 100, 1)
 output_video_quality_range : Sequence[int] = create_int_range(0, 100, 1)
 output_video_scale_range : Sequence[float] = create_float_range(0.25, 8.0, 0.25)
+output_video_segment_count_range : Sequence[int] = create_int_range(1, 16, 1)
+output_video_segment_duration_range : Sequence[int] = create_int_range(0, 600, 10)
@@ -3,16 +3,17 @@ import itertools
 import shutil
 import signal
 import sys
+import threading
 from time import time
 
-from facefusion import benchmarker, cli_helper, content_analyser, hash_helper, logger, state_manager, translator
+from facefusion import benchmarker, cli_helper, content_analyser, hash_helper, inference_manager, logger, state_manager, translator
 from facefusion.args import apply_args, collect_job_args, reduce_job_args, reduce_step_args
 from facefusion.download import conditional_download_hashes, conditional_download_sources
 from facefusion.exit_helper import hard_exit, signal_exit
 from facefusion.filesystem import get_file_extension, get_file_name, is_video, resolve_file_paths, resolve_file_pattern
 from facefusion.jobs import job_helper, job_manager, job_runner
 from facefusion.jobs.job_list import compose_job_list
-from facefusion.processors.core import get_processors_modules
+from facefusion.processors.core import get_inference_modules, get_processors_modules
 from facefusion.program import create_program
 from facefusion.program_helper import validate_args
 from facefusion.types import Args, ErrorCode, WorkflowMode
@@ -301,6 +302,8 @@ def process_step(job_id : str, step_index : int, step_args : Args) -> bool:
 	step_total = job_manager.count_step_total(job_id)
 	step_args.update(collect_job_args())
 	apply_args(step_args, state_manager.set_item)
+	state_manager.set_item('job_id', job_id)
+	state_manager.set_item('step_index', step_index)
 
 	logger.info(translator.get('processing_step').format(step_current = step_index + 1, step_total = step_total), __name__)
 	if common_pre_check() and processors_pre_check():
@@ -316,6 +319,9 @@ def conditional_process() -> ErrorCode:
 		state_manager.set_item('workflow_mode', detect_workflow_mode())
 
 	if state_manager.get_item('workflow_mode') == detect_workflow_mode():
+		inference_modules = get_inference_modules(get_processors_modules(state_manager.get_item('processors')))
+		threading.Thread(target = inference_manager.preload_inference_pools, args = (inference_modules,), daemon = True).start()
+
 		for processor_module in get_processors_modules(state_manager.get_item('processors')):
 			if not processor_module.pre_process('output'):
 				return 2
@@ -9,7 +9,7 @@ import onnxruntime
 
 import facefusion.choices
 from facefusion.filesystem import create_directory, is_directory
-from facefusion.types import ExecutionDevice, ExecutionProvider, InferenceOptionSet, InferenceProvider, ValueAndUnit
+from facefusion.types import ExecutionDevice, ExecutionProvider, InferenceOptionSet, InferenceProvider, InferenceSessionOptions, ValueAndUnit
 
 onnxruntime.set_default_logger_severity(3)
 
@@ -118,6 +118,53 @@ def create_inference_providers(execution_device_id : int, execution_providers :
 	return inference_providers
 
 
+def create_inference_session_options(execution_thread_budget : int, execution_thread_count : int, execution_process_count : int) -> InferenceSessionOptions:
+	inference_session_options : InferenceSessionOptions =\
+	{
+		'inter_op_thread_count': 1,
+		'execution_mode': 'sequential',
+		'graph_optimization': 'all',
+		'enable_memory_arena': True,
+		'enable_memory_pattern': True
+	}
+
+	if execution_thread_budget:
+		inference_session_options['intra_op_thread_count'] = resolve_intra_op_thread_count(execution_thread_budget, execution_thread_count, execution_process_count)
+	return inference_session_options
+
+
+def create_session_options(inference_session_options : InferenceSessionOptions) -> onnxruntime.SessionOptions:
+	session_options = onnxruntime.SessionOptions()
+	graph_optimization_level_set =\
+	{
+		'disable': onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL,
+		'basic': onnxruntime.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+		'extended': onnxruntime.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+		'all': onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+	}
+
+	if 'intra_op_thread_count' in inference_session_options:
+		session_options.intra_op_num_threads = inference_session_options.get('intra_op_thread_count')
+	if 'inter_op_thread_count' in inference_session_options:
+		session_options.inter_op_num_threads = inference_session_options.get('inter_op_thread_count')
+	if inference_session_options.get('execution_mode') == 'parallel':
+		session_options.execution_mode = onnxruntime.ExecutionMode.ORT_PARALLEL
+	if inference_session_options.get('execution_mode') == 'sequential':
+		session_options.execution_mode = onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+	if 'graph_optimization' in inference_session_options:
+		session_options.graph_optimization_level = graph_optimization_level_set.get(inference_session_options.get('graph_optimization'))
+	if 'enable_memory_arena' in inference_session_options:
+		session_options.enable_cpu_mem_arena = inference_session_options.get('enable_memory_arena')
+	if 'enable_memory_pattern' in inference_session_options:
+		session_options.enable_mem_pattern = inference_session_options.get('enable_memory_pattern')
+
+	return session_options
+
+
+def resolve_intra_op_thread_count(execution_thread_budget : int, execution_thread_count : int, execution_process_count : int) -> int:
+	return max(execution_thread_budget // (execution_thread_count * execution_process_count), 1)
+
+
 def resolve_cache_path() -> str:
 	return os.path.join('.caches', onnxruntime.get_version_string())
 
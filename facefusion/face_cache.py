@@ -0,0 +1,183 @@
+import os
+import threading
+import uuid
+from typing import List, Optional, Tuple
+
+import numpy
+
+from facefusion import face_classifier, face_recognizer, state_manager
+from facefusion.filesystem import create_directory, get_file_name, is_file, remove_file
+from facefusion.hash_helper import create_hash
+from facefusion.types import Face, FaceCacheArray, FaceCacheItem, FaceCacheSet, FaceLandmarkSet, FaceScoreSet, FrameTotalSet, VisionKey
+
+FACE_CACHE_DTYPE : numpy.dtype =\
+numpy.dtype(
+[
+	('origin', 'U8'),
+	('bounding_box', numpy.float32, (4,)),
+	('score_set', numpy.float64, (2,)),
+	('landmark_5', numpy.float32, (5, 2)),
+	('landmark_5_68', numpy.float32, (5, 2)),
+	('landmark_68', numpy.float32, (68, 2)),
+	('landmark_68_5', numpy.float32, (68, 2)),
+	('angle', numpy.int32),
+	('embedding', numpy.float32, (512,)),
+	('embedding_norm', numpy.float32, (512,)),
+	('age', numpy.int32, (2,)),
+	('gender', 'U8'),
+	('race', 'U8')
+])
+FACE_CACHE_LIMIT : int = 4
+FACE_CACHE_RECORD_DTYPE : numpy.dtype =\
+numpy.dtype(
+[
+	('is_analysed', numpy.bool_),
+	('face_total', numpy.uint8),
+	('faces', FACE_CACHE_DTYPE, (FACE_CACHE_LIMIT,))
+])
+FACE_CACHE_SET : FaceCacheSet = {}
+FACE_CACHE_LOCK : threading.Lock = threading.Lock()
+FRAME_TOTAL_SET : FrameTotalSet = {}
+
+
+def register_frame_total(video_hash : str, frame_total : int) -> None:
+	FRAME_TOTAL_SET[video_hash] = frame_total
+
+
+def resolve_face_cache_directory_path() -> Optional[str]:
+	face_cache_path = state_manager.get_item('face_cache_path')
+
+	if face_cache_path:
+		face_cache_context =\
+		[
+			state_manager.get_item('face_detector_model'),
+			state_manager.get_item('face_detector_size'),
+			state_manager.get_item('face_detector_margin'),
+			state_manager.get_item('face_detector_angles'),
+			state_manager.get_item('face_detector_score'),
+			state_manager.get_item('face_landmarker_model'),
+			state_manager.get_item('face_landmarker_score'),
+			get_file_name(face_recognizer.get_model_options().get('sources').get('face_recognizer').get('path')),
+			get_file_name(face_classifier.get_model_options().get('sources').get('face_classifier').get('path'))
+		]
+		face_cache_hash = create_hash(str(face_cache_context).encode())
+		return os.path.join(face_cache_path, face_cache_hash)
+	return None
+
+
+def read_faces(vision_key : Optional[VisionKey]) -> Optional[List[Face]]:
+	face_cache_record = resolve_face_cache_record(vision_key)
+
+	if face_cache_record:
+		face_cache_array, frame_number = face_cache_record
+
+		if face_cache_array['is_analysed'][frame_number]:
+			face_total = int(face_cache_array['face_total'][frame_number])
+			face_cache_items = face_cache_array['faces'][frame_number, :face_total].copy()
+			return [ unpack_face(face_cache_item) for face_cache_item in face_cache_items ]
+
+	return None
+
+
+def write_faces(vision_key : Optional[VisionKey], faces : List[Face]) -> None:
+	face_cache_record = resolve_face_cache_record(vision_key)
+
+	if face_cache_record and len(faces) <= FACE_CACHE_LIMIT:
+		face_cache_array, frame_number = face_cache_record
+
+		for face_index, face in enumerate(faces):
+			face_cache_array['faces'][frame_number, face_index] = pack_face(face)
+
+		face_cache_array['face_total'][frame_number] = len(faces)
+		face_cache_array['is_analysed'][frame_number] = True
+
+
+def resolve_face_cache_record(vision_key : Optional[VisionKey]) -> Optional[Tuple[FaceCacheArray, int]]:
+	face_cache_directory_path = resolve_face_cache_directory_path()
+
+	if vision_key and face_cache_directory_path:
+		vision_key_parts = vision_key.split('_')
+
+		if len(vision_key_parts) == 3 and vision_key_parts[2].isdigit():
+			video_hash, video_resolution, frame_number = vision_key_parts[0], vision_key_parts[1], int(vision_key_parts[2])
+			frame_total = FRAME_TOTAL_SET.get(video_hash)
+
+			if frame_total and frame_number < frame_total:
+				face_cache_file_path = os.path.join(face_cache_directory_path, video_hash + '_' + video_resolution + '.npy')
+				return get_face_cache_array(face_cache_file_path, frame_total), frame_number
+
+	return None
+
+
+def get_face_cache_array(face_cache_file_path : str, frame_total : int) -> FaceCacheArray:
+	with FACE_CACHE_LOCK:
+		if face_cache_file_path not in FACE_CACHE_SET:
+			if not is_file(face_cache_file_path):
+				create_face_cache_file(face_cache_file_path, frame_total)
+
+			FACE_CACHE_SET[face_cache_file_path] = numpy.lib.format.open_memmap(face_cache_file_path, mode = 'r+')
+
+		return FACE_CACHE_SET.get(face_cache_file_path)
+
+
+def create_face_cache_file(face_cache_file_path : str, frame_total : int) -> None:
+	face_cache_directory_path = os.path.dirname(face_cache_file_path)
+
+	if create_directory(face_cache_directory_path):
+		face_cache_temp_path = os.path.join(face_cache_directory_path, uuid.uuid4().hex + '.tmp')
+		face_cache_array = numpy.lib.format.open_memmap(face_cache_temp_path, mode = 'w+', dtype = FACE_CACHE_RECORD_DTYPE, shape = (frame_total,))
+		face_cache_array.flush()
+		del face_cache_array
+
+		try:
+			os.link(face_cache_temp_path, face_cache_file_path)
+		except FileExistsError:
+			pass
+
+		remove_file(face_cache_temp_path)
+
+
+def pack_face(face : Face) -> FaceCacheItem:
+	face_cache_item = numpy.zeros((), dtype = FACE_CACHE_DTYPE)
+	face_cache_item['origin'] = face.origin
+	face_cache_item['bounding_box'] = face.bounding_box
+	face_cache_item['score_set'] = [ face.score_set.get('detector'), face.score_set.get('landmarker') ]
+	face_cache_item['landmark_5'] = face.landmark_set.get('5')
+	face_cache_item['landmark_5_68'] = face.landmark_set.get('5/68')
+	face_cache_item['landmark_68'] = face.landmark_set.get('68')
+	face_cache_item['landmark_68_5'] = face.landmark_set.get('68/5')
+	face_cache_item['angle'] = face.angle
+	face_cache_item['embedding'] = face.embedding
+	face_cache_item['embedding_norm'] = face.embedding_norm
+	face_cache_item['age'] = [ face.age.start, face.age.stop ]
+	face_cache_item['gender'] = face.gender
+	face_cache_item['race'] = face.race
+	return face_cache_item
+
+
+def unpack_face(face_cache_item : FaceCacheItem) -> Face:
+	face_score_set : FaceScoreSet =\
+	{
+		'detector': float(face_cache_item['score_set'][0]),
+		'landmarker': float(face_cache_item['score_set'][1])
+	}
+	face_landmark_set : FaceLandmarkSet =\
+	{
+		'5': face_cache_item['landmark_5'],
+		'5/68': face_cache_item['landmark_5_68'],
+		'68': face_cache_item['landmark_68'],
+		'68/5': face_cache_item['landmark_68_5']
+	}
+
+	return Face(
+		origin = str(face_cache_item['origin']),
+		bounding_box = face_cache_item['bounding_box'],
+		score_set = face_score_set,
+		landmark_set = face_landmark_set,
+		angle = int(face_cache_item['angle']),
+		embedding = face_cache_item['embedding'],
+		embedding_norm = face_cache_item['embedding_norm'],
+		age = range(int(face_cache_item['age'][0]), int(face_cache_item['age'][1])),
+		gender = str(face_cache_item['gender']),
+		race = str(face_cache_item['race'])
+	)
@@ -7,7 +7,6 @@ from facefusion import inference_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_helper import warp_face_by_face_landmark_5
 from facefusion.filesystem import resolve_relative_path
-from facefusion.thread_helper import conditional_thread_semaphore
 from facefusion.types import Age, DownloadScope, FaceLandmark5, Gender, InferencePool, ModelOptions, ModelSet, Race, VisionFrame
 
 
@@ -70,34 +69,37 @@ def pre_check() -> bool:
 	return conditional_download_hashes(model_hash_set) and conditional_download_sources(model_source_set)
 
 
-def classify_face(temp_vision_frame : VisionFrame, face_landmark_5 : FaceLandmark5) -> Tuple[Gender, Age, Race]:
+def classify_faces(temp_vision_frame : VisionFrame, face_landmarks_5 : List[FaceLandmark5]) -> List[Tuple[Gender, Age, Race]]:
 	model_template = get_model_options().get('template')
 	model_size = get_model_options().get('size')
 	model_mean = get_model_options().get('mean')
 	model_standard_deviation = get_model_options().get('standard_deviation')
-	crop_vision_frame, _ = warp_face_by_face_landmark_5(temp_vision_frame, face_landmark_5, model_template, model_size)
-	crop_vision_frame = crop_vision_frame.astype(numpy.float32)[:, :, ::-1] / 255.0
-	crop_vision_frame -= model_mean
-	crop_vision_frame /= model_standard_deviation
-	crop_vision_frame = crop_vision_frame.transpose(2, 0, 1)
-	crop_vision_frame = numpy.expand_dims(crop_vision_frame, axis = 0)
-	gender_id, age_id, race_id = forward(crop_vision_frame)
-	gender = categorize_gender(gender_id[0])
-	age = categorize_age(age_id[0])
-	race = categorize_race(race_id[0])
-	return gender, age, race
-
-
-def forward(crop_vision_frame : VisionFrame) -> Tuple[List[int], List[int], List[int]]:
+	face_classifications = []
+	crop_vision_frames = numpy.stack([ warp_face_by_face_landmark_5(temp_vision_frame, face_landmark_5, model_template, model_size)[0] for face_landmark_5 in face_landmarks_5 ])
+	crop_vision_frames = crop_vision_frames.astype(numpy.float32)[:, :, :, ::-1] / 255.0
+	crop_vision_frames -= model_mean
+	crop_vision_frames /= model_standard_deviation
+	crop_vision_frames = crop_vision_frames.transpose(0, 3, 1, 2)
+	gender_ids, age_ids, race_ids = forward(crop_vision_frames)
+
+	for gender_id, age_id, race_id in zip(gender_ids, age_ids, race_ids):
+		gender = categorize_gender(gender_id)
+		age = categorize_age(age_id)
+		race = categorize_race(race_id)
+		face_classifications.append((gender, age, race))
+
+	return face_classifications
+
+
+def forward(crop_vision_frames : VisionFrame) -> Tuple[List[int], List[int], List[int]]:
 	face_classifier = get_inference_pool().get('face_classifier')
 
-	with conditional_thread_semaphore():
-		race_id, gender_id, age_id = face_classifier.run(None,
-		{
-			'input': crop_vision_frame
-		})
+	race_ids, gender_ids, age_ids = inference_manager.run_inference_batches(face_classifier,
+	{
+		'input': crop_vision_frames
+	}, len(crop_vision_frames))
 
-	return gender_id, age_id, race_id
+	return gender_ids.tolist(), age_ids.tolist(), race_ids.tolist()
 
 
 def categorize_gender(gender_id : int) -> Gender:
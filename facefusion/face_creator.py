@@ -1,35 +1,43 @@
+from contextlib import ExitStack
 from typing import List, Optional
 
 import numpy
 
-from facefusion import face_store, state_manager
+from facefusion import face_cache, face_store, state_manager
 from facefusion.common_helper import get_first, get_middle
-from facefusion.face_classifier import classify_face
-from facefusion.face_detector import detect_faces, detect_faces_by_angle
+from facefusion.face_classifier import classify_faces
+from facefusion.face_detector import detect_many_faces, detect_many_faces_by_angle
 from facefusion.face_helper import apply_nms, average_points, convert_to_face_landmark_5, estimate_face_angle, get_nms_threshold
-from facefusion.face_landmarker import detect_face_landmark, estimate_face_landmark_68_5
-from facefusion.face_recognizer import calculate_face_embedding
-from facefusion.types import BoundingBox, Face, FaceLandmark5, FaceLandmarkSet, FaceScoreSet, Score, VisionFrame
+from facefusion.face_landmarker import detect_face_landmarks, estimate_face_landmark_68_5
+from facefusion.face_recognizer import calculate_face_embeddings
+from facefusion.types import BoundingBox, Face, FaceLandmark5, FaceLandmarkSet, FaceScoreSet, Score, VisionFrame, VisionKey
 from facefusion.vision import is_vision_frame
 
 
 def create_faces(vision_frame : VisionFrame, bounding_boxes : List[BoundingBox], face_scores : List[Score], face_landmarks_5 : List[FaceLandmark5]) -> List[Face]:
 	faces = []
+	face_landmark_sets = []
+	face_score_sets = []
+	face_landmarks_68_5 = []
+	face_angles = []
 	nms_threshold = get_nms_threshold(state_manager.get_item('face_detector_model'), state_manager.get_item('face_detector_angles'))
 	keep_indices = apply_nms(bounding_boxes, face_scores, state_manager.get_item('face_detector_score'), nms_threshold)
 
 	for index in keep_indices:
-		bounding_box = bounding_boxes[index]
-		face_score = face_scores[index]
+		face_landmark_68_5 = estimate_face_landmark_68_5(face_landmarks_5[index])
+		face_landmarks_68_5.append(face_landmark_68_5)
+		face_angles.append(estimate_face_angle(face_landmark_68_5))
+
+	face_landmarks_68 = face_landmarks_68_5
+	face_landmark_scores_68 = [ 0.0 ] * len(face_landmarks_68_5)
+
+	if face_landmarks_68_5 and state_manager.get_item('face_landmarker_score') > 0:
+		face_landmarks_68, face_landmark_scores_68 = detect_face_landmarks(vision_frame, [ bounding_boxes[index] for index in keep_indices ], face_angles)
+
+	for index, face_landmark_68_5, face_landmark_68, face_landmark_score_68 in zip(keep_indices, face_landmarks_68_5, face_landmarks_68, face_landmark_scores_68):
 		face_landmark_5 = face_landmarks_5[index]
 		face_landmark_5_68 = face_landmark_5
-		face_landmark_68_5 = estimate_face_landmark_68_5(face_landmark_5_68)
-		face_landmark_68 = face_landmark_68_5
-		face_landmark_score_68 = 0.0
-		face_angle = estimate_face_angle(face_landmark_68_5)
 
-		if state_manager.get_item('face_landmarker_score') > 0:
-			face_landmark_68, face_landmark_score_68 = detect_face_landmark(vision_frame, bounding_box, face_angle)
 		if face_landmark_score_68 > state_manager.get_item('face_landmarker_score'):
 			face_landmark_5_68 = convert_to_face_landmark_5(face_landmark_68)
 
@@ -42,24 +50,33 @@ def create_faces(vision_frame : VisionFrame, bounding_boxes : List[BoundingBox],
 		}
 		face_score_set : FaceScoreSet =\
 		{
-			'detector': face_score,
+			'detector': face_scores[index],
 			'landmarker': face_landmark_score_68
 		}
-		face_embedding, face_embedding_norm = calculate_face_embedding(vision_frame, face_landmark_set.get('5/68'))
-		gender, age, race = classify_face(vision_frame, face_landmark_set.get('5/68'))
-
-		faces.append(Face(
-			origin = 'detect',
-			bounding_box = bounding_box,
-			score_set = face_score_set,
-			landmark_set = face_landmark_set,
-			angle = face_angle,
-			embedding = face_embedding,
-			embedding_norm = face_embedding_norm,
-			gender = gender,
-			age = age,
-			race = race
-		))
+		face_landmark_sets.append(face_landmark_set)
+		face_score_sets.append(face_score_set)
+
+	if face_landmark_sets:
+		face_landmarks_5_68 = [ face_landmark_set.get('5/68') for face_landmark_set in face_landmark_sets ]
+		face_embeddings, face_embeddings_norm = calculate_face_embeddings(vision_frame, face_landmarks_5_68)
+		face_classifications = classify_faces(vision_frame, face_landmarks_5_68)
+
+		for face_index, keep_index in enumerate(keep_indices):
+			gender, age, race = face_classifications[face_index]
+
+			faces.append(Face(
+				origin = 'detect',
+				bounding_box = bounding_boxes[keep_index],
+				score_set = face_score_sets[face_index],
+				landmark_set = face_landmark_sets[face_index],
+				angle = face_angles[face_index],
+				embedding = face_embeddings[face_index],
+				embedding_norm = face_embeddings_norm[face_index],
+				gender = gender,
+				age = age,
+				race = race
+			))
+
 	return faces
 
 
@@ -72,52 +89,101 @@ def get_one_face(faces : List[Face], position : int = 0) -> Optional[Face]:
 
 def get_many_faces(vision_frames : List[VisionFrame]) -> List[Face]:
 	many_faces : List[Face] = []
+	vision_frames = [ vision_frame for vision_frame in vision_frames if is_vision_frame(vision_frame) ]
 
-	for vision_frame in vision_frames:
-		if is_vision_frame(vision_frame):
-			all_bounding_boxes = []
-			all_face_scores = []
-			all_face_landmarks_5 = []
-
-			for face_detector_angle in state_manager.get_item('face_detector_angles'):
-				if face_detector_angle == 0:
-					bounding_boxes, face_scores, face_landmarks_5 = detect_faces(vision_frame)
-				else:
-					bounding_boxes, face_scores, face_landmarks_5 = detect_faces_by_angle(vision_frame, face_detector_angle)
-				all_bounding_boxes.extend(bounding_boxes)
-				all_face_scores.extend(face_scores)
-				all_face_landmarks_5.extend(face_landmarks_5)
+	for faces in create_frame_faces(vision_frames):
+		many_faces.extend(faces)
 
-			if all_bounding_boxes and all_face_scores and all_face_landmarks_5 and state_manager.get_item('face_detector_score') > 0:
-				faces = create_faces(vision_frame, all_bounding_boxes, all_face_scores, all_face_landmarks_5)
+	return many_faces
 
-				if faces:
-					many_faces.extend(faces)
 
-	return many_faces
+def create_frame_faces(vision_frames : List[VisionFrame]) -> List[List[Face]]:
+	frame_faces : List[List[Face]] = []
+	all_bounding_boxes : List[List[BoundingBox]] = [ [] for _ in vision_frames ]
+	all_face_scores : List[List[Score]] = [ [] for _ in vision_frames ]
+	all_face_landmarks_5 : List[List[FaceLandmark5]] = [ [] for _ in vision_frames ]
+
+	if not vision_frames:
+		return frame_faces
+
+	for face_detector_angle in state_manager.get_item('face_detector_angles'):
+		if face_detector_angle == 0:
+			face_detections = detect_many_faces(vision_frames)
+		else:
+			face_detections = detect_many_faces_by_angle(vision_frames, face_detector_angle)
+
+		for frame_index, (bounding_boxes, face_scores, face_landmarks_5) in enumerate(face_detections):
+			all_bounding_boxes[frame_index].extend(bounding_boxes)
+			all_face_scores[frame_index].extend(face_scores)
+			all_face_landmarks_5[frame_index].extend(face_landmarks_5)
+
+	for vision_frame, bounding_boxes, face_scores, face_landmarks_5 in zip(vision_frames, all_bounding_boxes, all_face_scores, all_face_landmarks_5):
+		faces = []
+
+		if bounding_boxes and face_scores and face_landmarks_5 and state_manager.get_item('face_detector_score') > 0:
+			faces = create_faces(vision_frame, bounding_boxes, face_scores, face_landmarks_5)
+
+		frame_faces.append(faces)
+
+	return frame_faces
 
 
 def get_static_faces(vision_frames : List[VisionFrame]) -> List[Face]:
 	many_faces : List[Face] = []
 
 	for vision_frame in vision_frames:
-		faces = face_store.get_faces(vision_frame)
+		vision_key = face_store.create_vision_key(vision_frame)
+		faces = face_store.get_faces(vision_key)
 
-		if not faces:
-			with face_store.resolve_lock(vision_frame):
-				faces = face_store.get_faces(vision_frame)
-
-				if not faces:
-					faces = get_many_faces([ vision_frame ])
+		if faces is None:
+			with face_store.resolve_lock(vision_key):
+				if face_store.has_faces(vision_key):
+					faces = face_store.get_faces(vision_key)
+				else:
+					faces = []
 
-					if faces:
-						face_store.set_faces(vision_frame, faces)
+					if is_vision_frame(vision_frame):
+						faces = create_static_frame_faces([ vision_frame ])[0]
+					face_store.set_faces(vision_key, faces)
 
 		many_faces.extend(faces)
 
 	return many_faces
 
 
+def analyse_static_faces(vision_frames : List[VisionFrame]) -> None:
+	analyse_vision_frames : List[VisionFrame] = []
+	analyse_vision_keys : List[VisionKey] = []
+
+	with ExitStack() as exit_stack:
+		for vision_frame in vision_frames:
+			if is_vision_frame(vision_frame):
+				vision_key = face_store.create_vision_key(vision_frame)
+
+				if vision_key not in analyse_vision_keys and face_store.get_faces(vision_key) is None:
+					exit_stack.enter_context(face_store.resolve_lock(vision_key))
+
+					if not face_store.has_faces(vision_key):
+						analyse_vision_frames.append(vision_frame)
+						analyse_vision_keys.append(vision_key)
+
+		if analyse_vision_frames:
+			for vision_key, faces in zip(analyse_vision_keys, create_static_frame_faces(analyse_vision_frames)):
+				face_store.set_faces(vision_key, faces)
+
+
+def create_static_frame_faces(vision_frames : List[VisionFrame]) -> List[List[Face]]:
+	frame_faces = [ face_cache.read_faces(face_store.get_vision_key(vision_frame)) for vision_frame in vision_frames ]
+	analyse_indices = [ frame_index for frame_index, faces in enumerate(frame_faces) if faces is None ]
+
+	if analyse_indices:
+		for frame_index, faces in zip(analyse_indices, create_frame_faces([ vision_frames[frame_index] for frame_index in analyse_indices ])):
+			face_cache.write_faces(face_store.get_vision_key(vision_frames[frame_index]), faces)
+			frame_faces[frame_index] = faces
+
+	return [ faces or [] for faces in frame_faces ]
+
+
 def refill_faces(faces : List[Optional[Face]]) -> List[Face]:
 	fill_faces = []
 	anchor_index_previous = -1
@@ -3,13 +3,13 @@ from typing import List, Sequence, Tuple
 
 import cv2
 import numpy
+from onnxruntime import InferenceSession
 
 from facefusion import inference_manager, state_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_helper import create_rotation_matrix_and_size, create_static_anchors, distance_to_bounding_box, distance_to_face_landmark_5, normalize_bounding_box, transform_bounding_box, transform_points
 from facefusion.filesystem import resolve_relative_path
-from facefusion.thread_helper import thread_semaphore
-from facefusion.types import Angle, BoundingBox, Detection, DownloadScope, DownloadSet, FaceLandmark5, InferencePool, Margin, ModelSet, Score, VisionFrame
+from facefusion.types import Angle, BoundingBox, Detection, DownloadScope, DownloadSet, FaceLandmark5, InferenceLimitSet, InferencePool, Margin, ModelSet, Score, VisionFrame
 from facefusion.vision import restrict_frame, unpack_resolution
 
 
@@ -132,6 +132,16 @@ def clear_inference_pool() -> None:
 	inference_manager.clear_inference_pool(__name__, model_names)
 
 
+def adjust_inference_limits() -> InferenceLimitSet:
+	return\
+	{
+		'retinaface': 1,
+		'scrfd': 1,
+		'yolo_face': 1,
+		'yunet': 1
+	}
+
+
 def collect_model_downloads() -> Tuple[DownloadSet, DownloadSet]:
 	model_set = create_static_model_set('full')
 	model_hash_set = {}
@@ -152,39 +162,43 @@ def pre_check() -> bool:
 
 
 def detect_faces(vision_frame : VisionFrame) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	margin_top, margin_right, margin_bottom, margin_left = prepare_margin(vision_frame)
-	margin_vision_frame = numpy.pad(vision_frame, ((margin_top, margin_bottom), (margin_left, margin_right), (0, 0)))
-	all_bounding_boxes : List[BoundingBox] = []
-	all_face_scores : List[Score] = []
-	all_face_landmarks_5 : List[FaceLandmark5] = []
+	return detect_many_faces([ vision_frame ])[0]
+
+
+def detect_many_faces(vision_frames : List[VisionFrame]) -> List[Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]]:
+	face_detections = []
+	model_face_detections = []
+	margins = [ prepare_margin(vision_frame) for vision_frame in vision_frames ]
+	margin_vision_frames = [ numpy.pad(vision_frame, ((margin_top, margin_bottom), (margin_left, margin_right), (0, 0))) for vision_frame, (margin_top, margin_right, margin_bottom, margin_left) in zip(vision_frames, margins) ]
 
 	if state_manager.get_item('face_detector_model') in [ 'many', 'retinaface' ]:
-		bounding_boxes, face_scores, face_landmarks_5 = detect_with_retinaface(margin_vision_frame, state_manager.get_item('face_detector_size'))
-		all_bounding_boxes.extend(bounding_boxes)
-		all_face_scores.extend(face_scores)
-		all_face_landmarks_5.extend(face_landmarks_5)
+		model_face_detections.append(detect_with_retinaface(margin_vision_frames, state_manager.get_item('face_detector_size')))
 
 	if state_manager.get_item('face_detector_model') in [ 'many', 'scrfd' ]:
-		bounding_boxes, face_scores, face_landmarks_5 = detect_with_scrfd(margin_vision_frame, state_manager.get_item('face_detector_size'))
-		all_bounding_boxes.extend(bounding_boxes)
-		all_face_scores.extend(face_scores)
-		all_face_landmarks_5.extend(face_landmarks_5)
+		model_face_detections.append(detect_with_scrfd(margin_vision_frames, state_manager.get_item('face_detector_size')))
 
 	if state_manager.get_item('face_detector_model') in [ 'many', 'yolo_face' ]:
-		bounding_boxes, face_scores, face_landmarks_5 = detect_with_yolo_face(margin_vision_frame, state_manager.get_item('face_detector_size'))
-		all_bounding_boxes.extend(bounding_boxes)
-		all_face_scores.extend(face_scores)
-		all_face_landmarks_5.extend(face_landmarks_5)
+		model_face_detections.append(detect_with_yolo_face(margin_vision_frames, state_manager.get_item('face_detector_size')))
 
 	if state_manager.get_item('face_detector_model') == 'yunet':
-		bounding_boxes, face_scores, face_landmarks_5 = detect_with_yunet(margin_vision_frame, state_manager.get_item('face_detector_size'))
-		all_bounding_boxes.extend(bounding_boxes)
-		all_face_scores.extend(face_scores)
-		all_face_landmarks_5.extend(face_landmarks_5)
+		model_face_detections.append(detect_with_yunet(margin_vision_frames, state_manager.get_item('face_detector_size')))
+
+	for frame_index, (margin_top, margin_right, margin_bottom, margin_left) in enumerate(margins):
+		all_bounding_boxes : List[BoundingBox] = []
+		all_face_scores : List[Score] = []
+		all_face_landmarks_5 : List[FaceLandmark5] = []
 
-	all_bounding_boxes = [ normalize_bounding_box(all_bounding_box) - numpy.array([ margin_left, margin_top, margin_left, margin_top ]) for all_bounding_box in all_bounding_boxes ]
-	all_face_landmarks_5 = [ all_face_landmark_5 - numpy.array([ margin_left, margin_top ]) for all_face_landmark_5 in all_face_landmarks_5 ]
-	return all_bounding_boxes, all_face_scores, all_face_landmarks_5
+		for model_face_detection in model_face_detections:
+			bounding_boxes, face_scores, face_landmarks_5 = model_face_detection[frame_index]
+			all_bounding_boxes.extend(bounding_boxes)
+			all_face_scores.extend(face_scores)
+			all_face_landmarks_5.extend(face_landmarks_5)
+
+		all_bounding_boxes = [ normalize_bounding_box(all_bounding_box) - numpy.array([ margin_left, margin_top, margin_left, margin_top ]) for all_bounding_box in all_bounding_boxes ]
+		all_face_landmarks_5 = [ all_face_landmark_5 - numpy.array([ margin_left, margin_top ]) for all_face_landmark_5 in all_face_landmarks_5 ]
+		face_detections.append((all_bounding_boxes, all_face_scores, all_face_landmarks_5))
+
+	return face_detections
 
 
 def prepare_margin(vision_frame : VisionFrame) -> Margin:
@@ -196,250 +210,275 @@ def prepare_margin(vision_frame : VisionFrame) -> Margin:
 
 
 def detect_faces_by_angle(vision_frame : VisionFrame, face_angle : Angle) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	rotation_matrix, rotation_size = create_rotation_matrix_and_size(face_angle, vision_frame.shape[:2][::-1])
-	rotation_vision_frame = cv2.warpAffine(vision_frame, rotation_matrix, rotation_size)
-	rotation_inverse_matrix = cv2.invertAffineTransform(rotation_matrix)
-	bounding_boxes, face_scores, face_landmarks_5 = detect_faces(rotation_vision_frame)
-	bounding_boxes = [ transform_bounding_box(bounding_box, rotation_inverse_matrix) for bounding_box in bounding_boxes ]
-	face_landmarks_5 = [ transform_points(face_landmark_5, rotation_inverse_matrix) for face_landmark_5 in face_landmarks_5 ]
-	return bounding_boxes, face_scores, face_landmarks_5
-
-
-def detect_with_retinaface(vision_frame : VisionFrame, face_detector_size : str) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	bounding_boxes = []
-	face_scores = []
-	face_landmarks_5 = []
+	return detect_many_faces_by_angle([ vision_frame ], face_angle)[0]
+
+
+def detect_many_faces_by_angle(vision_frames : List[VisionFrame], face_angle : Angle) -> List[Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]]:
+	face_detections = []
+	rotation_vision_frames = []
+	rotation_inverse_matrices = []
+
+	for vision_frame in vision_frames:
+		rotation_matrix, rotation_size = create_rotation_matrix_and_size(face_angle, vision_frame.shape[:2][::-1])
+		rotation_vision_frames.append(cv2.warpAffine(vision_frame, rotation_matrix, rotation_size))
+		rotation_inverse_matrices.append(cv2.invertAffineTransform(rotation_matrix))
+
+	for (bounding_boxes, face_scores, face_landmarks_5), rotation_inverse_matrix in zip(detect_many_faces(rotation_vision_frames), rotation_inverse_matrices):
+		bounding_boxes = [ transform_bounding_box(bounding_box, rotation_inverse_matrix) for bounding_box in bounding_boxes ]
+		face_landmarks_5 = [ transform_points(face_landmark_5, rotation_inverse_matrix) for face_landmark_5 in face_landmarks_5 ]
+		face_detections.append((bounding_boxes, face_scores, face_landmarks_5))
+
+	return face_detections
+
+
+def detect_with_retinaface(vision_frames : List[VisionFrame], face_detector_size : str) -> List[Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]]:
+	face_detections = []
 	feature_strides = [ 8, 16, 32 ]
 	feature_map_channel = 3
 	anchor_total = 2
 	face_detector_score = state_manager.get_item('face_detector_score')
 	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
-	temp_vision_frame = restrict_frame(vision_frame, (face_detector_width, face_detector_height))
-	ratio_height = vision_frame.shape[0] / temp_vision_frame.shape[0]
-	ratio_width = vision_frame.shape[1] / temp_vision_frame.shape[1]
-	detect_vision_frame = prepare_detect_frame(temp_vision_frame, face_detector_size)
-	detect_vision_frame = normalize_detect_frame(detect_vision_frame, [ -1, 1 ])
-	detection = forward_with_retinaface(detect_vision_frame)
+	detect_vision_frames, detect_ratios = prepare_detect_frames(vision_frames, face_detector_size)
+	detect_vision_frames = normalize_detect_frame(detect_vision_frames, [ -1, 1 ])
+	detections = forward_with_retinaface(detect_vision_frames)
 
-	for index, feature_stride in enumerate(feature_strides):
-		face_scores_raw = detection[index]
-		keep_indices = numpy.where(face_scores_raw >= face_detector_score)[0]
+	for detection, (ratio_width, ratio_height) in zip(detections, detect_ratios):
+		bounding_boxes = []
+		face_scores = []
+		face_landmarks_5 = []
 
-		if numpy.any(keep_indices):
-			stride_height = face_detector_height // feature_stride
-			stride_width = face_detector_width // feature_stride
-			anchors = create_static_anchors(feature_stride, anchor_total, stride_height, stride_width)
-			bounding_boxes_raw = detection[index + feature_map_channel] * feature_stride
-			face_landmarks_5_raw = detection[index + feature_map_channel * 2] * feature_stride
+		for index, feature_stride in enumerate(feature_strides):
+			face_scores_raw = detection[index]
+			keep_indices = numpy.where(face_scores_raw >= face_detector_score)[0]
 
-			for bounding_box_raw in distance_to_bounding_box(anchors, bounding_boxes_raw)[keep_indices]:
-				bounding_boxes.append(numpy.array(
-				[
-					bounding_box_raw[0] * ratio_width,
-					bounding_box_raw[1] * ratio_height,
-					bounding_box_raw[2] * ratio_width,
-					bounding_box_raw[3] * ratio_height
-				]))
+			if numpy.any(keep_indices):
+				stride_height = face_detector_height // feature_stride
+				stride_width = face_detector_width // feature_stride
+				anchors = create_static_anchors(feature_stride, anchor_total, stride_height, stride_width)
+				bounding_boxes_raw = detection[index + feature_map_channel] * feature_stride
+				face_landmarks_5_raw = detection[index + feature_map_channel * 2] * feature_stride
+
+				for bounding_box_raw in distance_to_bounding_box(anchors, bounding_boxes_raw)[keep_indices]:
+					bounding_boxes.append(numpy.array(
+					[
+						bounding_box_raw[0] * ratio_width,
+						bounding_box_raw[1] * ratio_height,
+						bounding_box_raw[2] * ratio_width,
+						bounding_box_raw[3] * ratio_height
+					]))
 
-			for face_score_raw in face_scores_raw[keep_indices]:
-				face_scores.append(face_score_raw[0])
+				for face_score_raw in face_scores_raw[keep_indices]:
+					face_scores.append(face_score_raw[0])
 
-			for face_landmark_raw_5 in distance_to_face_landmark_5(anchors, face_landmarks_5_raw)[keep_indices]:
-				face_landmarks_5.append(face_landmark_raw_5 * [ ratio_width, ratio_height ])
+				for face_landmark_raw_5 in distance_to_face_landmark_5(anchors, face_landmarks_5_raw)[keep_indices]:
+					face_landmarks_5.append(face_landmark_raw_5 * [ ratio_width, ratio_height ])
 
-	return bounding_boxes, face_scores, face_landmarks_5
+		face_detections.append((bounding_boxes, face_scores, face_landmarks_5))
 
+	return face_detections
 
-def detect_with_scrfd(vision_frame : VisionFrame, face_detector_size : str) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	bounding_boxes = []
-	face_scores = []
-	face_landmarks_5 = []
+
+def detect_with_scrfd(vision_frames : List[VisionFrame], face_detector_size : str) -> List[Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]]:
+	face_detections = []
 	feature_strides = [ 8, 16, 32 ]
 	feature_map_channel = 3
 	anchor_total = 2
 	face_detector_score = state_manager.get_item('face_detector_score')
 	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
-	temp_vision_frame = restrict_frame(vision_frame, (face_detector_width, face_detector_height))
-	ratio_height = vision_frame.shape[0] / temp_vision_frame.shape[0]
-	ratio_width = vision_frame.shape[1] / temp_vision_frame.shape[1]
-	detect_vision_frame = prepare_detect_frame(temp_vision_frame, face_detector_size)
-	detect_vision_frame = normalize_detect_frame(detect_vision_frame, [ -1, 1 ])
-	detection = forward_with_scrfd(detect_vision_frame)
+	detect_vision_frames, detect_ratios = prepare_detect_frames(vision_frames, face_detector_size)
+	detect_vision_frames = normalize_detect_frame(detect_vision_frames, [ -1, 1 ])
+	detections = forward_with_scrfd(detect_vision_frames)
+
+	for detection, (ratio_width, ratio_height) in zip(detections, detect_ratios):
+		bounding_boxes = []
+		face_scores = []
+		face_landmarks_5 = []
+
+		for index, feature_stride in enumerate(feature_strides):
+			face_scores_raw = detection[index]
+			keep_indices = numpy.where(face_scores_raw >= face_detector_score)[0]
+
+			if numpy.any(keep_indices):
+				stride_height = face_detector_height // feature_stride
+				stride_width = face_detector_width // feature_stride
+				anchors = create_static_anchors(feature_stride, anchor_total, stride_height, stride_width)
+				bounding_boxes_raw = detection[index + feature_map_channel] * feature_stride
+				face_landmarks_5_raw = detection[index + feature_map_channel * 2] * feature_stride
+
+				for bounding_box_raw in distance_to_bounding_box(anchors, bounding_boxes_raw)[keep_indices]:
+					bounding_boxes.append(numpy.array(
+					[
+						bounding_box_raw[0] * ratio_width,
+						bounding_box_raw[1] * ratio_height,
+						bounding_box_raw[2] * ratio_width,
+						bounding_box_raw[3] * ratio_height
+					]))
+
+				for face_score_raw in face_scores_raw[keep_indices]:
+					face_scores.append(face_score_raw[0])
+
+				for face_landmark_raw_5 in distance_to_face_landmark_5(anchors, face_landmarks_5_raw)[keep_indices]:
+					face_landmarks_5.append(face_landmark_raw_5 * [ ratio_width, ratio_height ])
 
-	for index, feature_stride in enumerate(feature_strides):
-		face_scores_raw = detection[index]
-		keep_indices = numpy.where(face_scores_raw >= face_detector_score)[0]
+		face_detections.append((bounding_boxes, face_scores, face_landmarks_5))
+
+	return face_detections
+
+
+def detect_with_yolo_face(vision_frames : List[VisionFrame], face_detector_size : str) -> List[Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]]:
+	face_detections = []
+	face_detector_score = state_manager.get_item('face_detector_score')
+	detect_vision_frames, detect_ratios = prepare_detect_frames(vision_frames, face_detector_size)
+	detect_vision_frames = normalize_detect_frame(detect_vision_frames, [ 0, 1 ])
+	detections = forward_with_yolo_face(detect_vision_frames)
+
+	for detection, (ratio_width, ratio_height) in zip(detections, detect_ratios):
+		bounding_boxes = []
+		face_scores = []
+		face_landmarks_5 = []
+		bounding_boxes_raw, face_scores_raw, face_landmarks_5_raw = numpy.split(numpy.squeeze(detection).T, [ 4, 5 ], axis = 1)
+		keep_indices = numpy.where(face_scores_raw > face_detector_score)[0]
 
 		if numpy.any(keep_indices):
-			stride_height = face_detector_height // feature_stride
-			stride_width = face_detector_width // feature_stride
-			anchors = create_static_anchors(feature_stride, anchor_total, stride_height, stride_width)
-			bounding_boxes_raw = detection[index + feature_map_channel] * feature_stride
-			face_landmarks_5_raw = detection[index + feature_map_channel * 2] * feature_stride
+			bounding_boxes_raw, face_scores_raw, face_landmarks_5_raw = bounding_boxes_raw[keep_indices], face_scores_raw[keep_indices], face_landmarks_5_raw[keep_indices]
 
-			for bounding_box_raw in distance_to_bounding_box(anchors, bounding_boxes_raw)[keep_indices]:
+			for bounding_box_raw in bounding_boxes_raw:
 				bounding_boxes.append(numpy.array(
 				[
-					bounding_box_raw[0] * ratio_width,
-					bounding_box_raw[1] * ratio_height,
-					bounding_box_raw[2] * ratio_width,
-					bounding_box_raw[3] * ratio_height
+					(bounding_box_raw[0] - bounding_box_raw[2] / 2) * ratio_width,
+					(bounding_box_raw[1] - bounding_box_raw[3] / 2) * ratio_height,
+					(bounding_box_raw[0] + bounding_box_raw[2] / 2) * ratio_width,
+					(bounding_box_raw[1] + bounding_box_raw[3] / 2) * ratio_height
 				]))
 
-			for face_score_raw in face_scores_raw[keep_indices]:
-				face_scores.append(face_score_raw[0])
+			face_scores = face_scores_raw.ravel().tolist()
+			face_landmarks_5_raw[:, 0::3] = (face_landmarks_5_raw[:, 0::3]) * ratio_width
+			face_landmarks_5_raw[:, 1::3] = (face_landmarks_5_raw[:, 1::3]) * ratio_height
 
-			for face_landmark_raw_5 in distance_to_face_landmark_5(anchors, face_landmarks_5_raw)[keep_indices]:
-				face_landmarks_5.append(face_landmark_raw_5 * [ ratio_width, ratio_height ])
+			for face_landmark_raw_5 in face_landmarks_5_raw:
+				face_landmarks_5.append(numpy.array(face_landmark_raw_5.reshape(-1, 3)[:, :2]))
 
-	return bounding_boxes, face_scores, face_landmarks_5
+		face_detections.append((bounding_boxes, face_scores, face_landmarks_5))
 
+	return face_detections
 
-def detect_with_yolo_face(vision_frame : VisionFrame, face_detector_size : str) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	bounding_boxes = []
-	face_scores = []
-	face_landmarks_5 = []
-	face_detector_score = state_manager.get_item('face_detector_score')
-	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
-	temp_vision_frame = restrict_frame(vision_frame, (face_detector_width, face_detector_height))
-	ratio_height = vision_frame.shape[0] / temp_vision_frame.shape[0]
-	ratio_width = vision_frame.shape[1] / temp_vision_frame.shape[1]
-	detect_vision_frame = prepare_detect_frame(temp_vision_frame, face_detector_size)
-	detect_vision_frame = normalize_detect_frame(detect_vision_frame, [ 0, 1 ])
-	detection = forward_with_yolo_face(detect_vision_frame)
-	detection = numpy.squeeze(detection).T
-	bounding_boxes_raw, face_scores_raw, face_landmarks_5_raw = numpy.split(detection, [ 4, 5 ], axis = 1)
-	keep_indices = numpy.where(face_scores_raw > face_detector_score)[0]
-
-	if numpy.any(keep_indices):
-		bounding_boxes_raw, face_scores_raw, face_landmarks_5_raw = bounding_boxes_raw[keep_indices], face_scores_raw[keep_indices], face_landmarks_5_raw[keep_indices]
-
-		for bounding_box_raw in bounding_boxes_raw:
-			bounding_boxes.append(numpy.array(
-			[
-				(bounding_box_raw[0] - bounding_box_raw[2] / 2) * ratio_width,
-				(bounding_box_raw[1] - bounding_box_raw[3] / 2) * ratio_height,
-				(bounding_box_raw[0] + bounding_box_raw[2] / 2) * ratio_width,
-				(bounding_box_raw[1] + bounding_box_raw[3] / 2) * ratio_height
-			]))
-
-		face_scores = face_scores_raw.ravel().tolist()
-		face_landmarks_5_raw[:, 0::3] = (face_landmarks_5_raw[:, 0::3]) * ratio_width
-		face_landmarks_5_raw[:, 1::3] = (face_landmarks_5_raw[:, 1::3]) * ratio_height
-
-		for face_landmark_raw_5 in face_landmarks_5_raw:
-			face_landmarks_5.append(numpy.array(face_landmark_raw_5.reshape(-1, 3)[:, :2]))
-
-	return bounding_boxes, face_scores, face_landmarks_5
-
-
-def detect_with_yunet(vision_frame : VisionFrame, face_detector_size : str) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	bounding_boxes = []
-	face_scores = []
-	face_landmarks_5 = []
+
+def detect_with_yunet(vision_frames : List[VisionFrame], face_detector_size : str) -> List[Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]]:
+	face_detections = []
 	feature_strides = [ 8, 16, 32 ]
 	feature_map_channel = 3
 	anchor_total = 1
 	face_detector_score = state_manager.get_item('face_detector_score')
 	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
-	temp_vision_frame = restrict_frame(vision_frame, (face_detector_width, face_detector_height))
-	ratio_height = vision_frame.shape[0] / temp_vision_frame.shape[0]
-	ratio_width = vision_frame.shape[1] / temp_vision_frame.shape[1]
-	detect_vision_frame = prepare_detect_frame(temp_vision_frame, face_detector_size)
-	detect_vision_frame = normalize_detect_frame(detect_vision_frame, [ 0, 255 ])
-	detection = forward_with_yunet(detect_vision_frame)
-
-	for index, feature_stride in enumerate(feature_strides):
-		face_scores_raw = (detection[index] * detection[index + feature_map_channel]).reshape(-1)
-		keep_indices = numpy.where(face_scores_raw >= face_detector_score)[0]
-
-		if numpy.any(keep_indices):
-			stride_height = face_detector_height // feature_stride
-			stride_width = face_detector_width // feature_stride
-			anchors = create_static_anchors(feature_stride, anchor_total, stride_height, stride_width)
-			bounding_boxes_center = detection[index + feature_map_channel * 2].squeeze(0)[:, :2] * feature_stride + anchors
-			bounding_boxes_size = numpy.exp(detection[index + feature_map_channel * 2].squeeze(0)[:, 2:4]) * feature_stride
-			face_landmarks_5_raw = detection[index + feature_map_channel * 3].squeeze(0)
-
-			bounding_boxes_raw = numpy.stack(
-			[
-				bounding_boxes_center[:, 0] - bounding_boxes_size[:, 0] / 2,
-				bounding_boxes_center[:, 1] - bounding_boxes_size[:, 1] / 2,
-				bounding_boxes_center[:, 0] + bounding_boxes_size[:, 0] / 2,
-				bounding_boxes_center[:, 1] + bounding_boxes_size[:, 1] / 2
-			], axis = -1)
-
-			for bounding_box_raw in bounding_boxes_raw[keep_indices]:
-				bounding_boxes.append(numpy.array(
+	detect_vision_frames, detect_ratios = prepare_detect_frames(vision_frames, face_detector_size)
+	detect_vision_frames = normalize_detect_frame(detect_vision_frames, [ 0, 255 ])
+	detections = forward_with_yunet(detect_vision_frames)
+
+	for detection, (ratio_width, ratio_height) in zip(detections, detect_ratios):
+		bounding_boxes = []
+		face_scores : List[Score] = []
+		face_landmarks_5 = []
+
+		for index, feature_stride in enumerate(feature_strides):
+			face_scores_raw = (detection[index] * detection[index + feature_map_channel]).reshape(-1)
+			keep_indices = numpy.where(face_scores_raw >= face_detector_score)[0]
+
+			if numpy.any(keep_indices):
+				stride_height = face_detector_height // feature_stride
+				stride_width = face_detector_width // feature_stride
+				anchors = create_static_anchors(feature_stride, anchor_total, stride_height, stride_width)
+				bounding_boxes_center = detection[index + feature_map_channel * 2][:, :2] * feature_stride + anchors
+				bounding_boxes_size = numpy.exp(detection[index + feature_map_channel * 2][:, 2:4]) * feature_stride
+				face_landmarks_5_raw = detection[index + feature_map_channel * 3]
+
+				bounding_boxes_raw = numpy.stack(
 				[
-					bounding_box_raw[0] * ratio_width,
-					bounding_box_raw[1] * ratio_height,
-					bounding_box_raw[2] * ratio_width,
-					bounding_box_raw[3] * ratio_height
-				]))
+					bounding_boxes_center[:, 0] - bounding_boxes_size[:, 0] / 2,
+					bounding_boxes_center[:, 1] - bounding_boxes_size[:, 1] / 2,
+					bounding_boxes_center[:, 0] + bounding_boxes_size[:, 0] / 2,
+					bounding_boxes_center[:, 1] + bounding_boxes_size[:, 1] / 2
+				], axis = -1)
+
+				for bounding_box_raw in bounding_boxes_raw[keep_indices]:
+					bounding_boxes.append(numpy.array(
+					[
+						bounding_box_raw[0] * ratio_width,
+						bounding_box_raw[1] * ratio_height,
+						bounding_box_raw[2] * ratio_width,
+						bounding_box_raw[3] * ratio_height
+					]))
+
+				face_scores.extend(face_scores_raw[keep_indices])
+				face_landmarks_5_raw = numpy.concatenate(
+				[
+					face_landmarks_5_raw[:, [ 0, 1 ]] * feature_stride + anchors,
+					face_landmarks_5_raw[:, [ 2, 3 ]] * feature_stride + anchors,
+					face_landmarks_5_raw[:, [ 4, 5 ]] * feature_stride + anchors,
+					face_landmarks_5_raw[:, [ 6, 7 ]] * feature_stride + anchors,
+					face_landmarks_5_raw[:, [ 8, 9 ]] * feature_stride + anchors
+				], axis = -1).reshape(-1, 5, 2)
 
-			face_scores.extend(face_scores_raw[keep_indices])
-			face_landmarks_5_raw = numpy.concatenate(
-			[
-				face_landmarks_5_raw[:, [ 0, 1 ]] * feature_stride + anchors,
-				face_landmarks_5_raw[:, [ 2, 3 ]] * feature_stride + anchors,
-				face_landmarks_5_raw[:, [ 4, 5 ]] * feature_stride + anchors,
-				face_landmarks_5_raw[:, [ 6, 7 ]] * feature_stride + anchors,
-				face_landmarks_5_raw[:, [ 8, 9 ]] * feature_stride + anchors
-			], axis = -1).reshape(-1, 5, 2)
+				for face_landmark_raw_5 in face_landmarks_5_raw[keep_indices]:
+					face_landmarks_5.append(face_landmark_raw_5 * [ ratio_width, ratio_height ])
 
-			for face_landmark_raw_5 in face_landmarks_5_raw[keep_indices]:
-				face_landmarks_5.append(face_landmark_raw_5 * [ ratio_width, ratio_height ])
+		face_detections.append((bounding_boxes, face_scores, face_landmarks_5))
 
-	return bounding_boxes, face_scores, face_landmarks_5
+	return face_detections
 
 
-def forward_with_retinaface(detect_vision_frame : VisionFrame) -> Detection:
+def forward_with_retinaface(detect_vision_frames : VisionFrame) -> List[List[Detection]]:
 	face_detector = get_inference_pool().get('retinaface')
+	detections = forward_detections(face_detector, detect_vision_frames)
+	return detections
 
-	with thread_semaphore():
-		detection = face_detector.run(None,
-		{
-			'input': detect_vision_frame
-		})
 
-	return detection
+def forward_with_scrfd(detect_vision_frames : VisionFrame) -> List[List[Detection]]:
+	face_detector = get_inference_pool().get('scrfd')
+	detections = forward_detections(face_detector, detect_vision_frames)
+	return detections
 
 
-def forward_with_scrfd(detect_vision_frame : VisionFrame) -> Detection:
-	face_detector = get_inference_pool().get('scrfd')
+def forward_with_yolo_face(detect_vision_frames : VisionFrame) -> List[List[Detection]]:
+	face_detector = get_inference_pool().get('yolo_face')
+	detections = forward_detections(face_detector, detect_vision_frames)
+	return detections
 
-	with thread_semaphore():
-		detection = face_detector.run(None,
-		{
-			'input': detect_vision_frame
-		})
 
-	return detection
+def forward_with_yunet(detect_vision_frames : VisionFrame) -> List[List[Detection]]:
+	face_detector = get_inference_pool().get('yunet')
+	detections = forward_detections(face_detector, detect_vision_frames)
+	return detections
+
 
+def forward_detections(face_detector : InferenceSession, detect_vision_frames : VisionFrame) -> List[List[Detection]]:
+	detections = []
+	batch_size = inference_manager.resolve_batch_size(face_detector, len(detect_vision_frames))
 
-def forward_with_yolo_face(detect_vision_frame : VisionFrame) -> Detection:
-	face_detector = get_inference_pool().get('yolo_face')
+	for batch_index in range(0, len(detect_vision_frames), batch_size):
+		batch_vision_frames = detect_vision_frames[batch_index:batch_index + batch_size]
 
-	with thread_semaphore():
-		detection = face_detector.run(None,
+		detection = inference_manager.run_inference(face_detector,
 		{
-			'input': detect_vision_frame
+			'input': batch_vision_frames
 		})
 
-	return detection
+		for frame_index in range(len(batch_vision_frames)):
+			detections.append([ detection_output.reshape(len(batch_vision_frames), -1, detection_output.shape[-1])[frame_index] for detection_output in detection ])
 
+	return detections
 
-def forward_with_yunet(detect_vision_frame : VisionFrame) -> Detection:
-	face_detector = get_inference_pool().get('yunet')
 
-	with thread_semaphore():
-		detection = face_detector.run(None,
-		{
-			'input': detect_vision_frame
-		})
+def prepare_detect_frames(vision_frames : List[VisionFrame], face_detector_size : str) -> Tuple[VisionFrame, List[Tuple[float, float]]]:
+	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
+	detect_vision_frames = []
+	detect_ratios = []
+
+	for vision_frame in vision_frames:
+		temp_vision_frame = restrict_frame(vision_frame, (face_detector_width, face_detector_height))
+		detect_vision_frames.append(prepare_detect_frame(temp_vision_frame, face_detector_size))
+		detect_ratios.append((vision_frame.shape[1] / temp_vision_frame.shape[1], vision_frame.shape[0] / temp_vision_frame.shape[0]))
 
-	return detection
+	return numpy.concatenate(detect_vision_frames), detect_ratios
 
 
 def prepare_detect_frame(temp_vision_frame : VisionFrame, face_detector_size : str) -> VisionFrame:
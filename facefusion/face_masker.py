@@ -8,7 +8,6 @@ import facefusion.choices
 from facefusion import inference_manager, state_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.filesystem import resolve_relative_path
-from facefusion.thread_helper import conditional_thread_semaphore
 from facefusion.types import DownloadScope, DownloadSet, FaceLandmark68, FaceMaskArea, FaceMaskRegion, InferencePool, Mask, ModelSet, Padding, VisionFrame
 
 
@@ -257,11 +256,10 @@ def create_region_mask(crop_vision_frame : VisionFrame, face_mask_regions : List
 def forward_occlude_face(prepare_vision_frame : VisionFrame, model_name : str) -> Mask:
 	face_occluder = get_inference_pool().get(model_name)
 
-	with conditional_thread_semaphore():
-		occlusion_mask : Mask = face_occluder.run(None,
-		{
-			'input': prepare_vision_frame
-		})[0][0]
+	occlusion_mask : Mask = inference_manager.run_inference(face_occluder,
+	{
+		'input': prepare_vision_frame
+	})[0][0]
 
 	return occlusion_mask
 
@@ -270,10 +268,9 @@ def forward_parse_face(prepare_vision_frame : VisionFrame) -> Mask:
 	model_name = state_manager.get_item('face_parser_model')
 	face_parser = get_inference_pool().get(model_name)
 
-	with conditional_thread_semaphore():
-		region_mask : Mask = face_parser.run(None,
-		{
-			'input': prepare_vision_frame
-		})[0][0]
+	region_mask : Mask = inference_manager.run_inference(face_parser,
+	{
+		'input': prepare_vision_frame
+	})[0][0]
 
 	return region_mask
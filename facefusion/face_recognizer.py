@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import Tuple
+from typing import List, Tuple
 
 import numpy
 
@@ -7,7 +7,6 @@ from facefusion import inference_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_helper import warp_face_by_face_landmark_5
 from facefusion.filesystem import resolve_relative_path
-from facefusion.thread_helper import conditional_thread_semaphore
 from facefusion.types import DownloadScope, Embedding, FaceLandmark5, InferencePool, ModelOptions, ModelSet, VisionFrame
 
 
@@ -68,26 +67,24 @@ def pre_check() -> bool:
 	return conditional_download_hashes(model_hash_set) and conditional_download_sources(model_source_set)
 
 
-def calculate_face_embedding(temp_vision_frame : VisionFrame, face_landmark_5 : FaceLandmark5) -> Tuple[Embedding, Embedding]:
+def calculate_face_embeddings(temp_vision_frame : VisionFrame, face_landmarks_5 : List[FaceLandmark5]) -> Tuple[List[Embedding], List[Embedding]]:
 	model_template = get_model_options().get('template')
 	model_size = get_model_options().get('size')
-	crop_vision_frame, matrix = warp_face_by_face_landmark_5(temp_vision_frame, face_landmark_5, model_template, model_size)
-	crop_vision_frame = crop_vision_frame / 127.5 - 1
-	crop_vision_frame = crop_vision_frame[:, :, ::-1].transpose(2, 0, 1).astype(numpy.float32)
-	crop_vision_frame = numpy.expand_dims(crop_vision_frame, axis = 0)
-	face_embedding = forward(crop_vision_frame)
-	face_embedding = face_embedding.ravel()
-	face_embedding_norm = face_embedding / numpy.linalg.norm(face_embedding)
-	return face_embedding, face_embedding_norm
+	crop_vision_frames = numpy.stack([ warp_face_by_face_landmark_5(temp_vision_frame, face_landmark_5, model_template, model_size)[0] for face_landmark_5 in face_landmarks_5 ])
+	crop_vision_frames = crop_vision_frames / 127.5 - 1
+	crop_vision_frames = crop_vision_frames[:, :, :, ::-1].transpose(0, 3, 1, 2).astype(numpy.float32)
+	face_embeddings = forward(crop_vision_frames)
+	face_embeddings = face_embeddings.reshape(len(face_landmarks_5), -1)
+	face_embeddings_norm = face_embeddings / numpy.linalg.norm(face_embeddings, axis = 1, keepdims = True)
+	return list(face_embeddings), list(face_embeddings_norm)
 
 
-def forward(crop_vision_frame : VisionFrame) -> Embedding:
+def forward(crop_vision_frames : VisionFrame) -> Embedding:
 	face_recognizer = get_inference_pool().get('face_recognizer')
 
-	with conditional_thread_semaphore():
-		face_embedding = face_recognizer.run(None,
-		{
-			'input': crop_vision_frame
-		})[0]
+	face_embeddings = inference_manager.run_inference_batches(face_recognizer,
+	{
+		'input': crop_vision_frames
+	}, len(crop_vision_frames))[0]
 
-	return face_embedding
+	return face_embeddings
@@ -1,41 +1,127 @@
 import threading
+import weakref
+from collections import OrderedDict
 from typing import List, Optional
 
+import numpy
+
+from facefusion import state_manager
 from facefusion.hash_helper import create_hash
-from facefusion.types import Face, FaceStore, VisionFrame
-from facefusion.vision import is_vision_frame
+from facefusion.types import Face, FaceStore, FaceStoreStatistics, VisionFrame, VisionKey, VisionKeySet
+
+FACE_STORE : FaceStore = OrderedDict()
+FACE_STORE_LOCK : threading.Lock = threading.Lock()
+FACE_STORE_STATISTICS : FaceStoreStatistics =\
+{
+	'hits': 0,
+	'misses': 0,
+	'evictions': 0,
+	'size': 0
+}
+VISION_KEY_SET : VisionKeySet = {}
+
+
+def register_vision_key(vision_frame : VisionFrame, vision_key : VisionKey) -> None:
+	if id(vision_frame) not in VISION_KEY_SET:
+		weakref.finalize(vision_frame, VISION_KEY_SET.pop, id(vision_frame), None)
+
+	VISION_KEY_SET[id(vision_frame)] = vision_key
+
+
+def get_vision_key(vision_frame : VisionFrame) -> Optional[VisionKey]:
+	return VISION_KEY_SET.get(id(vision_frame))
 
-FACE_STORE : FaceStore = {}
 
+def create_vision_key(vision_frame : VisionFrame) -> VisionKey:
+	vision_key = get_vision_key(vision_frame)
 
-def get_faces(vision_frame : VisionFrame) -> Optional[List[Face]]:
-	if is_vision_frame(vision_frame):
-		vision_hash = create_hash(vision_frame.tobytes())
+	if vision_key:
+		return vision_key
+	return create_hash(vision_frame.tobytes())
 
-		if FACE_STORE.get(vision_hash):
-			return FACE_STORE.get(vision_hash).get('faces')
 
+def has_faces(vision_key : VisionKey) -> bool:
+	with FACE_STORE_LOCK:
+		return 'faces' in FACE_STORE.get(vision_key, {})
+
+
+def get_faces(vision_key : VisionKey) -> Optional[List[Face]]:
+	with FACE_STORE_LOCK:
+		face_set = FACE_STORE.get(vision_key)
+
+		if face_set and 'faces' in face_set:
+			FACE_STORE.move_to_end(vision_key)
+			FACE_STORE_STATISTICS['hits'] += 1
+			return face_set.get('faces')
+
+		FACE_STORE_STATISTICS['misses'] += 1
 	return None
 
 
-def set_faces(vision_frame : VisionFrame, faces : List[Face]) -> None:
-	if is_vision_frame(vision_frame):
-		vision_hash = create_hash(vision_frame.tobytes())
-		FACE_STORE.setdefault(vision_hash,
+def set_faces(vision_key : VisionKey, faces : List[Face]) -> None:
+	faces_size = calculate_faces_size(faces)
+
+	with FACE_STORE_LOCK:
+		face_set = FACE_STORE.setdefault(vision_key,
 		{
 			'lock': threading.Lock()
-		})['faces'] = faces
+		})
+		FACE_STORE_STATISTICS['size'] += faces_size - face_set.get('size', 0)
+		face_set['faces'] = faces
+		face_set['size'] = faces_size
+		FACE_STORE.move_to_end(vision_key)
+		reduce_faces()
+
 
+def reduce_faces() -> None:
+	face_store_memory_limit = state_manager.get_item('face_store_memory_limit')
 
-def resolve_lock(vision_frame : VisionFrame) -> threading.Lock:
-	if is_vision_frame(vision_frame):
-		vision_hash = create_hash(vision_frame.tobytes())
-		return FACE_STORE.setdefault(vision_hash,
+	if face_store_memory_limit:
+		memory_limit = face_store_memory_limit * 1024 * 1024
+
+		for vision_key in list(FACE_STORE.keys())[:-1]:
+			if FACE_STORE_STATISTICS.get('size') <= memory_limit:
+				break
+
+			if 'faces' in FACE_STORE.get(vision_key):
+				FACE_STORE_STATISTICS['size'] -= FACE_STORE.pop(vision_key).get('size')
+				FACE_STORE_STATISTICS['evictions'] += 1
+
+
+def calculate_faces_size(faces : List[Face]) -> int:
+	faces_size = 0
+
+	for face in faces:
+		for value in face:
+			if isinstance(value, dict):
+				faces_size += sum(numpy.asarray(dict_value).nbytes for dict_value in value.values())
+			else:
+				faces_size += numpy.asarray(value).nbytes
+
+	return faces_size
+
+
+def resolve_lock(vision_key : VisionKey) -> threading.Lock:
+	with FACE_STORE_LOCK:
+		return FACE_STORE.setdefault(vision_key,
 		{
 			'lock': threading.Lock()
 		}).get('lock')
-	return threading.Lock()
+
+
+def get_statistics() -> FaceStoreStatistics:
+	with FACE_STORE_LOCK:
+		return FACE_STORE_STATISTICS.copy()
 
 
 def clear_faces() -> None:
-	FACE_STORE.clear()
+	with FACE_STORE_LOCK:
+		FACE_STORE.clear()
+
+		FACE_STORE_STATISTICS.update(
+		{
+			'hits': 0,
+			'misses': 0,
+			'evictions': 0,
+			'size': 0
+		})
@@ -9,7 +9,7 @@ from tqdm import tqdm
 import facefusion.choices
 from facefusion import ffmpeg_builder, ffprobe, logger, process_manager, state_manager, translator, vision
 from facefusion.filesystem import get_file_format, remove_file
-from facefusion.temp_helper import get_temp_file_path, get_temp_frame_pattern
+from facefusion.temp_helper import get_temp_file_path, get_temp_frame_chunk_path, get_temp_frame_pattern
 from facefusion.types import AudioBuffer, AudioEncoder, Command, EncoderSet, Fps, Resolution, UpdateProgress, VideoEncoder, VideoFormat, VideoReaderMetadata
 
 
@@ -69,12 +69,14 @@ def open_ffmpeg(commands : List[Command]) -> subprocess.Popen[bytes]:
 	return subprocess.Popen(commands, stdin = subprocess.PIPE, stderr = subprocess.DEVNULL, stdout = subprocess.PIPE)
 
 
-def create_video_reader(video_path : str, frame_number : int, video_metadata : VideoReaderMetadata) -> subprocess.Popen[bytes]:
+def create_video_reader(video_path : str, frame_number : int, video_metadata : VideoReaderMetadata, thread_count : int) -> subprocess.Popen[bytes]:
 	commands = ffmpeg_builder.chain(
+		ffmpeg_builder.set_thread_count(thread_count),
 		ffmpeg_builder.seek_to(frame_number / video_metadata.get('fps')),
 		ffmpeg_builder.set_input(video_path),
 		ffmpeg_builder.restrict_color_transfer(video_metadata.get('color_transfer')),
 		ffmpeg_builder.prevent_frame_drop(),
+		ffmpeg_builder.set_media_resolution(vision.pack_resolution(video_metadata.get('resolution'))),
 		ffmpeg_builder.enforce_pixel_format('bgr24'),
 		ffmpeg_builder.set_output_format('rawvideo'),
 		ffmpeg_builder.cast_stream()
@@ -83,11 +85,10 @@ def create_video_reader(video_path : str, frame_number : int, video_metadata : V
 	return open_ffmpeg(commands)
 
 
-def create_video_writer(target_path : str, temp_video_fps : Fps, temp_video_resolution : Resolution, output_video_resolution : Resolution, output_video_fps : Fps) -> subprocess.Popen[bytes]:
+def create_video_writer(temp_video_path : str, temp_video_fps : Fps, temp_video_resolution : Resolution, output_video_resolution : Resolution, output_video_fps : Fps) -> subprocess.Popen[bytes]:
 	output_video_encoder = state_manager.get_item('output_video_encoder')
 	output_video_quality = state_manager.get_item('output_video_quality')
 	output_video_preset = state_manager.get_item('output_video_preset')
-	temp_video_path = get_temp_file_path(target_path)
 	temp_video_format = cast(VideoFormat, get_file_format(temp_video_path))
 	output_video_encoder = fix_video_encoder(temp_video_format, output_video_encoder)
 
@@ -155,19 +156,29 @@ def extract_frames(target_path : str, temp_video_resolution : Resolution, temp_v
 	color_transfer = ffprobe.extract_static_video_metadata(target_path).get('color_transfer')
 	extract_frame_total = vision.predict_video_frame_total(target_path, temp_video_fps, trim_frame_start, trim_frame_end)
 	temp_frame_pattern = get_temp_frame_pattern(target_path, '%08d')
+	temp_frame_output = ffmpeg_builder.chain(
+		ffmpeg_builder.set_frame_quality(0),
+		ffmpeg_builder.enforce_pixel_format('rgb24'),
+		ffmpeg_builder.set_start_number(trim_frame_start),
+		ffmpeg_builder.set_output(temp_frame_pattern)
+	)
+
+	if state_manager.get_item('temp_frame_format') == 'raw':
+		temp_frame_output = ffmpeg_builder.chain(
+			ffmpeg_builder.enforce_pixel_format(state_manager.get_item('temp_pixel_format')),
+			ffmpeg_builder.set_output_format('rawvideo'),
+			ffmpeg_builder.force_output(get_temp_frame_chunk_path(target_path))
+		)
 
 	commands = ffmpeg_builder.chain(
 		ffmpeg_builder.set_input(target_path),
 		ffmpeg_builder.set_media_resolution(vision.pack_resolution(temp_video_resolution)),
-		ffmpeg_builder.set_frame_quality(0),
-		ffmpeg_builder.enforce_pixel_format('rgb24'),
 		ffmpeg_builder.concat(
 			ffmpeg_builder.select_frame_range(trim_frame_start, trim_frame_end, temp_video_fps),
 			ffmpeg_builder.restrict_color_transfer(color_transfer)
 		),
 		ffmpeg_builder.prevent_frame_drop(),
-		ffmpeg_builder.set_start_number(trim_frame_start),
-		ffmpeg_builder.set_output(temp_frame_pattern)
+		temp_frame_output
 	)
 
 	with tqdm(total = extract_frame_total, desc = translator.get('extracting'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
@@ -273,7 +284,7 @@ def replace_audio(target_path : str, audio_path : str, output_path : str) -> boo
 	return run_ffmpeg(commands).returncode == 0
 
 
-def merge_video(target_path : str, temp_video_fps : Fps, output_video_resolution : Resolution, output_video_fps : Fps, trim_frame_start : int, trim_frame_end : int) -> bool:
+def merge_video(target_path : str, temp_video_fps : Fps, temp_video_resolution : Resolution, output_video_resolution : Resolution, output_video_fps : Fps, trim_frame_start : int, trim_frame_end : int) -> bool:
 	output_video_encoder = state_manager.get_item('output_video_encoder')
 	output_video_quality = state_manager.get_item('output_video_quality')
 	output_video_preset = state_manager.get_item('output_video_preset')
@@ -283,10 +294,23 @@ def merge_video(target_path : str, temp_video_fps : Fps, output_video_resolution
 	temp_frame_pattern = get_temp_frame_pattern(target_path, '%08d')
 	output_video_encoder = fix_video_encoder(temp_video_format, output_video_encoder)
 
-	commands = ffmpeg_builder.chain(
+	temp_frame_input = ffmpeg_builder.chain(
 		ffmpeg_builder.set_input_fps(temp_video_fps),
 		ffmpeg_builder.set_start_number(trim_frame_start),
-		ffmpeg_builder.set_input(temp_frame_pattern),
+		ffmpeg_builder.set_input(temp_frame_pattern)
+	)
+
+	if state_manager.get_item('temp_frame_format') == 'raw':
+		temp_frame_input = ffmpeg_builder.chain(
+			ffmpeg_builder.set_output_format('rawvideo'),
+			ffmpeg_builder.enforce_pixel_format(state_manager.get_item('temp_pixel_format')),
+			ffmpeg_builder.set_media_resolution(vision.pack_resolution(temp_video_resolution)),
+			ffmpeg_builder.set_input_fps(temp_video_fps),
+			ffmpeg_builder.set_input(get_temp_frame_chunk_path(target_path))
+		)
+
+	commands = ffmpeg_builder.chain(
+		temp_frame_input,
 		ffmpeg_builder.set_media_resolution(vision.pack_resolution(output_video_resolution)),
 		ffmpeg_builder.set_video_encoder(output_video_encoder),
 		ffmpeg_builder.set_video_tag(output_video_encoder, temp_video_format),
@@ -1,3 +1,4 @@
+import bisect
 import subprocess
 from functools import lru_cache
 from typing import Dict, List
@@ -51,6 +52,24 @@ def probe_video_entries(video_path : str, entries : List[str]) -> Dict[str, str]
 	return parse_entries(output)
 
 
+def probe_video_packets(video_path : str, entries : List[str]) -> List[List[str]]:
+	commands = ffprobe_builder.chain(
+		ffprobe_builder.select_stream('v:0'),
+		ffprobe_builder.show_packet_entries(entries),
+		ffprobe_builder.format_to_csv(),
+		ffprobe_builder.set_input(video_path)
+	)
+	video_packets = []
+
+	output, _ = run_ffprobe(commands).communicate()
+
+	if output:
+		for line in output.decode().strip().splitlines():
+			video_packets.append(line.split(','))
+
+	return video_packets
+
+
 def probe_format_entries(media_path : str, entries : List[str]) -> Dict[str, str]:
 	commands = ffprobe_builder.chain(
 		ffprobe_builder.show_format_entries(entries),
@@ -120,6 +139,26 @@ def extract_video_metadata(video_path : str) -> VideoMetadata:
 	return video_metadata
 
 
+@lru_cache(maxsize = 128)
+def extract_static_video_keyframes(video_path : str) -> List[int]:
+	return extract_video_keyframes(video_path)
+
+
+def extract_video_keyframes(video_path : str) -> List[int]:
+	frame_times = []
+	keyframe_times = []
+
+	for pts_time, flags in probe_video_packets(video_path, [ 'pts_time', 'flags' ]):
+		if not pts_time == 'N/A':
+			frame_times.append(float(pts_time))
+
+			if 'K' in flags:
+				keyframe_times.append(float(pts_time))
+
+	frame_times.sort()
+	return sorted(bisect.bisect_left(frame_times, keyframe_time) for keyframe_time in keyframe_times)
+
+
 def extract_video_fps(frame_rate : str) -> Fps:
 	if frame_rate and '/' in frame_rate:
 		numerator, denominator = frame_rate.split('/')
@@ -25,9 +25,17 @@ def show_format_entries(entries : List[str]) -> List[Command]:
 	return [ '-show_entries', 'format=' + ','.join(entries) ]
 
 
+def show_packet_entries(entries : List[str]) -> List[Command]:
+	return [ '-show_entries', 'packet=' + ','.join(entries) ]
+
+
 def format_to_key_value() -> List[Command]:
 	return [ '-of', 'default=noprint_wrappers=1' ]
 
 
+def format_to_csv() -> List[Command]:
+	return [ '-of', 'csv=print_section=0' ]
+
+
 def set_input(input_path : str) -> List[Command]:
 	return [ '-i', input_path ]
@@ -0,0 +1,110 @@
+import threading
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+import numpy
+
+from facefusion.types import FrameBuffer, FrameBufferSet, FramePoolSet, FrameShape, VisionFrame
+
+FRAME_POOL_SET : FramePoolSet = {}
+FRAME_BUFFER_SET : FrameBufferSet = {}
+FRAME_POOL_LOCK : threading.Lock = threading.Lock()
+
+
+def acquire_frame(pool_name : str, frame_shape : FrameShape, is_shared : bool = False) -> VisionFrame:
+	frame_pool_id = pool_name + '_' + 'x'.join(map(str, frame_shape)) + '_' + str(is_shared)
+
+	with FRAME_POOL_LOCK:
+		frame_buffers = FRAME_POOL_SET.setdefault(frame_pool_id, [])
+
+		for frame_buffer in frame_buffers:
+			if frame_buffer.get('reference_total') == 0:
+				frame_buffer['reference_total'] = 1
+				return frame_buffer.get('vision_frame')
+
+		frame_buffer = create_frame_buffer(frame_shape, is_shared)
+		frame_buffer['reference_total'] = 1
+		frame_buffers.append(frame_buffer)
+		FRAME_BUFFER_SET[get_frame_address(frame_buffer.get('vision_frame'))] = frame_buffer
+		return frame_buffer.get('vision_frame')
+
+
+def retain_frame(vision_frame : VisionFrame) -> None:
+	with FRAME_POOL_LOCK:
+		frame_buffer = find_frame_buffer(vision_frame)
+
+		if frame_buffer:
+			frame_buffer['reference_total'] += 1
+
+
+def release_frame(vision_frame : VisionFrame) -> None:
+	with FRAME_POOL_LOCK:
+		frame_buffer = find_frame_buffer(vision_frame)
+
+		if frame_buffer:
+			frame_buffer['reference_total'] = max(frame_buffer.get('reference_total') - 1, 0)
+
+
+def find_frame_buffer(vision_frame : VisionFrame) -> Optional[FrameBuffer]:
+	return FRAME_BUFFER_SET.get(get_frame_address(vision_frame))
+
+
+def get_frame_address(vision_frame : VisionFrame) -> int:
+	while isinstance(vision_frame.base, numpy.ndarray):
+		vision_frame = vision_frame.base
+
+	return vision_frame.__array_interface__.get('data')[0]
+
+
+def create_frame_buffer(frame_shape : FrameShape, is_shared : bool) -> FrameBuffer:
+	if is_shared:
+		shared_memory = SharedMemory(create = True, size = int(numpy.prod(frame_shape)))
+		return\
+		{
+			'vision_frame': numpy.ndarray(frame_shape, dtype = numpy.uint8, buffer = shared_memory.buf),
+			'shared_memory': shared_memory,
+			'reference_total': 0
+		}
+
+	return\
+	{
+		'vision_frame': numpy.empty(frame_shape, dtype = numpy.uint8),
+		'shared_memory': None,
+		'reference_total': 0
+	}
+
+
+def attach_frame_buffer(shared_memory_name : str, frame_shape : FrameShape) -> FrameBuffer:
+	shared_memory = SharedMemory(name = shared_memory_name)
+	return\
+	{
+		'vision_frame': numpy.ndarray(frame_shape, dtype = numpy.uint8, buffer = shared_memory.buf),
+		'shared_memory': shared_memory,
+		'reference_total': 1
+	}
+
+
+def detach_frame_buffer(frame_buffer : FrameBuffer) -> None:
+	if frame_buffer.get('shared_memory'):
+		frame_buffer.get('shared_memory').close()
+
+
+def get_shared_memory_name(vision_frame : VisionFrame) -> Optional[str]:
+	with FRAME_POOL_LOCK:
+		frame_buffer = find_frame_buffer(vision_frame)
+
+		if frame_buffer and frame_buffer.get('shared_memory'):
+			return frame_buffer.get('shared_memory').name
+	return None
+
+
+def clear_frame_pool() -> None:
+	with FRAME_POOL_LOCK:
+		for frame_buffers in FRAME_POOL_SET.values():
+			for frame_buffer in frame_buffers:
+				if frame_buffer.get('shared_memory'):
+					frame_buffer.get('shared_memory').close()
+					frame_buffer.get('shared_memory').unlink()
+
+		FRAME_POOL_SET.clear()
+		FRAME_BUFFER_SET.clear()
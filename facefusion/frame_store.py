@@ -1,3 +1,4 @@
+from facefusion import frame_pool
 from facefusion.types import FrameStoreSet, VisionFrame, VisionFrameSet
 
 FRAME_STORE_SET : FrameStoreSet = {}
@@ -12,6 +13,10 @@ def get_frame_store(id : str) -> VisionFrameSet:
 
 def set_frame(id : str, frame_number : int, vision_frame : VisionFrame) -> None:
 	frame_store = get_frame_store(id)
+
+	if frame_number in frame_store and frame_store.get(frame_number) is not vision_frame:
+		frame_pool.release_frame(frame_store.get(frame_number))
+
 	frame_store[frame_number] = vision_frame
 
 
@@ -27,9 +32,16 @@ def select_frame_set(id : str, frame_start : int, frame_end : int) -> VisionFram
 
 
 def reduce_frames(id : str, frame_min : int, frame_max : int) -> None:
-	FRAME_STORE_SET[id] = select_frame_set(id, frame_min, frame_max)
+	frame_store = get_frame_store(id)
+
+	for frame_number in list(frame_store):
+		if frame_number < frame_min or frame_number > frame_max:
+			frame_pool.release_frame(frame_store.pop(frame_number))
 
 
 def clear_frames(id : str) -> None:
 	if id in FRAME_STORE_SET:
+		for vision_frame in FRAME_STORE_SET.get(id).values():
+			frame_pool.release_frame(vision_frame)
+
 		del FRAME_STORE_SET[id]
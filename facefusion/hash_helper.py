@@ -1,14 +1,33 @@
+import hashlib
 import os
 import zlib
+from functools import lru_cache
 from typing import Optional
 
-from facefusion.filesystem import get_file_name, is_file
+from facefusion.filesystem import get_file_name, get_file_size, is_file
 
 
 def create_hash(content : bytes) -> str:
 	return format(zlib.crc32(content), '08x')
 
 
+@lru_cache(maxsize = 64)
+def create_static_file_hash(file_path : str) -> str:
+	return create_file_hash(file_path)
+
+
+def create_file_hash(file_path : str) -> str:
+	file_size = get_file_size(file_path)
+	sample_size = 1024 * 1024
+
+	with open(file_path, 'rb') as file:
+		file_content = file.read(sample_size)
+		file.seek(max(file_size - sample_size, 0))
+		file_content += file.read(sample_size)
+
+	return hashlib.sha1(str(file_size).encode() + file_content).hexdigest()
+
+
 def validate_hash(validate_path : str) -> bool:
 	hash_path = get_hash_path(validate_path)
 
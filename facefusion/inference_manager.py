@@ -1,25 +1,40 @@
 import importlib
+import os
 import random
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from functools import lru_cache
 from time import sleep, time
-from typing import List
+from types import ModuleType
+from typing import ContextManager, Dict, List, Optional, Union
 
+import numpy
 from onnxruntime import InferenceSession
 
+import facefusion.choices
 from facefusion import logger, process_manager, state_manager, translator
 from facefusion.app_context import detect_app_context
 from facefusion.common_helper import is_windows
-from facefusion.execution import create_inference_providers, get_onnxruntime_version, has_execution_provider
+from facefusion.execution import create_inference_providers, create_inference_session_options, create_session_options, get_onnxruntime_version, has_execution_provider, resolve_cache_path
 from facefusion.exit_helper import fatal_exit
-from facefusion.filesystem import get_file_name, is_file
+from facefusion.filesystem import create_directory, get_file_name, is_directory, is_file, move_file, remove_file
+from facefusion.hash_helper import create_hash, create_static_file_hash
+from facefusion.thread_helper import NULL_CONTEXT
 from facefusion.time_helper import calculate_end_time
-from facefusion.types import DownloadSet, ExecutionProvider, InferencePool, InferencePoolSet, InferenceProvider
+from facefusion.types import DownloadSet, ExecutionProvider, InferenceBatch, InferenceBatchSet, InferenceInputs, InferenceLoadSet, InferenceOutputs, InferencePool, InferencePoolSet, InferenceProvider, InferenceRequest, InferenceSemaphoreSet, InferenceSessionOptions
 
 INFERENCE_POOL_SET : InferencePoolSet =\
 {
 	'cli': {},
 	'ui': {}
 }
+INFERENCE_BATCH_SET : InferenceBatchSet = {}
+INFERENCE_BATCH_LOCK : threading.Lock = threading.Lock()
+INFERENCE_POOL_LOCK_SET : Dict[str, threading.Lock] = {}
+INFERENCE_POOL_LOCK : threading.Lock = threading.Lock()
+INFERENCE_LOAD_SET : InferenceLoadSet = {}
+INFERENCE_LOAD_LOCK : threading.Lock = threading.Lock()
+INFERENCE_SEMAPHORE_SET : InferenceSemaphoreSet = {}
 
 
 def get_inference_pool(module_name : str, model_names : List[str], model_source_set : DownloadSet) -> InferencePool:
@@ -28,59 +43,166 @@ def get_inference_pool(module_name : str, model_names : List[str], model_source_
 
 	execution_device_ids = state_manager.get_item('execution_device_ids')
 	execution_providers = state_manager.get_item('execution_providers')
+	execution_replica_count = state_manager.get_item('execution_replica_count')
 	has_arena_leak = has_execution_provider('cuda') and get_onnxruntime_version() > (1, 24, 4)
 	app_context = detect_app_context()
+	inference_pools = []
 
 	for execution_device_id in execution_device_ids:
-		inference_context = get_inference_context(module_name, model_names, execution_device_id, execution_providers)
+		for execution_replica_index in range(execution_replica_count):
+			inference_context = get_inference_context(module_name, model_names, execution_device_id, execution_providers, execution_replica_index)
 
-		if not has_arena_leak:
-			if app_context == 'cli' and INFERENCE_POOL_SET.get('ui').get(inference_context):
-				INFERENCE_POOL_SET['cli'][inference_context] = INFERENCE_POOL_SET.get('ui').get(inference_context)
-			if app_context == 'ui' and INFERENCE_POOL_SET.get('cli').get(inference_context):
-				INFERENCE_POOL_SET['ui'][inference_context] = INFERENCE_POOL_SET.get('cli').get(inference_context)
+			with get_inference_pool_lock(inference_context):
+				if not has_arena_leak:
+					if app_context == 'cli' and INFERENCE_POOL_SET.get('ui').get(inference_context):
+						INFERENCE_POOL_SET['cli'][inference_context] = INFERENCE_POOL_SET.get('ui').get(inference_context)
+					if app_context == 'ui' and INFERENCE_POOL_SET.get('cli').get(inference_context):
+						INFERENCE_POOL_SET['ui'][inference_context] = INFERENCE_POOL_SET.get('cli').get(inference_context)
 
-		if not INFERENCE_POOL_SET.get(app_context).get(inference_context):
-			inference_providers = resolve_static_inference_providers(module_name, execution_device_id)
-			INFERENCE_POOL_SET[app_context][inference_context] = create_inference_pool(model_source_set, inference_providers)
+				if not INFERENCE_POOL_SET.get(app_context).get(inference_context):
+					inference_providers = resolve_static_inference_providers(module_name, execution_device_id)
+					inference_session_options = resolve_inference_session_options(module_name)
+					INFERENCE_POOL_SET[app_context][inference_context] = create_inference_pool(model_source_set, inference_providers, inference_session_options)
 
-	current_inference_context = get_inference_context(module_name, model_names, random.choice(execution_device_ids), execution_providers)
-	return INFERENCE_POOL_SET.get(app_context).get(current_inference_context)
+					for model_name, inference_session in INFERENCE_POOL_SET.get(app_context).get(inference_context).items():
+						register_inference_semaphore(inference_session, resolve_inference_limit(module_name, model_name, inference_providers))
 
+				inference_pools.append(INFERENCE_POOL_SET.get(app_context).get(inference_context))
 
-def create_inference_pool(model_source_set : DownloadSet, inference_providers : List[InferenceProvider]) -> InferencePool:
+	return select_inference_pool(inference_pools)
+
+
+def select_inference_pool(inference_pools : List[InferencePool]) -> InferencePool:
+	with INFERENCE_LOAD_LOCK:
+		inference_loads = [ count_inference_load(inference_pool) for inference_pool in inference_pools ]
+
+	least_inference_load = min(inference_loads)
+	return random.choice([ inference_pool for inference_pool, inference_load in zip(inference_pools, inference_loads) if inference_load == least_inference_load ])
+
+
+def count_inference_load(inference_pool : InferencePool) -> int:
+	return sum(INFERENCE_LOAD_SET.get(id(inference_session), 0) for inference_session in inference_pool.values())
+
+
+def create_inference_pool(model_source_set : DownloadSet, inference_providers : List[InferenceProvider], inference_session_options : InferenceSessionOptions) -> InferencePool:
 	inference_pool : InferencePool = {}
+	inference_session_futures : Dict[str, Future[InferenceSession]] = {}
+
+	with ThreadPoolExecutor(max_workers = max(len(model_source_set), 1)) as executor:
+		for model_name in model_source_set.keys():
+			model_path = model_source_set.get(model_name).get('path')
 
-	for model_name in model_source_set.keys():
-		model_path = model_source_set.get(model_name).get('path')
+			if is_file(model_path):
+				inference_session_futures[model_name] = executor.submit(create_inference_session, model_path, inference_providers, inference_session_options)
 
-		if is_file(model_path):
-			inference_pool[model_name] = create_inference_session(model_path, inference_providers)
+		for model_name, inference_session_future in inference_session_futures.items():
+			inference_pool[model_name] = inference_session_future.result()
 
 	return inference_pool
 
 
+def preload_inference_pools(modules : List[ModuleType]) -> bool:
+	start_time = time()
+	is_preloaded = True
+
+	with ThreadPoolExecutor(max_workers = max(len(modules), 1)) as executor:
+		preload_futures : Dict[Future[InferencePool], ModuleType] = {}
+
+		for module in modules:
+			preload_futures[executor.submit(module.get_inference_pool)] = module
+
+		for preload_future in as_completed(preload_futures):
+			if preload_future.exception():
+				logger.error(translator.get('preloading_models_failed').format(module_name = preload_futures.get(preload_future).__name__), __name__)
+				is_preloaded = False
+
+	if is_preloaded:
+		logger.debug(translator.get('preloading_models_succeeded').format(seconds = calculate_end_time(start_time)), __name__)
+	return is_preloaded
+
+
+def get_inference_pool_lock(inference_context : str) -> threading.Lock:
+	with INFERENCE_POOL_LOCK:
+		return INFERENCE_POOL_LOCK_SET.setdefault(inference_context, threading.Lock())
+
+
+def register_inference_semaphore(inference_session : InferenceSession, inference_limit : int) -> None:
+	if inference_limit:
+		INFERENCE_SEMAPHORE_SET[id(inference_session)] = threading.Semaphore(inference_limit)
+	elif id(inference_session) in INFERENCE_SEMAPHORE_SET:
+		del INFERENCE_SEMAPHORE_SET[id(inference_session)]
+
+
+def get_inference_semaphore(inference_session : InferenceSession) -> Union[threading.Semaphore, ContextManager[None]]:
+	return INFERENCE_SEMAPHORE_SET.get(id(inference_session)) or NULL_CONTEXT
+
+
+def resolve_inference_limit(module_name : str, model_name : str, inference_providers : List[InferenceProvider]) -> int:
+	module = importlib.import_module(module_name)
+	serial_execution_providers : List[ExecutionProvider] = [ 'directml', 'migraphx', 'rocm' ]
+	serial_provider_names = [ facefusion.choices.execution_provider_set.get(execution_provider) for execution_provider in serial_execution_providers ]
+	inference_limits = []
+
+	for inference_provider in inference_providers:
+		if get_inference_provider_name(inference_provider) in serial_provider_names:
+			inference_limits.append(1)
+
+	if hasattr(module, 'adjust_inference_limits'):
+		adjust_inference_limits = getattr(module, 'adjust_inference_limits')()
+
+		if adjust_inference_limits.get(model_name):
+			inference_limits.append(adjust_inference_limits.get(model_name))
+
+	if inference_limits:
+		return min(inference_limits)
+	return 0
+
+
 def clear_inference_pool(module_name : str, model_names : List[str]) -> None:
 	execution_device_ids = state_manager.get_item('execution_device_ids')
 	execution_providers = state_manager.get_item('execution_providers')
+	execution_replica_count = state_manager.get_item('execution_replica_count')
 	app_context = detect_app_context()
 
 	if is_windows() and has_execution_provider('directml'):
 		INFERENCE_POOL_SET[app_context].clear()
 
 	for execution_device_id in execution_device_ids:
-		inference_context = get_inference_context(module_name, model_names, execution_device_id, execution_providers)
+		for execution_replica_index in range(execution_replica_count):
+			inference_context = get_inference_context(module_name, model_names, execution_device_id, execution_providers, execution_replica_index)
 
-		if INFERENCE_POOL_SET.get(app_context).get(inference_context):
-			del INFERENCE_POOL_SET[app_context][inference_context]
+			if INFERENCE_POOL_SET.get(app_context).get(inference_context):
+				del INFERENCE_POOL_SET[app_context][inference_context]
 
 
-def create_inference_session(model_path : str, inference_providers : List[InferenceProvider]) -> InferenceSession:
+def create_inference_session(model_path : str, inference_providers : List[InferenceProvider], inference_session_options : InferenceSessionOptions) -> InferenceSession:
 	model_file_name = get_file_name(model_path)
+	optimized_model_path = resolve_optimized_model_path(model_path, inference_providers, inference_session_options)
 	start_time = time()
 
 	try:
-		inference_session = InferenceSession(model_path, providers = inference_providers)
+		if optimized_model_path and is_file(optimized_model_path):
+			inference_session = load_optimized_inference_session(optimized_model_path, inference_providers, inference_session_options)
+
+			if inference_session:
+				logger.debug(translator.get('loading_model_succeeded').format(model_name = model_file_name, seconds = calculate_end_time(start_time)), __name__)
+				return inference_session
+
+		session_options = create_session_options(inference_session_options)
+
+		if optimized_model_path:
+			temp_model_path = optimized_model_path + '.' + str(os.getpid()) + '.' + str(threading.get_ident()) + '.onnx'
+			session_options.optimized_model_filepath = temp_model_path
+
+			try:
+				inference_session = InferenceSession(model_path, sess_options = session_options, providers = inference_providers)
+				move_file(temp_model_path, optimized_model_path)
+			finally:
+				if is_file(temp_model_path):
+					remove_file(temp_model_path)
+		else:
+			inference_session = InferenceSession(model_path, sess_options = session_options, providers = inference_providers)
+
 		logger.debug(translator.get('loading_model_succeeded').format(model_name = model_file_name, seconds = calculate_end_time(start_time)), __name__)
 		return inference_session
 
@@ -89,8 +211,43 @@ def create_inference_session(model_path : str, inference_providers : List[Infere
 		fatal_exit(1)
 
 
-def get_inference_context(module_name : str, model_names : List[str], execution_device_id : int, execution_providers : List[ExecutionProvider]) -> str:
+def load_optimized_inference_session(optimized_model_path : str, inference_providers : List[InferenceProvider], inference_session_options : InferenceSessionOptions) -> Optional[InferenceSession]:
+	inference_session_options = inference_session_options.copy()
+	inference_session_options['graph_optimization'] = 'disable'
+
+	try:
+		return InferenceSession(optimized_model_path, sess_options = create_session_options(inference_session_options), providers = inference_providers)
+	except Exception:
+		remove_file(optimized_model_path)
+	return None
+
+
+def resolve_optimized_model_path(model_path : str, inference_providers : List[InferenceProvider], inference_session_options : InferenceSessionOptions) -> Optional[str]:
+	cache_path = resolve_cache_path()
+	optimized_execution_providers : List[ExecutionProvider] = [ 'cuda', 'rocm', 'cpu' ]
+	optimized_provider_names = [ facefusion.choices.execution_provider_set.get(execution_provider) for execution_provider in optimized_execution_providers ]
+
+	for inference_provider in inference_providers:
+		if get_inference_provider_name(inference_provider) not in optimized_provider_names:
+			return None
+
+	if inference_session_options.get('graph_optimization') != 'disable' and (is_directory(cache_path) or create_directory(cache_path)):
+		model_hash = create_hash((create_static_file_hash(model_path) + str(inference_providers) + str(inference_session_options.get('graph_optimization'))).encode())
+		return os.path.join(cache_path, get_file_name(model_path) + '.' + model_hash + '.onnx')
+	return None
+
+
+def get_inference_provider_name(inference_provider : InferenceProvider) -> str:
+	if isinstance(inference_provider, tuple):
+		return inference_provider[0]
+	return inference_provider
+
+
+def get_inference_context(module_name : str, model_names : List[str], execution_device_id : int, execution_providers : List[ExecutionProvider], execution_replica_index : int = 0) -> str:
 	inference_context = '.'.join([ module_name ] + model_names + [ str(execution_device_id) ] + list(execution_providers))
+
+	if execution_replica_index:
+		inference_context += '.' + str(execution_replica_index)
 	return inference_context
 
 
@@ -119,3 +276,139 @@ def resolve_static_inference_providers(module_name : str, execution_device_id :
 			return inference_providers
 
 	return create_inference_providers(execution_device_id, execution_providers)
+
+
+def resolve_inference_session_options(module_name : str) -> InferenceSessionOptions:
+	module = importlib.import_module(module_name)
+	inference_session_options = create_inference_session_options(state_manager.get_item('execution_thread_budget'), state_manager.get_item('execution_thread_count'), state_manager.get_item('execution_process_count'))
+
+	if hasattr(module, 'adjust_inference_session_options'):
+		adjust_inference_session_options = getattr(module, 'adjust_inference_session_options')()
+
+		if adjust_inference_session_options:
+			inference_session_options.update(adjust_inference_session_options)
+
+	return inference_session_options
+
+
+def has_dynamic_batch(inference_session : InferenceSession) -> bool:
+	for session_input in inference_session.get_inputs():
+		if not session_input.shape or isinstance(session_input.shape[0], int):
+			return False
+	return True
+
+
+def resolve_batch_size(inference_session : InferenceSession, batch_total : int) -> int:
+	if has_dynamic_batch(inference_session):
+		return max(batch_total, 1)
+
+	for session_input in inference_session.get_inputs():
+		if session_input.shape and isinstance(session_input.shape[0], int):
+			batch_total = min(batch_total, session_input.shape[0])
+
+	return max(batch_total, 1)
+
+
+def run_inference_batch(inference_session : InferenceSession, inference_inputs : InferenceInputs) -> InferenceOutputs:
+	batch_limit = state_manager.get_item('execution_thread_count')
+	batch_timeout = 0.01
+
+	if batch_limit > 1 and has_dynamic_batch(inference_session):
+		inference_request : InferenceRequest =\
+		{
+			'inputs': inference_inputs,
+			'outputs': None,
+			'error': None,
+			'event': threading.Event()
+		}
+
+		with INFERENCE_BATCH_LOCK:
+			inference_batch : InferenceBatch = INFERENCE_BATCH_SET.setdefault(id(inference_session),
+			{
+				'requests': [],
+				'event': threading.Event()
+			})
+			inference_batch.get('requests').append(inference_request)
+			is_batch_leader = len(inference_batch.get('requests')) == 1
+
+			if len(inference_batch.get('requests')) >= batch_limit:
+				inference_batch.get('event').set()
+
+		if is_batch_leader:
+			if INFERENCE_LOAD_SET.get(id(inference_session)):
+				inference_batch.get('event').wait(batch_timeout)
+
+			with INFERENCE_BATCH_LOCK:
+				if INFERENCE_BATCH_SET.get(id(inference_session)) is inference_batch:
+					del INFERENCE_BATCH_SET[id(inference_session)]
+
+			run_inference_requests(inference_session, inference_batch.get('requests'))
+		else:
+			inference_request.get('event').wait()
+
+		if inference_request.get('error'):
+			raise inference_request.get('error')
+		return inference_request.get('outputs')
+
+	return run_inference(inference_session, inference_inputs)
+
+
+def run_inference(inference_session : InferenceSession, inference_inputs : InferenceInputs) -> InferenceOutputs:
+	inference_session_id = id(inference_session)
+
+	with INFERENCE_LOAD_LOCK:
+		INFERENCE_LOAD_SET[inference_session_id] = INFERENCE_LOAD_SET.get(inference_session_id, 0) + 1
+
+	try:
+		with get_inference_semaphore(inference_session):
+			return inference_session.run(None, inference_inputs)
+	finally:
+		with INFERENCE_LOAD_LOCK:
+			INFERENCE_LOAD_SET[inference_session_id] -= 1
+
+			if not INFERENCE_LOAD_SET.get(inference_session_id):
+				del INFERENCE_LOAD_SET[inference_session_id]
+
+
+def run_inference_batches(inference_session : InferenceSession, inference_inputs : InferenceInputs, batch_size : int) -> InferenceOutputs:
+	input_total = len(next(iter(inference_inputs.values())))
+	batch_size = resolve_batch_size(inference_session, min(batch_size, input_total))
+	batch_outputs_list = []
+
+	for batch_index in range(0, input_total, batch_size):
+		batch_inputs = {}
+
+		for input_name, input_value in inference_inputs.items():
+			batch_inputs[input_name] = input_value[batch_index:batch_index + batch_size]
+
+		batch_outputs_list.append(run_inference(inference_session, batch_inputs))
+
+	return [ numpy.concatenate(batch_outputs) for batch_outputs in zip(*batch_outputs_list) ]
+
+
+def run_inference_requests(inference_session : InferenceSession, inference_requests : List[InferenceRequest]) -> None:
+	batch_inputs = {}
+
+	try:
+		batch_sizes = [ len(next(iter(inference_request.get('inputs').values()))) for inference_request in inference_requests ]
+		batch_indices = numpy.cumsum(batch_sizes)[:-1]
+
+		for input_name in inference_requests[0].get('inputs').keys():
+			batch_inputs[input_name] = numpy.concatenate([ inference_request.get('inputs').get(input_name) for inference_request in inference_requests ])
+
+		batch_outputs = run_inference(inference_session, batch_inputs)
+
+		for inference_request in inference_requests:
+			inference_request['outputs'] = []
+
+		for batch_output in batch_outputs:
+			for inference_request, request_output in zip(inference_requests, numpy.split(batch_output, batch_indices)):
+				inference_request.get('outputs').append(request_output)
+
+	except Exception as exception:
+		for inference_request in inference_requests:
+			inference_request['error'] = exception
+
+	finally:
+		for inference_request in inference_requests:
+			inference_request.get('event').set()
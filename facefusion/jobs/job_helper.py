@@ -16,5 +16,14 @@ def get_step_output_path(job_id : str, step_index : int, output_path : str) -> O
 	return None
 
 
+def get_step_segment_path(job_id : str, step_index : int, frame_start : int, frame_end : int, output_path : str) -> Optional[str]:
+	step_output_path = get_step_output_path(job_id, step_index, output_path)
+
+	if step_output_path:
+		step_output_file_path, step_output_file_extension = os.path.splitext(step_output_path)
+		return step_output_file_path + '-' + str(frame_start) + '-' + str(frame_end) + step_output_file_extension
+	return None
+
+
 def suggest_job_id(job_prefix : str = 'job') -> str:
 	return job_prefix + '-' + datetime.now().strftime('%Y-%m-%d-%H-%M-%S')
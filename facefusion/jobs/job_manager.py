@@ -8,7 +8,7 @@ from facefusion.jobs.job_helper import get_step_output_path
 from facefusion.json import read_json, write_json
 from facefusion.sanitizer import sanitize_job_id
 from facefusion.time_helper import get_current_date_time
-from facefusion.types import Args, Job, JobSet, JobStatus, JobStep, JobStepStatus
+from facefusion.types import Args, Job, JobSegment, JobSet, JobStatus, JobStep, JobStepStatus
 
 JOBS_PATH : Optional[str] = None
 
@@ -176,6 +176,23 @@ def get_steps(job_id : str) -> List[JobStep]:
 	return []
 
 
+def get_step_segments(job_id : str, step_index : int) -> List[JobSegment]:
+	steps = get_steps(job_id)
+
+	if has_step(job_id, step_index):
+		return steps[step_index].get('segments', [])
+	return []
+
+
+def add_step_segment(job_id : str, step_index : int, step_segment : JobSegment) -> bool:
+	job = read_job_file(job_id)
+
+	if job and has_step(job_id, step_index):
+		job.get('steps')[step_index].setdefault('segments', []).append(step_segment)
+		return update_job_file(job_id, job)
+	return False
+
+
 def count_step_total(job_id : str) -> int:
 	steps = get_steps(job_id)
 
@@ -1,5 +1,5 @@
 from facefusion.ffmpeg import concat_video
-from facefusion.filesystem import are_images, are_videos, move_file, remove_file
+from facefusion.filesystem import are_images, are_videos, is_file, move_file, remove_file
 from facefusion.jobs import job_helper, job_manager
 from facefusion.types import JobOutputSet, JobStep, ProcessStep
 
@@ -10,6 +10,7 @@ def run_job(job_id : str, process_step : ProcessStep) -> bool:
 	if job_id in queued_job_ids:
 		if run_steps(job_id, process_step) and finalize_steps(job_id):
 			clean_steps(job_id)
+			clean_segments(job_id)
 			return job_manager.move_job_file(job_id, 'completed')
 		clean_steps(job_id)
 		job_manager.move_job_file(job_id, 'failed')
@@ -99,6 +100,16 @@ def clean_steps(job_id: str) -> bool:
 	return True
 
 
+def clean_segments(job_id : str) -> bool:
+	steps = job_manager.get_steps(job_id)
+
+	for index, _ in enumerate(steps):
+		for step_segment in job_manager.get_step_segments(job_id, index):
+			if is_file(step_segment.get('path')) and not remove_file(step_segment.get('path')):
+				return False
+	return True
+
+
 def collect_output_set(job_id : str) -> JobOutputSet:
 	steps = job_manager.get_steps(job_id)
 	job_output_set : JobOutputSet = {}
@@ -26,6 +26,8 @@ LOCALES : Locales =\
 		'merging_video': 'merging video with a resolution of {resolution} and {fps} frames per second',
 		'merging_video_succeeded': 'merging video succeeded',
 		'merging_video_failed': 'merging video failed',
+		'concatenating_video_succeeded': 'concatenating video succeeded',
+		'concatenating_video_failed': 'concatenating video failed',
 		'skipping_audio': 'skipping audio',
 		'replacing_audio_succeeded': 'replacing audio succeeded',
 		'replacing_audio_skipped': 'replacing audio skipped',
@@ -36,6 +38,7 @@ LOCALES : Locales =\
 		'processing_image_succeeded': 'processing to image succeeded in {seconds} seconds',
 		'processing_image_failed': 'processing to image failed',
 		'processing_video_succeeded': 'processing to video succeeded in {seconds} seconds',
+		'face_store_statistics': 'face store served {hits} hits and {misses} misses with {evictions} evictions at {size} megabytes',
 		'processing_video_failed': 'processing to video failed',
 		'choose_image_source': 'choose an image for the source',
 		'choose_audio_source': 'choose an audio for the source',
@@ -84,6 +87,8 @@ LOCALES : Locales =\
 		'deleting_corrupt_source': 'deleting corrupt source for {source_file_name}',
 		'loading_model_succeeded': 'loading model {model_name} succeeded in {seconds} seconds',
 		'loading_model_failed': 'loading model {model_name} failed',
+		'preloading_models_succeeded': 'preloading models succeeded in {seconds} seconds',
+		'preloading_models_failed': 'preloading models for {module_name} failed',
 		'time_ago_now': 'just now',
 		'time_ago_minutes': '{minutes} minutes ago',
 		'time_ago_hours': '{hours} hours and {minutes} minutes ago',
@@ -98,6 +103,7 @@ LOCALES : Locales =\
 			'config_path': 'choose the config file to override defaults',
 			'temp_path': 'specify the directory for the temporary resources',
 			'jobs_path': 'specify the directory to store jobs',
+			'face_cache_path': 'specify the directory to cache the face analysis',
 			'source_paths': 'choose the image or audio paths',
 			'target_path': 'choose the image or video path',
 			'output_path': 'specify the image or video within a directory',
@@ -144,6 +150,8 @@ LOCALES : Locales =\
 			'output_video_quality': 'specify the video quality which translates to the video compression',
 			'output_video_scale': 'specify the video scale based on the target video',
 			'output_video_fps': 'specify the video fps based on the target video',
+			'output_video_segment_count': 'specify the amount of video segments to encode in parallel',
+			'output_video_segment_duration': 'specify the seconds per video segment to resume a job from (0 = disabled)',
 			'workflow_mode': 'detect or enforce the workflow mode',
 			'workflow_strategy': 'process the temporary frames in memory or on disk',
 			'processors': 'load a single or multiple processors (choices: {choices}, ...)',
@@ -160,7 +168,11 @@ LOCALES : Locales =\
 			'execution_device_ids': 'specify the devices used for processing',
 			'execution_providers': 'inference using different providers (choices: {choices}, ...)',
 			'execution_thread_count': 'specify the amount of parallel threads while processing',
+			'execution_process_count': 'specify the amount of parallel processes while processing',
+			'execution_thread_budget': 'specify the amount of cpu threads shared between workers and inference sessions (0 = onnxruntime default)',
+			'execution_replica_count': 'specify the amount of inference sessions per model and device',
 			'video_memory_strategy': 'balance fast processing and low VRAM usage',
+			'face_store_memory_limit': 'limit the memory in megabytes used to store analysed faces',
 			'log_level': 'adjust the message severity displayed in the terminal',
 			'halt_on_error': 'halt the program once an error occurred',
 			'run': 'run the program',
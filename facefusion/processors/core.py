@@ -43,3 +43,13 @@ def get_processors_modules(processors : List[str]) -> List[ModuleType]:
 		processor_module = load_processor_module(processor)
 		processor_modules.append(processor_module)
 	return processor_modules
+
+
+def get_inference_modules(processor_modules : List[ModuleType]) -> List[ModuleType]:
+	inference_modules = []
+
+	for processor_module in processor_modules:
+		for module in processor_module.get_common_modules() + [ processor_module ]:
+			if hasattr(module, 'get_inference_pool') and module not in inference_modules:
+				inference_modules.append(module)
+	return inference_modules
@@ -21,8 +21,7 @@ from facefusion.processors.modules.age_modifier import choices as age_modifier_c
 from facefusion.processors.modules.age_modifier.types import AgeModifierDirection, AgeModifierInputs
 from facefusion.processors.types import ProcessorOutputs
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import thread_semaphore
-from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
+from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, InferenceLimitSet, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import match_frame_color, read_static_image, read_static_video_frame
 
 
@@ -117,6 +116,13 @@ def clear_inference_pool() -> None:
 	inference_manager.clear_inference_pool(__name__, model_names)
 
 
+def adjust_inference_limits() -> InferenceLimitSet:
+	return\
+	{
+		'age_modifier': 1
+	}
+
+
 def get_model_options() -> ModelOptions:
 	model_name = state_manager.get_item('age_modifier_model')
 	return create_static_model_set('full').get(model_name)
@@ -246,8 +252,7 @@ def forward(crop_vision_frame : VisionFrame, extend_vision_frame : VisionFrame,
 		if age_modifier_input.name == 'direction':
 			age_modifier_inputs[age_modifier_input.name] = age_modifier_direction
 
-	with thread_semaphore():
-		crop_vision_frame = age_modifier.run(None, age_modifier_inputs)[0][0]
+	crop_vision_frame = inference_manager.run_inference(age_modifier, age_modifier_inputs)[0][0]
 
 	return crop_vision_frame
 
@@ -20,8 +20,7 @@ from facefusion.processors.modules.background_remover.types import BackgroundRem
 from facefusion.processors.types import ProcessorOutputs
 from facefusion.program_helper import find_argument_group
 from facefusion.sanitizer import sanitize_int_range
-from facefusion.thread_helper import thread_semaphore
-from facefusion.types import ApplyStateItem, Args, DownloadScope, InferencePool, InferenceProvider, Mask, ModelOptions, ModelSet, ProcessMode, VisionFrame
+from facefusion.types import ApplyStateItem, Args, DownloadScope, InferenceLimitSet, InferencePool, InferenceProvider, Mask, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import read_static_image, read_static_video_frame
 
 
@@ -479,6 +478,13 @@ def clear_inference_pool() -> None:
 	inference_manager.clear_inference_pool(__name__, model_names)
 
 
+def adjust_inference_limits() -> InferenceLimitSet:
+	return\
+	{
+		'background_remover': 1
+	}
+
+
 def override_inference_providers() -> List[InferenceProvider]:
 	model_type = get_model_options().get('type')
 
@@ -571,14 +577,13 @@ def forward(temp_vision_frame : VisionFrame) -> VisionFrame:
 	background_remover = get_inference_pool().get('background_remover')
 	model_type = get_model_options().get('type')
 
-	with thread_semaphore():
-		remove_vision_frame = background_remover.run(None,
-		{
-			'input': temp_vision_frame
-		})[0]
+	remove_vision_frame = inference_manager.run_inference(background_remover,
+	{
+		'input': temp_vision_frame
+	})[0]
 
-		if model_type == 'u2net_cloth':
-			remove_vision_frame = numpy.argmax(remove_vision_frame, axis = 1)
+	if model_type == 'u2net_cloth':
+		remove_vision_frame = numpy.argmax(remove_vision_frame, axis = 1)
 
 	return remove_vision_frame
 
@@ -586,11 +591,10 @@ def forward(temp_vision_frame : VisionFrame) -> VisionFrame:
 def forward_corridor_key(temp_vision_frame : VisionFrame) -> Tuple[Mask, VisionFrame]:
 	background_remover = get_inference_pool().get('background_remover')
 
-	with thread_semaphore():
-		remove_vision_mask, remove_vision_frame = background_remover.run(None,
-		{
-			'input': temp_vision_frame
-		})
+	remove_vision_mask, remove_vision_frame = inference_manager.run_inference(background_remover,
+	{
+		'input': temp_vision_frame
+	})
 
 	return remove_vision_mask, remove_vision_frame
 
@@ -21,8 +21,7 @@ from facefusion.processors.modules.deep_swapper import choices as deep_swapper_c
 from facefusion.processors.modules.deep_swapper.types import DeepSwapperInputs, DeepSwapperMorph
 from facefusion.processors.types import ProcessorOutputs
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import thread_semaphore
-from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, InferencePool, Mask, ModelOptions, ModelSet, ProcessMode, VisionFrame
+from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, InferenceLimitSet, InferencePool, Mask, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import conditional_match_frame_color, read_static_image, read_static_video_frame
 
 
@@ -259,6 +258,13 @@ def clear_inference_pool() -> None:
 	inference_manager.clear_inference_pool(__name__, model_names)
 
 
+def adjust_inference_limits() -> InferenceLimitSet:
+	return\
+	{
+		'deep_swapper': 1
+	}
+
+
 def get_model_options() -> ModelOptions:
 	model_name = state_manager.get_item('deep_swapper_model')
 	return create_static_model_set('full').get(model_name)
@@ -376,8 +382,7 @@ def forward(crop_vision_frame : VisionFrame, deep_swapper_morph : DeepSwapperMor
 		if deep_swapper_input.name == 'morph_value:0':
 			deep_swapper_inputs[deep_swapper_input.name] = deep_swapper_morph
 
-	with thread_semaphore():
-		crop_target_mask, crop_vision_frame, crop_source_mask = deep_swapper.run(None, deep_swapper_inputs)
+	crop_target_mask, crop_vision_frame, crop_source_mask = inference_manager.run_inference(deep_swapper, deep_swapper_inputs)
 
 	return crop_vision_frame[0], crop_source_mask[0], crop_target_mask[0]
 
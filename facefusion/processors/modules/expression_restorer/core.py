@@ -21,8 +21,7 @@ from facefusion.processors.modules.expression_restorer import choices as express
 from facefusion.processors.modules.expression_restorer.types import ExpressionRestorerInputs
 from facefusion.processors.types import LivePortraitExpression, LivePortraitFeatureVolume, LivePortraitMotionPoints, LivePortraitPitch, LivePortraitRoll, LivePortraitScale, LivePortraitTranslation, LivePortraitYaw, ProcessorOutputs
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import conditional_thread_semaphore, thread_semaphore
-from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
+from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, InferenceLimitSet, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import read_static_image, read_static_video_frame
 
 
@@ -92,6 +91,13 @@ def clear_inference_pool() -> None:
 	inference_manager.clear_inference_pool(__name__, model_names)
 
 
+def adjust_inference_limits() -> InferenceLimitSet:
+	return\
+	{
+		'generator': 1
+	}
+
+
 def get_model_options() -> ModelOptions:
 	model_name = state_manager.get_item('expression_restorer_model')
 	return create_static_model_set('full').get(model_name)
@@ -211,11 +217,10 @@ def restrict_expression_areas(temp_expression : LivePortraitExpression, target_e
 def forward_extract_feature(crop_vision_frame : VisionFrame) -> LivePortraitFeatureVolume:
 	feature_extractor = get_inference_pool().get('feature_extractor')
 
-	with conditional_thread_semaphore():
-		feature_volume = feature_extractor.run(None,
-		{
-			'input': crop_vision_frame
-		})[0]
+	feature_volume = inference_manager.run_inference(feature_extractor,
+	{
+		'input': crop_vision_frame
+	})[0]
 
 	return feature_volume
 
@@ -223,11 +228,10 @@ def forward_extract_feature(crop_vision_frame : VisionFrame) -> LivePortraitFeat
 def forward_extract_motion(crop_vision_frame : VisionFrame) -> Tuple[LivePortraitPitch, LivePortraitYaw, LivePortraitRoll, LivePortraitScale, LivePortraitTranslation, LivePortraitExpression, LivePortraitMotionPoints]:
 	motion_extractor = get_inference_pool().get('motion_extractor')
 
-	with conditional_thread_semaphore():
-		pitch, yaw, roll, scale, translation, expression, motion_points = motion_extractor.run(None,
-		{
-			'input': crop_vision_frame
-		})
+	pitch, yaw, roll, scale, translation, expression, motion_points = inference_manager.run_inference(motion_extractor,
+	{
+		'input': crop_vision_frame
+	})
 
 	return pitch, yaw, roll, scale, translation, expression, motion_points
 
@@ -235,13 +239,12 @@ def forward_extract_motion(crop_vision_frame : VisionFrame) -> Tuple[LivePortrai
 def forward_generate_frame(feature_volume : LivePortraitFeatureVolume, target_motion_points : LivePortraitMotionPoints, temp_motion_points : LivePortraitMotionPoints) -> VisionFrame:
 	generator = get_inference_pool().get('generator')
 
-	with thread_semaphore():
-		crop_vision_frame = generator.run(None,
-		{
-			'feature_volume': feature_volume,
-			'source': target_motion_points,
-			'target': temp_motion_points
-		})[0][0]
+	crop_vision_frame = inference_manager.run_inference(generator,
+	{
+		'feature_volume': feature_volume,
+		'source': target_motion_points,
+		'target': temp_motion_points
+	})[0][0]
 
 	return crop_vision_frame
 
@@ -21,8 +21,7 @@ from facefusion.processors.modules.face_editor import choices as face_editor_cho
 from facefusion.processors.modules.face_editor.types import FaceEditorInputs
 from facefusion.processors.types import LivePortraitExpression, LivePortraitFeatureVolume, LivePortraitMotionPoints, LivePortraitPitch, LivePortraitRoll, LivePortraitRotation, LivePortraitScale, LivePortraitTranslation, LivePortraitYaw, ProcessorOutputs
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import conditional_thread_semaphore, thread_semaphore
-from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, FaceLandmark68, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
+from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, FaceLandmark68, InferenceLimitSet, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import read_static_image, read_static_video_frame
 
 
@@ -122,6 +121,14 @@ def clear_inference_pool() -> None:
 	inference_manager.clear_inference_pool(__name__, model_names)
 
 
+def adjust_inference_limits() -> InferenceLimitSet:
+	return\
+	{
+		'stitcher': 1,
+		'generator': 1
+	}
+
+
 def get_model_options() -> ModelOptions:
 	model_name = state_manager.get_item('face_editor_model')
 	return create_static_model_set('full').get(model_name)
@@ -248,11 +255,10 @@ def apply_edit(crop_vision_frame : VisionFrame, face_landmark_68 : FaceLandmark6
 def forward_extract_feature(crop_vision_frame : VisionFrame) -> LivePortraitFeatureVolume:
 	feature_extractor = get_inference_pool().get('feature_extractor')
 
-	with conditional_thread_semaphore():
-		feature_volume = feature_extractor.run(None,
-		{
-			'input': crop_vision_frame
-		})[0]
+	feature_volume = inference_manager.run_inference(feature_extractor,
+	{
+		'input': crop_vision_frame
+	})[0]
 
 	return feature_volume
 
@@ -260,11 +266,10 @@ def forward_extract_feature(crop_vision_frame : VisionFrame) -> LivePortraitFeat
 def forward_extract_motion(crop_vision_frame : VisionFrame) -> Tuple[LivePortraitPitch, LivePortraitYaw, LivePortraitRoll, LivePortraitScale, LivePortraitTranslation, LivePortraitExpression, LivePortraitMotionPoints]:
 	motion_extractor = get_inference_pool().get('motion_extractor')
 
-	with conditional_thread_semaphore():
-		pitch, yaw, roll, scale, translation, expression, motion_points = motion_extractor.run(None,
-		{
-			'input': crop_vision_frame
-		})
+	pitch, yaw, roll, scale, translation, expression, motion_points = inference_manager.run_inference(motion_extractor,
+	{
+		'input': crop_vision_frame
+	})
 
 	return pitch, yaw, roll, scale, translation, expression, motion_points
 
@@ -272,11 +277,10 @@ def forward_extract_motion(crop_vision_frame : VisionFrame) -> Tuple[LivePortrai
 def forward_retarget_eye(eye_motion_points : LivePortraitMotionPoints) -> LivePortraitMotionPoints:
 	eye_retargeter = get_inference_pool().get('eye_retargeter')
 
-	with conditional_thread_semaphore():
-		eye_motion_points = eye_retargeter.run(None,
-		{
-			'input': eye_motion_points
-		})[0]
+	eye_motion_points = inference_manager.run_inference(eye_retargeter,
+	{
+		'input': eye_motion_points
+	})[0]
 
 	return eye_motion_points
 
@@ -284,11 +288,10 @@ def forward_retarget_eye(eye_motion_points : LivePortraitMotionPoints) -> LivePo
 def forward_retarget_lip(lip_motion_points : LivePortraitMotionPoints) -> LivePortraitMotionPoints:
 	lip_retargeter = get_inference_pool().get('lip_retargeter')
 
-	with conditional_thread_semaphore():
-		lip_motion_points = lip_retargeter.run(None,
-		{
-			'input': lip_motion_points
-		})[0]
+	lip_motion_points = inference_manager.run_inference(lip_retargeter,
+	{
+		'input': lip_motion_points
+	})[0]
 
 	return lip_motion_points
 
@@ -296,12 +299,11 @@ def forward_retarget_lip(lip_motion_points : LivePortraitMotionPoints) -> LivePo
 def forward_stitch_motion_points(source_motion_points : LivePortraitMotionPoints, target_motion_points : LivePortraitMotionPoints) -> LivePortraitMotionPoints:
 	stitcher = get_inference_pool().get('stitcher')
 
-	with thread_semaphore():
-		motion_points = stitcher.run(None,
-		{
-			'source': source_motion_points,
-			'target': target_motion_points
-		})[0]
+	motion_points = inference_manager.run_inference(stitcher,
+	{
+		'source': source_motion_points,
+		'target': target_motion_points
+	})[0]
 
 	return motion_points
 
@@ -309,13 +311,12 @@ def forward_stitch_motion_points(source_motion_points : LivePortraitMotionPoints
 def forward_generate_frame(feature_volume : LivePortraitFeatureVolume, source_motion_points : LivePortraitMotionPoints, target_motion_points : LivePortraitMotionPoints) -> VisionFrame:
 	generator = get_inference_pool().get('generator')
 
-	with thread_semaphore():
-		crop_vision_frame = generator.run(None,
-		{
-			'feature_volume': feature_volume,
-			'source': source_motion_points,
-			'target': target_motion_points
-		})[0][0]
+	crop_vision_frame = inference_manager.run_inference(generator,
+	{
+		'feature_volume': feature_volume,
+		'source': source_motion_points,
+		'target': target_motion_points
+	})[0][0]
 
 	return crop_vision_frame
 
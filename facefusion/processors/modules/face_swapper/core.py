@@ -24,7 +24,6 @@ from facefusion.processors.modules.face_swapper.types import FaceSwapperInputs
 from facefusion.processors.pixel_boost import explode_pixel_boost, implode_pixel_boost
 from facefusion.processors.types import ProcessorOutputs
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import conditional_thread_semaphore
 from facefusion.types import ApplyStateItem, Args, DownloadScope, Embedding, Face, InferencePool, InferenceProvider, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import read_static_image, read_static_images, read_static_video_frame, unpack_resolution
 
@@ -604,7 +603,6 @@ def swap_face(source_face : Face, target_face : Face, source_vision_frame : Visi
 	pixel_boost_size = unpack_resolution(state_manager.get_item('face_swapper_pixel_boost'))
 	pixel_boost_total = pixel_boost_size[0] // model_size[0]
 	crop_vision_frame, affine_matrix = warp_face_by_face_landmark_5(temp_vision_frame, target_face.landmark_set.get('5/68'), model_template, pixel_boost_size)
-	temp_vision_frames = []
 	crop_masks = []
 
 	if 'box' in state_manager.get_item('face_mask_types'):
@@ -616,12 +614,10 @@ def swap_face(source_face : Face, target_face : Face, source_vision_frame : Visi
 		crop_masks.append(occlusion_mask)
 
 	pixel_boost_vision_frames = implode_pixel_boost(crop_vision_frame, pixel_boost_total, model_size)
-	for pixel_boost_vision_frame in pixel_boost_vision_frames:
-		pixel_boost_vision_frame = prepare_crop_frame(pixel_boost_vision_frame)
-		pixel_boost_vision_frame = forward_swap_face(source_face, target_face, source_vision_frame, pixel_boost_vision_frame)
-		pixel_boost_vision_frame = normalize_crop_frame(pixel_boost_vision_frame)
-		temp_vision_frames.append(pixel_boost_vision_frame)
-	crop_vision_frame = explode_pixel_boost(temp_vision_frames, pixel_boost_total, model_size, pixel_boost_size)
+	pixel_boost_vision_frames = prepare_crop_frames(pixel_boost_vision_frames)
+	pixel_boost_vision_frames = forward_swap_face(source_face, target_face, source_vision_frame, pixel_boost_vision_frames)
+	pixel_boost_vision_frames = normalize_crop_frames(pixel_boost_vision_frames)
+	crop_vision_frame = explode_pixel_boost(pixel_boost_vision_frames, pixel_boost_total, model_size, pixel_boost_size)
 
 	if 'area' in state_manager.get_item('face_mask_types'):
 		face_landmark_68 = cv2.transform(target_face.landmark_set.get('68').reshape(1, -1, 2), affine_matrix).reshape(-1, 2)
@@ -637,7 +633,7 @@ def swap_face(source_face : Face, target_face : Face, source_vision_frame : Visi
 	return paste_vision_frame
 
 
-def forward_swap_face(source_face : Face, target_face : Face, source_vision_frame : VisionFrame, crop_vision_frame : VisionFrame) -> VisionFrame:
+def forward_swap_face(source_face : Face, target_face : Face, source_vision_frame : VisionFrame, crop_vision_frames : VisionFrame) -> VisionFrame:
 	face_swapper = get_inference_pool().get('face_swapper')
 	model_type = get_model_options().get('type')
 	face_swapper_inputs = {}
@@ -645,28 +641,28 @@ def forward_swap_face(source_face : Face, target_face : Face, source_vision_fram
 	for face_swapper_input in face_swapper.get_inputs():
 		if face_swapper_input.name == 'source':
 			if model_type in [ 'blendswap', 'uniface' ]:
-				face_swapper_inputs[face_swapper_input.name] = prepare_source_frame(source_face, source_vision_frame)
+				source_input = prepare_source_frame(source_face, source_vision_frame)
 			else:
-				source_embedding = prepare_source_embedding(source_face)
-				source_embedding = balance_source_embedding(source_embedding, target_face.embedding)
-				face_swapper_inputs[face_swapper_input.name] = source_embedding
+				source_input = prepare_source_embedding(source_face)
+				source_input = balance_source_embedding(source_input, target_face.embedding)
+			face_swapper_inputs[face_swapper_input.name] = numpy.repeat(source_input, len(crop_vision_frames), axis = 0)
 		if face_swapper_input.name == 'target':
-			face_swapper_inputs[face_swapper_input.name] = crop_vision_frame
+			face_swapper_inputs[face_swapper_input.name] = crop_vision_frames
 
-	with conditional_thread_semaphore():
-		crop_vision_frame = face_swapper.run(None, face_swapper_inputs)[0][0]
-
-	return crop_vision_frame
+	if inference_manager.has_dynamic_batch(face_swapper):
+		crop_vision_frames = inference_manager.run_inference_batch(face_swapper, face_swapper_inputs)[0]
+	else:
+		crop_vision_frames = inference_manager.run_inference_batches(face_swapper, face_swapper_inputs, len(crop_vision_frames))[0]
+	return crop_vision_frames
 
 
 def forward_convert_embedding(face_embedding : Embedding) -> Embedding:
 	embedding_converter = get_inference_pool().get('embedding_converter')
 
-	with conditional_thread_semaphore():
-		face_embedding = embedding_converter.run(None,
-		{
-			'input': face_embedding
-		})[0]
+	face_embedding = inference_manager.run_inference(embedding_converter,
+	{
+		'input': face_embedding
+	})[0]
 
 	return face_embedding
 
@@ -733,30 +729,29 @@ def convert_source_embedding(source_embedding : Embedding) -> Tuple[Embedding, E
 	return source_embedding, source_embedding_norm
 
 
-def prepare_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
+def prepare_crop_frames(crop_vision_frames : VisionFrame) -> VisionFrame:
 	model_mean = get_model_options().get('mean')
 	model_standard_deviation = get_model_options().get('standard_deviation')
 
-	crop_vision_frame = crop_vision_frame[:, :, ::-1] / 255.0
-	crop_vision_frame = (crop_vision_frame - model_mean) / model_standard_deviation
-	crop_vision_frame = crop_vision_frame.transpose(2, 0, 1)
-	crop_vision_frame = numpy.expand_dims(crop_vision_frame, axis = 0).astype(numpy.float32)
-	return crop_vision_frame
+	crop_vision_frames = crop_vision_frames[:, :, :, ::-1] / 255.0
+	crop_vision_frames = (crop_vision_frames - model_mean) / model_standard_deviation
+	crop_vision_frames = crop_vision_frames.transpose(0, 3, 1, 2).astype(numpy.float32)
+	return crop_vision_frames
 
 
-def normalize_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
+def normalize_crop_frames(crop_vision_frames : VisionFrame) -> VisionFrame:
 	model_type = get_model_options().get('type')
 	model_mean = get_model_options().get('mean')
 	model_standard_deviation = get_model_options().get('standard_deviation')
 
-	crop_vision_frame = crop_vision_frame.transpose(1, 2, 0)
+	crop_vision_frames = crop_vision_frames.transpose(0, 2, 3, 1)
 
 	if model_type in [ 'ghost', 'hififace', 'hyperswap', 'uniface' ]:
-		crop_vision_frame = crop_vision_frame * model_standard_deviation + model_mean
+		crop_vision_frames = crop_vision_frames * model_standard_deviation + model_mean
 
-	crop_vision_frame = crop_vision_frame.clip(0, 1)
-	crop_vision_frame = crop_vision_frame[:, :, ::-1] * 255
-	return crop_vision_frame
+	crop_vision_frames = crop_vision_frames.clip(0, 1)
+	crop_vision_frames = crop_vision_frames[:, :, :, ::-1] * 255
+	return crop_vision_frames
 
 
 def extract_source_face(source_vision_frames : List[VisionFrame]) -> Optional[Face]:
@@ -18,8 +18,7 @@ from facefusion.processors.modules.frame_colorizer import choices as frame_color
 from facefusion.processors.modules.frame_colorizer.types import FrameColorizerInputs
 from facefusion.processors.types import ProcessorOutputs
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import thread_semaphore
-from facefusion.types import ApplyStateItem, Args, DownloadScope, InferencePool, InferenceProvider, ModelOptions, ModelSet, ProcessMode, VisionFrame
+from facefusion.types import ApplyStateItem, Args, DownloadScope, InferenceLimitSet, InferencePool, InferenceProvider, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import blend_frame, read_static_image, read_static_video_frame, unpack_resolution
 
 
@@ -172,6 +171,13 @@ def clear_inference_pool() -> None:
 	inference_manager.clear_inference_pool(__name__, model_names)
 
 
+def adjust_inference_limits() -> InferenceLimitSet:
+	return\
+	{
+		'frame_colorizer': 1
+	}
+
+
 def override_inference_providers() -> List[InferenceProvider]:
 	if is_macos() and has_execution_provider('coreml'):
 		return [ facefusion.choices.execution_provider_set.get('cpu') ]
@@ -251,11 +257,10 @@ def colorize_frame(temp_vision_frame : VisionFrame) -> VisionFrame:
 def forward(color_vision_frame : VisionFrame) -> VisionFrame:
 	frame_colorizer = get_inference_pool().get('frame_colorizer')
 
-	with thread_semaphore():
-		color_vision_frame = frame_colorizer.run(None,
-		{
-			'input': color_vision_frame
-		})[0][0]
+	color_vision_frame = inference_manager.run_inference(frame_colorizer,
+	{
+		'input': color_vision_frame
+	})[0][0]
 
 	return color_vision_frame
 
@@ -6,3 +6,4 @@ from facefusion.processors.modules.frame_enhancer.types import FrameEnhancerMode
 frame_enhancer_models : List[FrameEnhancerModel] = list(get_args(FrameEnhancerModel))
 
 frame_enhancer_blend_range : Sequence[int] = create_int_range(0, 100, 1)
+frame_enhancer_batch_size_range : Sequence[int] = create_int_range(1, 32, 1)
@@ -18,7 +18,6 @@ from facefusion.processors.modules.frame_enhancer import choices as frame_enhanc
 from facefusion.processors.modules.frame_enhancer.types import FrameEnhancerInputs
 from facefusion.processors.types import ProcessorOutputs
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import conditional_thread_semaphore
 from facefusion.types import ApplyStateItem, Args, DownloadScope, InferencePool, InferenceProvider, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import blend_frame, create_tile_frames, merge_tile_frames, read_static_image, read_static_video_frame
 
@@ -583,12 +582,14 @@ def register_args(program : ArgumentParser) -> None:
 	if group_processors:
 		group_processors.add_argument('--frame-enhancer-model', help = translator.get('help.model', __package__), default = config.get_str_value('processors', 'frame_enhancer_model', 'span_kendata_x4'), choices = frame_enhancer_choices.frame_enhancer_models)
 		group_processors.add_argument('--frame-enhancer-blend', help = translator.get('help.blend', __package__), type = int, default = config.get_int_value('processors', 'frame_enhancer_blend', '80'), choices = frame_enhancer_choices.frame_enhancer_blend_range, metavar = create_int_metavar(frame_enhancer_choices.frame_enhancer_blend_range))
-		facefusion.jobs.job_store.register_step_keys([ 'frame_enhancer_model', 'frame_enhancer_blend' ])
+		group_processors.add_argument('--frame-enhancer-batch-size', help = translator.get('help.batch_size', __package__), type = int, default = config.get_int_value('processors', 'frame_enhancer_batch_size', '4'), choices = frame_enhancer_choices.frame_enhancer_batch_size_range, metavar = create_int_metavar(frame_enhancer_choices.frame_enhancer_batch_size_range))
+		facefusion.jobs.job_store.register_step_keys([ 'frame_enhancer_model', 'frame_enhancer_blend', 'frame_enhancer_batch_size' ])
 
 
 def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('frame_enhancer_model', args.get('frame_enhancer_model'))
 	apply_state_item('frame_enhancer_blend', args.get('frame_enhancer_blend'))
+	apply_state_item('frame_enhancer_batch_size', args.get('frame_enhancer_batch_size'))
 
 
 def get_common_modules() -> List[ModuleType]:
@@ -637,40 +638,36 @@ def enhance_frame(temp_vision_frame : VisionFrame) -> VisionFrame:
 	model_scale = get_model_options().get('scale')
 	temp_height, temp_width = temp_vision_frame.shape[:2]
 	tile_vision_frames, pad_width, pad_height = create_tile_frames(temp_vision_frame, model_size)
-
-	for index, tile_vision_frame in enumerate(tile_vision_frames):
-		tile_vision_frame = prepare_tile_frame(tile_vision_frame)
-		tile_vision_frame = forward(tile_vision_frame)
-		tile_vision_frames[index] = normalize_tile_frame(tile_vision_frame)
-
+	tile_vision_frames = prepare_tile_frames(tile_vision_frames)
+	tile_vision_frames = forward(tile_vision_frames)
+	tile_vision_frames = normalize_tile_frames(tile_vision_frames)
 	merge_vision_frame = merge_tile_frames(tile_vision_frames, temp_width * model_scale, temp_height * model_scale, pad_width * model_scale, pad_height * model_scale, (model_size[0] * model_scale, model_size[1] * model_scale, model_size[2] * model_scale))
 	temp_vision_frame = blend_merge_frame(temp_vision_frame, merge_vision_frame)
 	return temp_vision_frame
 
 
-def forward(tile_vision_frame : VisionFrame) -> VisionFrame:
+def forward(tile_vision_frames : VisionFrame) -> VisionFrame:
 	frame_enhancer = get_inference_pool().get('frame_enhancer')
+	frame_enhancer_batch_size = state_manager.get_item('frame_enhancer_batch_size')
 
-	with conditional_thread_semaphore():
-		tile_vision_frame = frame_enhancer.run(None,
-		{
-			'input': tile_vision_frame
-		})[0]
+	tile_vision_frames = inference_manager.run_inference_batches(frame_enhancer,
+	{
+		'input': tile_vision_frames
+	}, frame_enhancer_batch_size)[0]
 
-	return tile_vision_frame
+	return tile_vision_frames
 
 
-def prepare_tile_frame(tile_vision_frame : VisionFrame) -> VisionFrame:
-	tile_vision_frame = numpy.expand_dims(tile_vision_frame[:, :, ::-1], axis = 0)
-	tile_vision_frame = tile_vision_frame.transpose(0, 3, 1, 2)
-	tile_vision_frame = tile_vision_frame.astype(numpy.float32) / 255.0
-	return tile_vision_frame
+def prepare_tile_frames(tile_vision_frames : VisionFrame) -> VisionFrame:
+	tile_vision_frames = tile_vision_frames[:, :, :, ::-1].transpose(0, 3, 1, 2)
+	tile_vision_frames = tile_vision_frames.astype(numpy.float32) / 255.0
+	return tile_vision_frames
 
 
-def normalize_tile_frame(tile_vision_frame : VisionFrame) -> VisionFrame:
-	tile_vision_frame = tile_vision_frame.transpose(0, 2, 3, 1).squeeze(0) * 255
-	tile_vision_frame = tile_vision_frame.clip(0, 255).astype(numpy.uint8)[:, :, ::-1]
-	return tile_vision_frame
+def normalize_tile_frames(tile_vision_frames : VisionFrame) -> VisionFrame:
+	tile_vision_frames = tile_vision_frames.transpose(0, 2, 3, 1) * 255
+	tile_vision_frames = tile_vision_frames.clip(0, 255).astype(numpy.uint8)[:, :, :, ::-1]
+	return tile_vision_frames
 
 
 def blend_merge_frame(temp_vision_frame : VisionFrame, merge_vision_frame : VisionFrame) -> VisionFrame:
@@ -7,7 +7,8 @@ LOCALES : Locales =\
 		'help':
 		{
 			'model': 'choose the model responsible for enhancing the frame',
-			'blend': 'blend the enhanced into the previous frame'
+			'blend': 'blend the enhanced into the previous frame',
+			'batch_size': 'specify the amount of tiles to enhance per inference run'
 		},
 		'uis':
 		{
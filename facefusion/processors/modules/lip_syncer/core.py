@@ -21,7 +21,6 @@ from facefusion.processors.modules.lip_syncer import choices as lip_syncer_choic
 from facefusion.processors.modules.lip_syncer.types import LipSyncerInputs, LipSyncerWeight
 from facefusion.processors.types import ProcessorOutputs
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import conditional_thread_semaphore
 from facefusion.types import ApplyStateItem, Args, AudioFrame, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import read_static_image, read_static_video_frame
 
@@ -218,13 +217,12 @@ def sync_lip(target_face : Face, source_voice_frame : AudioFrame, temp_vision_fr
 def forward_edtalk(temp_audio_frame : AudioFrame, crop_vision_frame : VisionFrame, lip_syncer_weight : LipSyncerWeight) -> VisionFrame:
 	lip_syncer = get_inference_pool().get('lip_syncer')
 
-	with conditional_thread_semaphore():
-		crop_vision_frame = lip_syncer.run(None,
-		{
-			'source': temp_audio_frame,
-			'target': crop_vision_frame,
-			'weight': lip_syncer_weight
-		})[0]
+	crop_vision_frame = inference_manager.run_inference(lip_syncer,
+	{
+		'source': temp_audio_frame,
+		'target': crop_vision_frame,
+		'weight': lip_syncer_weight
+	})[0]
 
 	return crop_vision_frame
 
@@ -232,12 +230,11 @@ def forward_edtalk(temp_audio_frame : AudioFrame, crop_vision_frame : VisionFram
 def forward_wav2lip(temp_audio_frame : AudioFrame, area_vision_frame : VisionFrame) -> VisionFrame:
 	lip_syncer = get_inference_pool().get('lip_syncer')
 
-	with conditional_thread_semaphore():
-		area_vision_frame = lip_syncer.run(None,
-		{
-			'source': temp_audio_frame,
-			'target': area_vision_frame
-		})[0]
+	area_vision_frame = inference_manager.run_inference(lip_syncer,
+	{
+		'source': temp_audio_frame,
+		'target': area_vision_frame
+	})[0]
 
 	return area_vision_frame
 
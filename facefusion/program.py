@@ -46,6 +46,14 @@ def create_jobs_path_program() -> ArgumentParser:
 	return program
 
 
+def create_face_cache_path_program() -> ArgumentParser:
+	program = ArgumentParser(add_help = False)
+	group_paths = program.add_argument_group('paths')
+	group_paths.add_argument('--face-cache-path', help = translator.get('help.face_cache_path'), default = config.get_str_value('paths', 'face_cache_path'))
+	job_store.register_job_keys([ 'face_cache_path' ])
+	return program
+
+
 def create_source_paths_program() -> ArgumentParser:
 	program = ArgumentParser(add_help = False)
 	group_paths = program.add_argument_group('paths')
@@ -196,7 +204,9 @@ def create_output_creation_program() -> ArgumentParser:
 	group_output_creation.add_argument('--output-video-quality', help = translator.get('help.output_video_quality'), type = int, default = config.get_int_value('output_creation', 'output_video_quality', '80'), choices = facefusion.choices.output_video_quality_range, metavar = create_int_metavar(facefusion.choices.output_video_quality_range))
 	group_output_creation.add_argument('--output-video-scale', help = translator.get('help.output_video_scale'), type = float, default = config.get_float_value('output_creation', 'output_video_scale', '1.0'), choices = facefusion.choices.output_video_scale_range)
 	group_output_creation.add_argument('--output-video-fps', help = translator.get('help.output_video_fps'), type = float, default = config.get_float_value('output_creation', 'output_video_fps'))
-	job_store.register_step_keys([ 'output_image_quality', 'output_image_scale', 'output_audio_encoder', 'output_audio_quality', 'output_audio_volume', 'output_video_encoder', 'output_video_preset', 'output_video_quality', 'output_video_scale', 'output_video_fps' ])
+	group_output_creation.add_argument('--output-video-segment-count', help = translator.get('help.output_video_segment_count'), type = int, default = config.get_int_value('output_creation', 'output_video_segment_count', '1'), choices = facefusion.choices.output_video_segment_count_range, metavar = create_int_metavar(facefusion.choices.output_video_segment_count_range))
+	group_output_creation.add_argument('--output-video-segment-duration', help = translator.get('help.output_video_segment_duration'), type = int, default = config.get_int_value('output_creation', 'output_video_segment_duration', '0'), choices = facefusion.choices.output_video_segment_duration_range, metavar = create_int_metavar(facefusion.choices.output_video_segment_duration_range))
+	job_store.register_step_keys([ 'output_image_quality', 'output_image_scale', 'output_audio_encoder', 'output_audio_quality', 'output_audio_volume', 'output_video_encoder', 'output_video_preset', 'output_video_quality', 'output_video_scale', 'output_video_fps', 'output_video_segment_count', 'output_video_segment_duration' ])
 	return program
 
 
@@ -262,7 +272,10 @@ def create_execution_program() -> ArgumentParser:
 	group_execution.add_argument('--execution-device-ids', help = translator.get('help.execution_device_ids'), type = int, default = config.get_int_list('execution', 'execution_device_ids', '0'), nargs = '+', metavar = 'EXECUTION_DEVICE_IDS')
 	group_execution.add_argument('--execution-providers', help = translator.get('help.execution_providers').format(choices = ', '.join(available_execution_providers)), default = config.get_str_list('execution', 'execution_providers', get_first(available_execution_providers)), choices = available_execution_providers, nargs = '+', metavar = 'EXECUTION_PROVIDERS')
 	group_execution.add_argument('--execution-thread-count', help = translator.get('help.execution_thread_count'), type = int, default = config.get_int_value('execution', 'execution_thread_count', '8'), choices = facefusion.choices.execution_thread_count_range, metavar = create_int_metavar(facefusion.choices.execution_thread_count_range))
-	job_store.register_job_keys([ 'execution_device_ids', 'execution_providers', 'execution_thread_count' ])
+	group_execution.add_argument('--execution-process-count', help = translator.get('help.execution_process_count'), type = int, default = config.get_int_value('execution', 'execution_process_count', '1'), choices = facefusion.choices.execution_process_count_range, metavar = create_int_metavar(facefusion.choices.execution_process_count_range))
+	group_execution.add_argument('--execution-thread-budget', help = translator.get('help.execution_thread_budget'), type = int, default = config.get_int_value('execution', 'execution_thread_budget', '0'), choices = facefusion.choices.execution_thread_budget_range, metavar = create_int_metavar(facefusion.choices.execution_thread_budget_range))
+	group_execution.add_argument('--execution-replica-count', help = translator.get('help.execution_replica_count'), type = int, default = config.get_int_value('execution', 'execution_replica_count', '1'), choices = facefusion.choices.execution_replica_count_range, metavar = create_int_metavar(facefusion.choices.execution_replica_count_range))
+	job_store.register_job_keys([ 'execution_device_ids', 'execution_providers', 'execution_thread_count', 'execution_process_count', 'execution_thread_budget', 'execution_replica_count' ])
 	return program
 
 
@@ -270,7 +283,8 @@ def create_memory_program() -> ArgumentParser:
 	program = ArgumentParser(add_help = False)
 	group_memory = program.add_argument_group('memory')
 	group_memory.add_argument('--video-memory-strategy', help = translator.get('help.video_memory_strategy'), default = config.get_str_value('memory', 'video_memory_strategy', 'strict'), choices = facefusion.choices.video_memory_strategies)
-	job_store.register_job_keys([ 'video_memory_strategy' ])
+	group_memory.add_argument('--face-store-memory-limit', help = translator.get('help.face_store_memory_limit'), type = int, default = config.get_int_value('memory', 'face_store_memory_limit', '1024'), choices = facefusion.choices.face_store_memory_limit_range, metavar = create_int_metavar(facefusion.choices.face_store_memory_limit_range))
+	job_store.register_job_keys([ 'video_memory_strategy', 'face_store_memory_limit' ])
 	return program
 
 
@@ -313,7 +327,7 @@ def collect_step_program() -> ArgumentParser:
 
 
 def collect_job_program() -> ArgumentParser:
-	return ArgumentParser(parents = [ create_execution_program(), create_download_providers_program(), create_memory_program(), create_log_level_program() ], add_help = False)
+	return ArgumentParser(parents = [ create_face_cache_path_program(), create_execution_program(), create_download_providers_program(), create_memory_program(), create_log_level_program() ], add_help = False)
 
 
 def create_program() -> ArgumentParser:
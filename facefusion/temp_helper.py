@@ -1,8 +1,11 @@
 import os
+from typing import Optional
+
+import numpy
 
 from facefusion import state_manager
-from facefusion.filesystem import create_directory, get_file_extension, get_file_name, move_file, remove_directory, resolve_file_pattern
-from facefusion.types import FrameSet
+from facefusion.filesystem import create_directory, get_file_extension, get_file_name, get_file_size, is_file, move_file, remove_directory, resolve_file_pattern
+from facefusion.types import FrameSet, FrameShape, VisionFrame
 
 
 def get_temp_file_path(file_path : str) -> str:
@@ -11,6 +14,12 @@ def get_temp_file_path(file_path : str) -> str:
 	return os.path.join(temp_directory_path, 'temp' + temp_file_extension)
 
 
+def get_temp_segment_path(file_path : str, segment_index : int) -> str:
+	temp_directory_path = get_temp_directory_path(file_path)
+	temp_file_extension = get_file_extension(file_path)
+	return os.path.join(temp_directory_path, 'temp-' + str(segment_index).zfill(4) + temp_file_extension)
+
+
 def move_temp_file(file_path : str, move_path : str) -> bool:
 	temp_file_path = get_temp_file_path(file_path)
 	return move_file(temp_file_path, move_path)
@@ -27,6 +36,21 @@ def resolve_temp_frame_set(target_path : str) -> FrameSet:
 	return temp_frame_set
 
 
+def get_temp_frame_chunk_path(target_path : str) -> str:
+	temp_directory_path = get_temp_directory_path(target_path)
+	return os.path.join(temp_directory_path, 'temp.raw')
+
+
+def resolve_temp_frame_chunk(target_path : str, temp_frame_shape : FrameShape) -> Optional[VisionFrame]:
+	temp_frame_chunk_path = get_temp_frame_chunk_path(target_path)
+
+	if is_file(temp_frame_chunk_path) and get_file_size(temp_frame_chunk_path) >= numpy.prod(temp_frame_shape):
+		temp_frame_chunk = numpy.memmap(temp_frame_chunk_path, dtype = numpy.uint8, mode = 'r+')
+		temp_frame_total = temp_frame_chunk.size // numpy.prod(temp_frame_shape)
+		return temp_frame_chunk[:temp_frame_total * numpy.prod(temp_frame_shape)].reshape((temp_frame_total,) + temp_frame_shape)
+	return None
+
+
 def get_temp_frame_pattern(target_path : str, temp_frame_prefix : str) -> str:
 	temp_directory_path = get_temp_directory_path(target_path)
 	return os.path.join(temp_directory_path, temp_frame_prefix + '.' + state_manager.get_item('temp_frame_format'))
@@ -1,7 +1,8 @@
 import subprocess
 from collections import namedtuple
-from threading import Lock
-from typing import Any, Callable, Dict, List, Literal, NotRequired, Optional, Tuple, TypeAlias, TypedDict
+from multiprocessing.shared_memory import SharedMemory
+from threading import Condition, Event, Lock, Semaphore, Thread
+from typing import Any, Callable, Dict, List, Literal, NotRequired, Optional, OrderedDict, Tuple, TypeAlias, TypedDict
 
 import cv2
 import numpy
@@ -52,12 +53,26 @@ Face = namedtuple('Face',
 	'gender',
 	'race'
 ])
+VisionKey : TypeAlias = str
+VisionKeySet : TypeAlias = Dict[int, VisionKey]
 FaceSet = TypedDict('FaceSet',
 {
 	'lock': Lock,
-	'faces': NotRequired[List[Face]]
+	'faces': NotRequired[List[Face]],
+	'size': NotRequired[int]
+})
+FaceStore : TypeAlias = OrderedDict[VisionKey, FaceSet]
+FaceCacheArray : TypeAlias = NDArray[numpy.void]
+FaceCacheItem : TypeAlias = NDArray[numpy.void]
+FaceCacheSet : TypeAlias = Dict[str, FaceCacheArray]
+FrameTotalSet : TypeAlias = Dict[str, int]
+FaceStoreStatistics = TypedDict('FaceStoreStatistics',
+{
+	'hits' : int,
+	'misses' : int,
+	'evictions' : int,
+	'size' : int
 })
-FaceStore : TypeAlias = Dict[str, FaceSet]
 FaceTrack : TypeAlias = Dict[int, Face]
 
 Language = Literal['en']
@@ -146,12 +161,35 @@ VideoWriter = TypedDict('VideoWriter',
 	'metadata' : VideoWriterMetadata
 })
 VideoWriterSet : TypeAlias = Dict[str, VideoWriter]
+VideoDecoder = TypedDict('VideoDecoder',
+{
+	'id' : str,
+	'reader' : VideoReader,
+	'thread' : Thread,
+	'condition' : Condition,
+	'frame_start' : int,
+	'frame_total' : int,
+	'frame_buffer_total' : int,
+	'request_total' : int,
+	'is_running' : bool
+})
+VideoDecoderSet : TypeAlias = Dict[str, VideoDecoder]
 VideoPoolSet = TypedDict('VideoPoolSet',
 {
 	'reader' : VideoReaderSet,
+	'decoder' : VideoDecoderSet,
 	'writer' : VideoWriterSet
 })
 FrameStoreSet : TypeAlias = Dict[str, VisionFrameSet]
+FrameShape : TypeAlias = Tuple[int, ...]
+FrameBuffer = TypedDict('FrameBuffer',
+{
+	'vision_frame' : VisionFrame,
+	'shared_memory' : Optional[SharedMemory],
+	'reference_total' : int
+})
+FramePoolSet : TypeAlias = Dict[str, List[FrameBuffer]]
+FrameBufferSet : TypeAlias = Dict[int, FrameBuffer]
 
 ProcessState = Literal['checking', 'processing', 'stopping', 'pending']
 Args : TypeAlias = Dict[str, Any]
@@ -192,7 +230,7 @@ VoiceExtractorModel = Literal['kim_vocal_1', 'kim_vocal_2', 'uvr_mdxnet']
 AudioFormat = Literal['flac', 'm4a', 'mp3', 'ogg', 'opus', 'wav']
 ImageFormat = Literal['bmp', 'jpeg', 'png', 'tiff', 'webp']
 VideoFormat = Literal['avi', 'm4v', 'mkv', 'mov', 'mp4', 'mpeg', 'mxf', 'webm', 'wmv']
-TempFrameFormat = Literal['bmp', 'jpeg', 'png', 'tiff']
+TempFrameFormat = Literal['bmp', 'jpeg', 'png', 'tiff', 'raw']
 TempPixelFormat = Literal['bgr24', 'bgra']
 AudioTypeSet : TypeAlias = Dict[AudioFormat, str]
 ImageTypeSet : TypeAlias = Dict[ImageFormat, str]
@@ -234,6 +272,17 @@ ExecutionProviderValue = Literal['CPUExecutionProvider', 'CoreMLExecutionProvide
 ExecutionProviderSet : TypeAlias = Dict[ExecutionProvider, ExecutionProviderValue]
 InferenceProvider : TypeAlias = Any
 InferenceOptionSet : TypeAlias = Dict[str, Any]
+InferenceExecutionMode = Literal['sequential', 'parallel']
+InferenceGraphOptimization = Literal['disable', 'basic', 'extended', 'all']
+InferenceSessionOptions = TypedDict('InferenceSessionOptions',
+{
+	'intra_op_thread_count' : int,
+	'inter_op_thread_count' : int,
+	'execution_mode' : InferenceExecutionMode,
+	'graph_optimization' : InferenceGraphOptimization,
+	'enable_memory_arena' : bool,
+	'enable_memory_pattern' : bool
+}, total = False)
 ValueAndUnit = TypedDict('ValueAndUnit',
 {
 	'value' : int,
@@ -294,6 +343,24 @@ AppContext = Literal['cli', 'ui']
 
 InferencePool : TypeAlias = Dict[str, InferenceSession]
 InferencePoolSet : TypeAlias = Dict[AppContext, Dict[str, InferencePool]]
+InferenceInputs : TypeAlias = Dict[str, Any]
+InferenceOutputs : TypeAlias = List[Any]
+InferenceRequest = TypedDict('InferenceRequest',
+{
+	'inputs' : InferenceInputs,
+	'outputs' : Optional[InferenceOutputs],
+	'error' : Optional[Exception],
+	'event' : Event
+})
+InferenceBatch = TypedDict('InferenceBatch',
+{
+	'requests' : List[InferenceRequest],
+	'event' : Event
+})
+InferenceBatchSet : TypeAlias = Dict[int, InferenceBatch]
+InferenceLoadSet : TypeAlias = Dict[int, int]
+InferenceLimitSet : TypeAlias = Dict[str, int]
+InferenceSemaphoreSet : TypeAlias = Dict[int, Semaphore]
 
 UiWorkflow = Literal['instant_runner', 'job_runner', 'job_manager']
 
@@ -305,10 +372,17 @@ JobStore = TypedDict('JobStore',
 JobOutputSet : TypeAlias = Dict[str, List[str]]
 JobStatus = Literal['drafted', 'queued', 'completed', 'failed']
 JobStepStatus = Literal['drafted', 'queued', 'started', 'completed', 'failed']
+JobSegment = TypedDict('JobSegment',
+{
+	'frame_start' : int,
+	'frame_end' : int,
+	'path' : str
+})
 JobStep = TypedDict('JobStep',
 {
 	'args' : Args,
-	'status' : JobStepStatus
+	'status' : JobStepStatus,
+	'segments' : NotRequired[List[JobSegment]]
 })
 Job = TypedDict('Job',
 {
@@ -325,6 +399,7 @@ StateKey = Literal\
 	'config_path',
 	'temp_path',
 	'jobs_path',
+	'face_cache_path',
 	'source_paths',
 	'target_path',
 	'output_path',
@@ -376,6 +451,8 @@ StateKey = Literal\
 	'output_video_quality',
 	'output_video_scale',
 	'output_video_fps',
+	'output_video_segment_count',
+	'output_video_segment_duration',
 	'workflow_mode',
 	'workflow_strategy',
 	'processors',
@@ -385,7 +462,11 @@ StateKey = Literal\
 	'execution_device_ids',
 	'execution_providers',
 	'execution_thread_count',
+	'execution_process_count',
+	'execution_thread_budget',
+	'execution_replica_count',
 	'video_memory_strategy',
+	'face_store_memory_limit',
 	'log_level',
 	'halt_on_error',
 	'job_id',
@@ -398,6 +479,7 @@ State = TypedDict('State',
 	'config_path' : str,
 	'temp_path' : str,
 	'jobs_path' : str,
+	'face_cache_path' : str,
 	'source_paths' : List[str],
 	'target_path' : str,
 	'output_path' : str,
@@ -449,6 +531,8 @@ State = TypedDict('State',
 	'output_video_quality' : int,
 	'output_video_scale' : Scale,
 	'output_video_fps' : float,
+	'output_video_segment_count' : int,
+	'output_video_segment_duration' : int,
 	'workflow_mode' : WorkflowMode,
 	'workflow_strategy' : WorkflowStrategy,
 	'processors' : List[str],
@@ -458,7 +542,11 @@ State = TypedDict('State',
 	'execution_device_ids' : List[int],
 	'execution_providers' : List[ExecutionProvider],
 	'execution_thread_count' : int,
+	'execution_process_count' : int,
+	'execution_thread_budget' : int,
+	'execution_replica_count' : int,
 	'video_memory_strategy' : VideoMemoryStrategy,
+	'face_store_memory_limit' : int,
 	'log_level' : LogLevel,
 	'halt_on_error' : bool,
 	'job_id' : str,
@@ -1,32 +1,48 @@
+import bisect
 import hashlib
+import os
+import threading
 import uuid
 from io import BufferedReader
 from typing import Optional, cast
 
 import numpy
 
-from facefusion import ffmpeg, ffprobe, frame_store, vision
+from facefusion import face_cache, face_store, ffmpeg, ffprobe, frame_pool, frame_store, state_manager, vision
 from facefusion.common_helper import get_first, get_last
-from facefusion.types import Fps, Resolution, VideoPoolSet, VideoReader, VideoWriter, VisionFrame, VisionFrameSet
+from facefusion.hash_helper import create_static_file_hash
+from facefusion.temp_helper import get_temp_file_path, get_temp_segment_path
+from facefusion.types import Fps, Resolution, VideoDecoder, VideoPoolSet, VideoReader, VideoWriter, VisionFrame, VisionFrameSet, VisionKey
 
 VIDEO_POOL_SET : VideoPoolSet =\
 {
 	'reader': {},
+	'decoder': {},
 	'writer': {}
 }
+VIDEO_POOL_LOCK : threading.Lock = threading.Lock()
 
 
-def get_reader(video_path : str, context : str) -> VideoReader:
-	reader_id = hashlib.sha1((video_path + '_' + context).encode()).hexdigest()
+def get_reader(video_path : str, context : str, video_resolution : Optional[Resolution] = None) -> VideoReader:
+	reader_context = context
+
+	if video_resolution:
+		reader_context = context + '_' + vision.pack_resolution(video_resolution)
+
+	reader_id = hashlib.sha1((video_path + '_' + reader_context).encode()).hexdigest()
 
 	if reader_id not in VIDEO_POOL_SET.get('reader'):
-		video_metadata = ffprobe.extract_static_video_metadata(video_path)
+		video_metadata = ffprobe.extract_static_video_metadata(video_path).copy()
+
+		if video_resolution:
+			video_metadata['resolution'] = video_resolution
 
+		face_cache.register_frame_total(create_static_file_hash(video_path), video_metadata.get('frame_total'))
 		VIDEO_POOL_SET['reader'][reader_id] =\
 		{
 			'id': reader_id,
 			'file_path': video_path,
-			'process': ffmpeg.create_video_reader(video_path, 0, video_metadata),
+			'process': ffmpeg.create_video_reader(video_path, 0, video_metadata, resolve_reader_thread_count()),
 			'metadata': video_metadata,
 			'frame_number': 0
 		}
@@ -34,23 +50,38 @@ def get_reader(video_path : str, context : str) -> VideoReader:
 	return VIDEO_POOL_SET.get('reader').get(reader_id)
 
 
+def resolve_reader_thread_count() -> int:
+	execution_thread_budget = state_manager.get_item('execution_thread_budget') or os.cpu_count() or 1
+	reader_total = max(state_manager.get_item('output_video_segment_count') or 1, state_manager.get_item('execution_process_count') or 1)
+	return max(execution_thread_budget // reader_total, 1)
+
+
 def conditional_seek_video_reader(video_reader : VideoReader, frame_number : int = 0) -> None:
 	frame_total = video_reader.get('metadata').get('frame_total')
 	frame_number = min(frame_total - 1, frame_number)
 	skip_total = frame_number - video_reader.get('frame_number')
-	skip_margin = 128
+	skip_margin = 16
 
-	if 0 < skip_total <= skip_margin:
+	if 0 < skip_total and (skip_total <= skip_margin or resolve_keyframe_number(video_reader.get('file_path'), frame_number) <= video_reader.get('frame_number')):
 		drain_video_reader(video_reader, skip_total)
 
 	if not video_reader.get('frame_number') == frame_number:
 		seek_video_reader(video_reader, frame_number)
 
 
+def resolve_keyframe_number(video_path : str, frame_number : int) -> int:
+	keyframe_numbers = ffprobe.extract_static_video_keyframes(video_path)
+	keyframe_index = bisect.bisect_right(keyframe_numbers, frame_number)
+
+	if keyframe_index > 0:
+		return keyframe_numbers[keyframe_index - 1]
+	return frame_number
+
+
 def seek_video_reader(video_reader : VideoReader, frame_number : int = 0) -> None:
 	close_video_reader(video_reader)
 
-	video_reader['process'] = ffmpeg.create_video_reader(video_reader.get('file_path'), frame_number, video_reader.get('metadata'))
+	video_reader['process'] = ffmpeg.create_video_reader(video_reader.get('file_path'), frame_number, video_reader.get('metadata'), resolve_reader_thread_count())
 	video_reader['frame_number'] = frame_number
 
 
@@ -68,14 +99,39 @@ def drain_video_reader(video_reader : VideoReader, skip_total : int) -> None:
 def read_video_frame(video_reader : VideoReader) -> Optional[VisionFrame]:
 	width, height = video_reader.get('metadata').get('resolution')
 	channel_total = 3
+	vision_frame = numpy.empty((height, width, channel_total), dtype = numpy.uint8)
+
+	if fill_video_frame(video_reader, vision_frame):
+		return vision_frame
+
+	return None
+
+
+def acquire_video_frame(video_reader : VideoReader) -> Optional[VisionFrame]:
+	width, height = video_reader.get('metadata').get('resolution')
+	channel_total = 3
+	vision_frame = frame_pool.acquire_frame(video_reader.get('id'), (height, width, channel_total))
+
+	if fill_video_frame(video_reader, vision_frame):
+		return vision_frame
+
+	frame_pool.release_frame(vision_frame)
+	return None
+
+
+def fill_video_frame(video_reader : VideoReader, vision_frame : VisionFrame) -> bool:
 	video_stream = cast(BufferedReader, video_reader.get('process').stdout)
-	vision_frame = numpy.empty(width * height * channel_total, numpy.uint8)
 
 	if video_stream.readinto(vision_frame) == vision_frame.size:
 		video_reader['frame_number'] = video_reader.get('frame_number') + 1
-		return vision_frame.reshape(height, width, channel_total)
+		return True
 
-	return None
+	return False
+
+
+def create_frame_vision_key(video_reader : VideoReader, frame_number : int) -> VisionKey:
+	video_hash = create_static_file_hash(video_reader.get('file_path'))
+	return video_hash + '_' + vision.pack_resolution(video_reader.get('metadata').get('resolution')) + '_' + str(frame_number)
 
 
 def read_video_frames(video_reader : VideoReader, frame_start : int, frame_end : int) -> VisionFrameSet:
@@ -92,7 +148,12 @@ def read_video_frames(video_reader : VideoReader, frame_start : int, frame_end :
 		collect_video_frames(video_reader, get_first(frame_gaps), get_last(frame_gaps))
 
 	frame_store.reduce_frames(reader_id, frame_start - keep_margin, frame_end + keep_margin)
-	return frame_store.select_frame_set(reader_id, frame_start, frame_end)
+	frame_set = frame_store.select_frame_set(reader_id, frame_start, frame_end)
+
+	for vision_frame in frame_set.values():
+		frame_pool.retain_frame(vision_frame)
+
+	return frame_set
 
 
 def collect_video_frames(video_reader : VideoReader, frame_start : int, frame_end : int) -> None:
@@ -100,28 +161,171 @@ def collect_video_frames(video_reader : VideoReader, frame_start : int, frame_en
 	skip_total = frame_start - video_reader.get('frame_number')
 	skip_margin = 16
 
-	if skip_total < 0 or skip_total > skip_margin:
+	if skip_total < 0 or skip_total > skip_margin and resolve_keyframe_number(video_reader.get('file_path'), frame_start) > video_reader.get('frame_number'):
 		seek_video_reader(video_reader, frame_start)
 
 	for frame_number in range(video_reader.get('frame_number'), frame_end + 1):
-		vision_frame = read_video_frame(video_reader)
+		vision_frame = acquire_video_frame(video_reader)
 
 		if vision.is_vision_frame(vision_frame):
+			face_store.register_vision_key(vision_frame, create_frame_vision_key(video_reader, frame_number))
 			frame_store.set_frame(reader_id, frame_number, vision_frame)
 
 
+def get_decoder(video_path : str, context : str, video_resolution : Optional[Resolution] = None) -> VideoDecoder:
+	with VIDEO_POOL_LOCK:
+		video_reader = get_reader(video_path, context, video_resolution)
+		decoder_id = video_reader.get('id')
+
+		if decoder_id not in VIDEO_POOL_SET.get('decoder'):
+			VIDEO_POOL_SET['decoder'][decoder_id] =\
+			{
+				'id': decoder_id,
+				'reader': video_reader,
+				'thread': threading.Thread(target = run_video_decoder, args = (decoder_id,), daemon = True),
+				'condition': threading.Condition(),
+				'frame_start': 0,
+				'frame_total': video_reader.get('metadata').get('frame_total'),
+				'frame_buffer_total': resolve_frame_buffer_total(),
+				'request_total': 0,
+				'is_running': True
+			}
+			VIDEO_POOL_SET.get('decoder').get(decoder_id).get('thread').start()
+
+		return VIDEO_POOL_SET.get('decoder').get(decoder_id)
+
+
+def resolve_frame_buffer_total() -> int:
+	execution_thread_count = state_manager.get_item('execution_thread_count')
+
+	if execution_thread_count:
+		return execution_thread_count * 2 + 8
+	return 8
+
+
+def run_video_decoder(decoder_id : str) -> None:
+	video_decoder = VIDEO_POOL_SET.get('decoder').get(decoder_id)
+	video_reader = video_decoder.get('reader')
+	decoder_condition = video_decoder.get('condition')
+
+	while video_decoder.get('is_running'):
+		with decoder_condition:
+			frame_number = find_decoder_frame_gap(video_decoder)
+
+			if frame_number is None:
+				decoder_condition.wait()
+				continue
+
+		if not video_reader.get('frame_number') == frame_number:
+			conditional_seek_video_reader(video_reader, frame_number)
+
+		vision_frame = acquire_video_frame(video_reader)
+
+		with decoder_condition:
+			if vision.is_vision_frame(vision_frame):
+				face_store.register_vision_key(vision_frame, create_frame_vision_key(video_reader, frame_number))
+
+				if is_decoder_window(video_decoder, frame_number, frame_number):
+					frame_store.set_frame(decoder_id, frame_number, vision_frame)
+				else:
+					frame_pool.release_frame(vision_frame)
+			else:
+				video_decoder['frame_total'] = frame_number
+
+			decoder_condition.notify_all()
+
+
+def find_decoder_frame_gap(video_decoder : VideoDecoder) -> Optional[int]:
+	frame_set = frame_store.get_frame_store(video_decoder.get('id'))
+	frame_start = video_decoder.get('frame_start')
+	frame_end = min(frame_start + video_decoder.get('frame_buffer_total'), video_decoder.get('frame_total'))
+
+	for frame_number in range(frame_start, frame_end):
+		if frame_number not in frame_set:
+			return frame_number
+
+	return None
+
+
+def has_decoder_frames(video_decoder : VideoDecoder, frame_start : int, frame_end : int) -> bool:
+	frame_set = frame_store.get_frame_store(video_decoder.get('id'))
+
+	for frame_number in range(frame_start, min(frame_end + 1, video_decoder.get('frame_total'))):
+		if frame_number not in frame_set:
+			return False
+
+	return True
+
+
+def is_decoder_window(video_decoder : VideoDecoder, frame_start : int, frame_end : int) -> bool:
+	window_start = video_decoder.get('frame_start')
+	window_end = window_start + video_decoder.get('frame_buffer_total') - 1
+	return window_start <= frame_start and min(frame_end, video_decoder.get('frame_total') - 1) <= window_end
+
+
+def move_decoder_window(video_decoder : VideoDecoder, frame_start : int, frame_end : int) -> None:
+	decoder_id = video_decoder.get('id')
+	frame_buffer_total = video_decoder.get('frame_buffer_total')
+
+	if frame_start < video_decoder.get('frame_start') or frame_start >= video_decoder.get('frame_start') + frame_buffer_total:
+		video_decoder['frame_start'] = frame_start
+	else:
+		video_decoder['frame_start'] = frame_end - frame_buffer_total + 1
+
+	frame_store.reduce_frames(decoder_id, video_decoder.get('frame_start'), video_decoder.get('frame_start') + frame_buffer_total - 1)
+
+
+def read_decoder_frames(video_decoder : VideoDecoder, frame_start : int, frame_end : int) -> VisionFrameSet:
+	decoder_condition = video_decoder.get('condition')
+
+	with decoder_condition:
+		video_decoder['frame_buffer_total'] = max(video_decoder.get('frame_buffer_total'), frame_end - frame_start + 1)
+
+		while not has_decoder_frames(video_decoder, frame_start, frame_end):
+			if is_decoder_window(video_decoder, frame_start, frame_end):
+				video_decoder['request_total'] += 1
+				decoder_condition.notify_all()
+				decoder_condition.wait()
+				video_decoder['request_total'] -= 1
+				decoder_condition.notify_all()
+			elif video_decoder.get('request_total') == 0:
+				move_decoder_window(video_decoder, frame_start, frame_end)
+			else:
+				decoder_condition.wait()
+
+		frame_set = frame_store.select_frame_set(video_decoder.get('id'), frame_start, frame_end)
+
+		for vision_frame in frame_set.values():
+			frame_pool.retain_frame(vision_frame)
+
+		return frame_set
+
+
+def stop_video_decoder(video_decoder : VideoDecoder) -> None:
+	with video_decoder.get('condition'):
+		video_decoder['is_running'] = False
+		video_decoder.get('condition').notify_all()
+
+	video_decoder.get('thread').join()
+
+
 def close_video_reader(video_reader : VideoReader) -> None:
 	video_reader.get('process').kill()
 	video_reader.get('process').wait()
 
 
-def get_writer(video_path : str, temp_video_fps : Fps, temp_video_resolution : Resolution, output_video_resolution : Resolution, output_video_fps : Fps) -> VideoWriter:
-	if video_path not in VIDEO_POOL_SET.get('writer'):
-		VIDEO_POOL_SET['writer'][video_path] =\
+def get_writer(video_path : str, temp_video_fps : Fps, temp_video_resolution : Resolution, output_video_resolution : Resolution, output_video_fps : Fps, segment_index : Optional[int] = None) -> VideoWriter:
+	temp_video_path = get_temp_file_path(video_path)
+
+	if isinstance(segment_index, int):
+		temp_video_path = get_temp_segment_path(video_path, segment_index)
+
+	if temp_video_path not in VIDEO_POOL_SET.get('writer'):
+		VIDEO_POOL_SET['writer'][temp_video_path] =\
 		{
 			'id': uuid.uuid4().hex,
 			'file_path': video_path,
-			'process': ffmpeg.create_video_writer(video_path, temp_video_fps, temp_video_resolution, output_video_resolution, output_video_fps),
+			'process': ffmpeg.create_video_writer(temp_video_path, temp_video_fps, temp_video_resolution, output_video_resolution, output_video_fps),
 			'metadata':
 			{
 				'fps': output_video_fps,
@@ -129,7 +333,7 @@ def get_writer(video_path : str, temp_video_fps : Fps, temp_video_resolution : R
 			}
 		}
 
-	return VIDEO_POOL_SET.get('writer').get(video_path)
+	return VIDEO_POOL_SET.get('writer').get(temp_video_path)
 
 
 def write_video_frame(video_writer : VideoWriter, vision_frame : VisionFrame) -> None:
@@ -144,6 +348,9 @@ def close_video_writer(video_writer : VideoWriter) -> bool:
 
 
 def clear_video_pool() -> None:
+	for video_decoder in VIDEO_POOL_SET.get('decoder').values():
+		stop_video_decoder(video_decoder)
+
 	for video_reader in VIDEO_POOL_SET.get('reader').values():
 		close_video_reader(video_reader)
 		frame_store.clear_frames(video_reader.get('id'))
@@ -152,4 +359,6 @@ def clear_video_pool() -> None:
 		close_video_writer(video_writer)
 
 	VIDEO_POOL_SET['reader'].clear()
+	VIDEO_POOL_SET['decoder'].clear()
 	VIDEO_POOL_SET['writer'].clear()
+	frame_pool.clear_frame_pool()
@@ -6,10 +6,10 @@ import cv2
 import numpy
 from cv2.typing import Size
 
-from facefusion import ffprobe, video_manager
+from facefusion import ffprobe, frame_pool, video_manager
 from facefusion.common_helper import is_windows
 from facefusion.filesystem import get_file_extension, is_image, is_video
-from facefusion.thread_helper import thread_lock, thread_semaphore
+from facefusion.thread_helper import thread_semaphore
 from facefusion.types import ColorMode, Duration, Fps, Mask, Orientation, Resolution, Scale, VisionFrame
 
 
@@ -86,27 +86,45 @@ def read_video_frame(video_path : str, frame_number : int = 0) -> Optional[Visio
 	return None
 
 
-def select_video_frames(video_path : str, frame_number : int = 0, frame_offset : int = 2) -> List[VisionFrame]:
+def select_video_frames(video_path : str, frame_number : int = 0, frame_offset : int = 2, video_resolution : Optional[Resolution] = None, context : str = 'select_video_frames') -> List[VisionFrame]:
 	vision_frames = []
 	frame_start = frame_number - frame_offset
 	frame_end = frame_number + frame_offset
 
 	if is_video(video_path):
-		with thread_lock():
-			video_reader = video_manager.get_reader(video_path, 'select_video_frames')
-			frame_set = video_manager.read_video_frames(video_reader, max(frame_start, 0), frame_end)
+		video_decoder = video_manager.get_decoder(video_path, context, video_resolution)
+		frame_set = video_manager.read_decoder_frames(video_decoder, max(frame_start, 0), frame_end)
 
-			for frame_number in range(frame_start, frame_end + 1):
-				vision_frame = create_empty_vision_frame()
+		for frame_number in range(frame_start, frame_end + 1):
+			vision_frame = create_empty_vision_frame()
 
-				if frame_number in frame_set:
-					vision_frame = frame_set.get(frame_number)
+			if frame_number in frame_set:
+				vision_frame = frame_set.get(frame_number)
 
-				vision_frames.append(vision_frame)
+			vision_frames.append(vision_frame)
 
 	return vision_frames
 
 
+def select_video_frame_range(video_path : str, frame_start : int, frame_end : int, video_resolution : Optional[Resolution] = None, context : str = 'select_video_frame_range') -> List[VisionFrame]:
+	vision_frames = []
+
+	if is_video(video_path):
+		video_decoder = video_manager.get_decoder(video_path, context, video_resolution)
+		frame_set = video_manager.read_decoder_frames(video_decoder, max(frame_start, 0), frame_end)
+
+		for frame_number in range(frame_start, frame_end + 1):
+			if frame_number in frame_set:
+				vision_frames.append(frame_set.get(frame_number))
+
+	return vision_frames
+
+
+def release_video_frames(vision_frames : List[VisionFrame]) -> None:
+	for vision_frame in vision_frames:
+		frame_pool.release_frame(vision_frame)
+
+
 def count_video_frame_total(video_path : str) -> int:
 	if is_video(video_path):
 		return ffprobe.extract_static_video_metadata(video_path).get('frame_total')
@@ -170,6 +188,15 @@ def restrict_trim_frame(video_path : str, trim_frame_start : Optional[int], trim
 	return 0, video_frame_total
 
 
+def split_frame_range(frame_start : int, frame_end : int, segment_frame_total : int) -> List[range]:
+	frame_ranges = []
+
+	for segment_start in range(frame_start, frame_end, max(segment_frame_total, 1)):
+		frame_ranges.append(range(segment_start, min(segment_start + segment_frame_total, frame_end)))
+
+	return frame_ranges
+
+
 def detect_video_resolution(video_path : str) -> Optional[Resolution]:
 	if is_video(video_path):
 		return ffprobe.extract_static_video_metadata(video_path).get('resolution')
@@ -314,44 +341,25 @@ def is_vision_frame(vision_frame : VisionFrame) -> bool:
 	return numpy.ndim(vision_frame) == 3
 
 
-def create_tile_frames(vision_frame : VisionFrame, size : Size) -> Tuple[List[VisionFrame], int, int]:
+def create_tile_frames(vision_frame : VisionFrame, size : Size) -> Tuple[VisionFrame, int, int]:
 	tile_width = size[0] - 2 * size[2]
 	pad_size_top = size[1] + size[2]
 	pad_size_bottom = pad_size_top + tile_width - (vision_frame.shape[0] + 2 * size[1]) % tile_width
 	pad_size_right = pad_size_top + tile_width - (vision_frame.shape[1] + 2 * size[1]) % tile_width
 	pad_vision_frame = numpy.pad(vision_frame, ((pad_size_top, pad_size_bottom), (pad_size_top, pad_size_right), (0, 0)))
 	pad_height, pad_width = pad_vision_frame.shape[:2]
-	row_range = range(size[2], pad_height - size[2], tile_width)
-	col_range = range(size[2], pad_width - size[2], tile_width)
-	tile_vision_frames = []
-
-	for row_vision_frame in row_range:
-		top = row_vision_frame - size[2]
-		bottom = row_vision_frame + size[2] + tile_width
-
-		for column_vision_frame in col_range:
-			left = column_vision_frame - size[2]
-			right = column_vision_frame + size[2] + tile_width
-			tile_vision_frames.append(pad_vision_frame[top:bottom, left:right, :])
-
+	tile_vision_frames = numpy.lib.stride_tricks.sliding_window_view(pad_vision_frame, (size[0], size[0]), axis = (0, 1))[::tile_width, ::tile_width]
+	tile_vision_frames = tile_vision_frames.transpose(0, 1, 3, 4, 2).reshape(-1, size[0], size[0], pad_vision_frame.shape[2])
 	return tile_vision_frames, pad_width, pad_height
 
 
-def merge_tile_frames(tile_vision_frames : List[VisionFrame], temp_width : int, temp_height : int, pad_width : int, pad_height : int, size : Size) -> VisionFrame:
-	merge_vision_frame = numpy.zeros((pad_height, pad_width, 3)).astype(numpy.uint8)
-	tile_width = tile_vision_frames[0].shape[1] - 2 * size[2]
-	tiles_per_row = min(pad_width // tile_width, len(tile_vision_frames))
-
-	for index, tile_vision_frame in enumerate(tile_vision_frames):
-		tile_vision_frame = tile_vision_frame[size[2]:-size[2], size[2]:-size[2]]
-		row_index = index // tiles_per_row
-		col_index = index % tiles_per_row
-		top = row_index * tile_vision_frame.shape[0]
-		bottom = top + tile_vision_frame.shape[0]
-		left = col_index * tile_vision_frame.shape[1]
-		right = left + tile_vision_frame.shape[1]
-		merge_vision_frame[top:bottom, left:right, :] = tile_vision_frame
-
+def merge_tile_frames(tile_vision_frames : VisionFrame, temp_width : int, temp_height : int, pad_width : int, pad_height : int, size : Size) -> VisionFrame:
+	tile_width = tile_vision_frames.shape[2] - 2 * size[2]
+	tile_total_y = (pad_height - 2 * size[2]) // tile_width
+	tile_total_x = (pad_width - 2 * size[2]) // tile_width
+	merge_vision_frame = tile_vision_frames[:, size[2]:size[2] + tile_width, size[2]:size[2] + tile_width]
+	merge_vision_frame = merge_vision_frame.reshape(tile_total_y, tile_total_x, tile_width, tile_width, -1).transpose(0, 2, 1, 3, 4)
+	merge_vision_frame = merge_vision_frame.reshape(tile_total_y * tile_width, tile_total_x * tile_width, -1)
 	merge_vision_frame = merge_vision_frame[size[1] : size[1] + temp_height, size[1]: size[1] + temp_width, :]
 	return merge_vision_frame
 
@@ -7,8 +7,7 @@ import scipy
 from facefusion import inference_manager, state_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.filesystem import resolve_relative_path
-from facefusion.thread_helper import thread_semaphore
-from facefusion.types import Audio, AudioChunk, DownloadScope, DownloadSet, InferencePool, ModelSet, Voice, VoiceChunk
+from facefusion.types import Audio, AudioChunk, DownloadScope, DownloadSet, InferenceLimitSet, InferencePool, ModelSet, Voice, VoiceChunk
 
 
 @lru_cache()
@@ -105,6 +104,13 @@ def clear_inference_pool() -> None:
 	inference_manager.clear_inference_pool(__name__, model_names)
 
 
+def adjust_inference_limits() -> InferenceLimitSet:
+	return\
+	{
+		state_manager.get_item('voice_extractor_model'): 1
+	}
+
+
 def collect_model_downloads() -> Tuple[DownloadSet, DownloadSet]:
 	model_set = create_static_model_set('full')
 	model_hash_set = {}
@@ -152,11 +158,10 @@ def extract_voice(temp_audio_chunk : AudioChunk) -> VoiceChunk:
 def forward(temp_audio_chunk : AudioChunk) -> AudioChunk:
 	voice_extractor = get_inference_pool().get(state_manager.get_item('voice_extractor_model'))
 
-	with thread_semaphore():
-		temp_audio_chunk = voice_extractor.run(None,
-		{
-			'input': temp_audio_chunk
-		})[0]
+	temp_audio_chunk = inference_manager.run_inference(voice_extractor,
+	{
+		'input': temp_audio_chunk
+	})[0]
 
 	return temp_audio_chunk
 
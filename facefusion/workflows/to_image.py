@@ -4,7 +4,7 @@ from facefusion.processors.core import get_processors_modules
 from facefusion.temp_helper import get_temp_file_path
 from facefusion.time_helper import calculate_end_time
 from facefusion.types import ErrorCode
-from facefusion.vision import detect_image_resolution, pack_resolution, read_static_image, restrict_image_resolution, scale_resolution, write_image
+from facefusion.vision import detect_image_resolution, pack_resolution, read_image, release_video_frames, restrict_image_resolution, scale_resolution, write_image
 from facefusion.workflows.core import conditional_get_target_vision_frames, is_process_stopping, process_temp_frame
 
 
@@ -31,8 +31,9 @@ def prepare_image() -> ErrorCode:
 def process_image() -> ErrorCode:
 	temp_image_path = get_temp_file_path(state_manager.get_item('target_path'))
 	target_vision_frames = conditional_get_target_vision_frames(0)
-	temp_vision_frame = read_static_image(temp_image_path, 'rgba')
+	temp_vision_frame = read_image(temp_image_path, 'rgba')
 	temp_vision_frame = process_temp_frame(target_vision_frames, temp_vision_frame, 0)
+	release_video_frames(target_vision_frames)
 	write_image(temp_image_path, temp_vision_frame)
 
 	for processor_module in get_processors_modules(state_manager.get_item('processors')):
@@ -1,19 +1,27 @@
+import math
+import multiprocessing
 from collections import deque
-from concurrent.futures import Future, ThreadPoolExecutor
-from typing import Deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import repeat
+from queue import Queue
+from typing import Deque, Dict, List, Optional, Tuple, Union
 
 import cv2
 import numpy
 from tqdm import tqdm
 
-from facefusion import content_analyser, ffmpeg, logger, process_manager, state_manager, translator, video_manager
+from facefusion import content_analyser, face_detector, face_store, ffmpeg, frame_pool, logger, process_manager, state_manager, translator, video_manager
 from facefusion.common_helper import get_first, get_middle
-from facefusion.filesystem import filter_audio_paths, is_video
+from facefusion.face_creator import analyse_static_faces
+from facefusion.filesystem import filter_audio_paths, is_file, is_video, move_file
+from facefusion.jobs import job_helper, job_manager
 from facefusion.processors.core import get_processors_modules
-from facefusion.temp_helper import move_temp_file, resolve_temp_frame_set
+from facefusion.processors.types import ProcessorState
+from facefusion.temp_helper import get_temp_file_path, get_temp_segment_path, move_temp_file, resolve_temp_frame_chunk, resolve_temp_frame_set
 from facefusion.time_helper import calculate_end_time
-from facefusion.types import ErrorCode, Resolution, VisionFrame
-from facefusion.vision import detect_video_resolution, pack_resolution, read_static_image, read_static_video_frame, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, scale_resolution, select_video_frames, write_image
+from facefusion.types import ErrorCode, Fps, FrameShape, Resolution, State, VideoWriter, VisionFrame
+from facefusion.vision import detect_video_resolution, extract_vision_mask, merge_vision_mask, pack_resolution, read_image, read_static_video_frame, release_video_frames, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, scale_resolution, select_video_frame_range, select_video_frames, split_frame_range, write_image
 from facefusion.workflows.core import conditional_get_target_vision_frames, is_process_stopping, process_temp_frame
 
 
@@ -42,18 +50,34 @@ def extract_frames() -> ErrorCode:
 	return 0
 
 
-def process_disk_frame(temp_frame_path : str, frame_number : int) -> bool:
+def process_disk_frame(temp_vision_frame : VisionFrame, frame_number : int) -> VisionFrame:
 	target_vision_frames = conditional_get_target_vision_frames(frame_number)
-	temp_vision_frame = read_static_image(temp_frame_path, 'rgba')
 	temp_vision_frame = process_temp_frame(target_vision_frames, temp_vision_frame, frame_number)
-	return write_image(temp_frame_path, temp_vision_frame)
+	release_video_frames(target_vision_frames)
+	return temp_vision_frame
 
 
-def process_disk_frames() -> ErrorCode:
-	temp_frame_set = resolve_temp_frame_set(state_manager.get_item('target_path'))
+def process_chunk_frame(temp_vision_frames : VisionFrame, frame_index : int, frame_number : int) -> bool:
+	target_vision_frames = conditional_get_target_vision_frames(frame_number)
+	temp_vision_frame = numpy.array(temp_vision_frames[frame_index])
+	temp_vision_frame = process_temp_frame(target_vision_frames, temp_vision_frame, frame_number)
+	release_video_frames(target_vision_frames)
 
-	if temp_frame_set:
-		with tqdm(total = len(temp_frame_set), desc = translator.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+	if temp_vision_frames.shape[3] == 4:
+		temp_vision_frame = merge_vision_mask(temp_vision_frame, extract_vision_mask(temp_vision_frame))
+
+	numpy.copyto(temp_vision_frames[frame_index], temp_vision_frame[:, :, :temp_vision_frames.shape[3]])
+	return True
+
+
+def process_chunk_frames() -> ErrorCode:
+	trim_frame_start, _ = restrict_trim_frame(state_manager.get_item('target_path'), state_manager.get_item('trim_frame_start'), state_manager.get_item('trim_frame_end'))
+	output_video_resolution = scale_resolution(detect_video_resolution(state_manager.get_item('target_path')), state_manager.get_item('output_video_scale'))
+	temp_video_width, temp_video_height = restrict_video_resolution(state_manager.get_item('target_path'), output_video_resolution)
+	temp_vision_frames = resolve_temp_frame_chunk(state_manager.get_item('target_path'), (temp_video_height, temp_video_width, resolve_temp_channel_total()))
+
+	if temp_vision_frames is not None:
+		with tqdm(total = len(temp_vision_frames), desc = translator.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
 			progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
 
 			read_static_video_frame(state_manager.get_item('target_path'), state_manager.get_item('reference_frame_number'))
@@ -61,8 +85,8 @@ def process_disk_frames() -> ErrorCode:
 			with ThreadPoolExecutor(max_workers = state_manager.get_item('execution_thread_count')) as executor:
 				futures : Deque[Future[bool]] = deque()
 
-				for frame_number, temp_frame_path in temp_frame_set.items():
-					future = executor.submit(process_disk_frame, temp_frame_path, frame_number)
+				for frame_index in range(len(temp_vision_frames)):
+					future = executor.submit(process_chunk_frame, temp_vision_frames, frame_index, trim_frame_start + frame_index)
 					futures.append(future)
 
 				while futures:
@@ -90,15 +114,78 @@ def process_disk_frames() -> ErrorCode:
 	return 0
 
 
-def process_memory_frame(frame_number : int, temp_video_resolution : Resolution) -> VisionFrame:
-	target_vision_frames = select_video_frames(state_manager.get_item('target_path'), frame_number, state_manager.get_item('target_frame_amount'))
+def process_disk_frames() -> ErrorCode:
+	if state_manager.get_item('temp_frame_format') == 'raw':
+		return process_chunk_frames()
+
+	temp_frame_set = resolve_temp_frame_set(state_manager.get_item('target_path'))
+
+	if temp_frame_set:
+		with tqdm(total = len(temp_frame_set), desc = translator.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+			progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
+
+			read_static_video_frame(state_manager.get_item('target_path'), state_manager.get_item('reference_frame_number'))
+
+			frame_buffer_total = state_manager.get_item('execution_thread_count') * 2
+
+			with ThreadPoolExecutor(max_workers = state_manager.get_item('execution_thread_count')) as io_executor, ThreadPoolExecutor(max_workers = state_manager.get_item('execution_thread_count')) as executor:
+				temp_frame_items : Deque[Tuple[int, str]] = deque(temp_frame_set.items())
+				read_futures : Deque[Tuple[int, str, Future[Optional[VisionFrame]]]] = deque()
+				process_futures : Deque[Tuple[str, Future[VisionFrame]]] = deque()
+				write_futures : Deque[Future[bool]] = deque()
+
+				while temp_frame_items or read_futures or process_futures or write_futures:
+					if is_process_stopping():
+
+						for _, _, read_future in read_futures:
+							read_future.cancel()
+						for _, process_future in process_futures:
+							process_future.cancel()
+
+						temp_frame_items.clear()
+						read_futures.clear()
+						process_futures.clear()
+						write_futures.clear()
+
+					while temp_frame_items and len(read_futures) < frame_buffer_total:
+						frame_number, temp_frame_path = temp_frame_items.popleft()
+						read_futures.append((frame_number, temp_frame_path, io_executor.submit(read_image, temp_frame_path, 'rgba')))
+
+					while read_futures and len(process_futures) < frame_buffer_total:
+						frame_number, temp_frame_path, read_future = read_futures.popleft()
+						process_futures.append((temp_frame_path, executor.submit(process_disk_frame, read_future.result(), frame_number)))
+
+					if process_futures:
+						temp_frame_path, process_future = process_futures.popleft()
+						write_futures.append(io_executor.submit(write_image, temp_frame_path, process_future.result()))
+
+					while write_futures and (write_futures[0].done() or len(write_futures) >= frame_buffer_total or not process_futures):
+						write_futures.popleft().result()
+						progress.update()
+
+		for processor_module in get_processors_modules(state_manager.get_item('processors')):
+			processor_module.post_process()
+
+		if is_process_stopping():
+			return 4
+	else:
+		logger.error(translator.get('temp_frames_not_found'), __name__)
+		return 1
+	return 0
+
+
+def process_memory_frame(frame_number : int, temp_video_resolution : Resolution, segment_slot : int = 0) -> VisionFrame:
+	target_vision_frames = select_video_frames(state_manager.get_item('target_path'), frame_number, state_manager.get_item('target_frame_amount'), temp_video_resolution, 'select_video_frames_' + str(segment_slot))
 	target_vision_frame = get_middle(target_vision_frames)
-	temp_vision_frame = target_vision_frame.copy()
+	temp_video_width, temp_video_height = temp_video_resolution
+	pool_vision_frame = frame_pool.acquire_frame('process_memory_frame', (temp_video_height, temp_video_width, target_vision_frame.shape[2]))
 
-	if not (target_vision_frame.shape[1], target_vision_frame.shape[0]) == temp_video_resolution:
-		temp_vision_frame = cv2.resize(target_vision_frame, temp_video_resolution)
+	if (target_vision_frame.shape[1], target_vision_frame.shape[0]) == temp_video_resolution:
+		numpy.copyto(pool_vision_frame, target_vision_frame)
+	else:
+		cv2.resize(target_vision_frame, temp_video_resolution, dst = pool_vision_frame)
 
-	temp_vision_frame = process_temp_frame(target_vision_frames, temp_vision_frame, frame_number)
+	temp_vision_frame = process_temp_frame(target_vision_frames, pool_vision_frame, frame_number)
 
 	if state_manager.get_item('temp_pixel_format') == 'bgra':
 		temp_vision_frame = cv2.cvtColor(temp_vision_frame, cv2.COLOR_BGR2BGRA)
@@ -106,7 +193,252 @@ def process_memory_frame(frame_number : int, temp_video_resolution : Resolution)
 	if state_manager.get_item('temp_pixel_format') == 'bgr24':
 		temp_vision_frame = temp_vision_frame[:, :, :3]
 
-	return numpy.ascontiguousarray(temp_vision_frame)
+	temp_vision_frame = numpy.ascontiguousarray(temp_vision_frame)
+	frame_pool.retain_frame(temp_vision_frame)
+	frame_pool.release_frame(pool_vision_frame)
+	release_video_frames(target_vision_frames)
+	return temp_vision_frame
+
+
+def analyse_memory_frames(window_start : int, frame_start : int, frame_end : int, temp_video_resolution : Resolution, segment_slot : int = 0) -> None:
+	window_start = min(max(window_start, 0), frame_start)
+	target_vision_frames = select_video_frame_range(state_manager.get_item('target_path'), window_start, frame_end, temp_video_resolution, 'select_video_frames_' + str(segment_slot))
+	analyse_static_faces(target_vision_frames[frame_start - window_start:])
+	release_video_frames(target_vision_frames)
+
+
+def process_memory_frame_chunk(frame_start : int, frame_end : int, temp_video_resolution : Resolution, segment_slot : int, shared_memory_name : str, frame_shape : FrameShape) -> int:
+	frame_buffer = frame_pool.attach_frame_buffer(shared_memory_name, frame_shape)
+	executor = get_process_thread_executor()
+	analyse_future = None
+
+	if has_face_analysis():
+		analyse_future = executor.submit(analyse_memory_frames, frame_start - state_manager.get_item('target_frame_amount'), frame_start, frame_end - 1, temp_video_resolution, segment_slot)
+
+	for frame_index, temp_vision_frame in enumerate(executor.map(process_memory_frame, range(frame_start, frame_end), repeat(temp_video_resolution), repeat(segment_slot))):
+		numpy.copyto(frame_buffer.get('vision_frame')[frame_index], temp_vision_frame)
+		frame_pool.release_frame(temp_vision_frame)
+
+	if analyse_future:
+		analyse_future.result()
+
+	frame_pool.detach_frame_buffer(frame_buffer)
+	return frame_end - frame_start
+
+
+def write_memory_frame_chunk(video_writer : VideoWriter, vision_frames : VisionFrame, frame_total : int) -> None:
+	for vision_frame in vision_frames[:frame_total]:
+		video_manager.write_video_frame(video_writer, vision_frame)
+
+	frame_pool.release_frame(vision_frames)
+
+
+def init_process_worker(state : Union[State, ProcessorState]) -> None:
+	for key, value in state.items():
+		state_manager.init_item(key, value)
+
+	logger.init(state_manager.get_item('log_level'))
+
+
+@lru_cache()
+def get_process_thread_executor() -> ThreadPoolExecutor:
+	return ThreadPoolExecutor(max_workers = state_manager.get_item('execution_thread_count'))
+
+
+def has_face_analysis() -> bool:
+	return any(face_detector in processor_module.get_common_modules() for processor_module in get_processors_modules(state_manager.get_item('processors')))
+
+
+def resolve_temp_channel_total() -> int:
+	if state_manager.get_item('temp_pixel_format') == 'bgra':
+		return 4
+	return 3
+
+
+def create_process_executors() -> List[ProcessPoolExecutor]:
+	process_executors = []
+
+	if state_manager.get_item('execution_process_count') > 1:
+		for _ in range(state_manager.get_item('execution_process_count')):
+			process_executors.append(ProcessPoolExecutor(max_workers = 1, mp_context = multiprocessing.get_context('spawn'), initializer = init_process_worker, initargs = (state_manager.get_state(),)))
+
+	return process_executors
+
+
+def shutdown_process_executors(process_executors : List[ProcessPoolExecutor]) -> None:
+	for process_executor in process_executors:
+		process_executor.shutdown(cancel_futures = True)
+
+
+def process_memory_frame_chunks(process_executors : List[ProcessPoolExecutor], video_writer : VideoWriter, progress : tqdm, temp_frame_range : range, temp_video_resolution : Resolution, segment_slot : int) -> None:
+	temp_video_width, temp_video_height = temp_video_resolution
+	temp_channel_total = resolve_temp_channel_total()
+	process_ahead_total = len(process_executors) * 2
+	process_frame_total = max(resolve_frame_window_total(temp_video_width * temp_video_height * temp_channel_total) // process_ahead_total, 1)
+	frame_shape = (process_frame_total, temp_video_height, temp_video_width, temp_channel_total)
+	futures : Deque[Tuple[Future[int], VisionFrame]] = deque()
+
+	for chunk_index, frame_start in enumerate(range(temp_frame_range.start, temp_frame_range.stop, process_frame_total)):
+		if is_process_stopping():
+			break
+
+		frame_end = min(frame_start + process_frame_total, temp_frame_range.stop)
+		process_executor = process_executors[chunk_index % len(process_executors)]
+		vision_frames = frame_pool.acquire_frame('process_memory_frame_chunk', frame_shape, True)
+		future = process_executor.submit(process_memory_frame_chunk, frame_start, frame_end, temp_video_resolution, segment_slot, frame_pool.get_shared_memory_name(vision_frames), frame_shape)
+		futures.append((future, vision_frames))
+
+		while len(futures) >= process_ahead_total or futures and futures[0][0].done():
+			future, vision_frames = futures.popleft()
+			frame_total = future.result()
+			write_memory_frame_chunk(video_writer, vision_frames, frame_total)
+			progress.update(frame_total)
+
+	while futures:
+		future, vision_frames = futures.popleft()
+
+		if is_process_stopping():
+
+			for pending_future, _ in futures:
+				pending_future.cancel()
+
+			futures.clear()
+
+		else:
+			frame_total = future.result()
+			write_memory_frame_chunk(video_writer, vision_frames, frame_total)
+			progress.update(frame_total)
+
+
+def resolve_frame_window_total(frame_size : int) -> int:
+	execution_thread_count = state_manager.get_item('execution_thread_count')
+	frame_window_memory = 4096 * 1024 * 1024
+
+	if state_manager.get_item('video_memory_strategy') == 'moderate':
+		frame_window_memory = 1024 * 1024 * 1024
+	if state_manager.get_item('video_memory_strategy') == 'strict':
+		frame_window_memory = 256 * 1024 * 1024
+
+	return max(min(execution_thread_count * 4, frame_window_memory // max(frame_size, 1)), execution_thread_count)
+
+
+def process_memory_frame_range(process_executors : List[ProcessPoolExecutor], video_writer : VideoWriter, progress : tqdm, temp_frame_range : range, temp_video_resolution : Resolution, segment_slot : int) -> None:
+	analyse_frame_total = state_manager.get_item('execution_thread_count')
+	analyse_frame_cursor = temp_frame_range.start
+
+	if process_executors:
+		process_memory_frame_chunks(process_executors, video_writer, progress, temp_frame_range, temp_video_resolution, segment_slot)
+	else:
+		with ThreadPoolExecutor(max_workers = 1) as analyse_executor, ThreadPoolExecutor(max_workers = state_manager.get_item('execution_thread_count')) as executor:
+			analyse_futures : Deque[Future[None]] = deque()
+			futures : Deque[Future[VisionFrame]] = deque()
+			frame_window_total = state_manager.get_item('execution_thread_count')
+
+			for frame_number in temp_frame_range:
+				if is_process_stopping():
+					break
+
+				while analyse_futures and analyse_futures[0].done():
+					analyse_futures.popleft().result()
+
+				analyse_frame_cursor = max(analyse_frame_cursor, frame_number)
+
+				if has_face_analysis() and analyse_frame_cursor < min(frame_number + frame_window_total, temp_frame_range.stop):
+					analyse_frame_end = min(analyse_frame_cursor + analyse_frame_total, temp_frame_range.stop)
+					analyse_future = analyse_executor.submit(analyse_memory_frames, frame_number - len(futures) - state_manager.get_item('target_frame_amount'), analyse_frame_cursor, analyse_frame_end - 1, temp_video_resolution, segment_slot)
+					analyse_futures.append(analyse_future)
+					analyse_frame_cursor = analyse_frame_end
+
+				future = executor.submit(process_memory_frame, frame_number, temp_video_resolution, segment_slot)
+				futures.append(future)
+
+				while futures and (futures[0].done() or len(futures) >= frame_window_total):
+					temp_vision_frame = futures.popleft().result()
+					frame_window_total = resolve_frame_window_total(temp_vision_frame.nbytes)
+					video_manager.write_video_frame(video_writer, temp_vision_frame)
+					frame_pool.release_frame(temp_vision_frame)
+					progress.update()
+
+			for analyse_future in analyse_futures:
+				analyse_future.cancel()
+
+			while futures:
+				future = futures.popleft()
+
+				if is_process_stopping():
+
+					for pending_future in futures:
+						pending_future.cancel()
+
+					futures.clear()
+
+				else:
+					temp_vision_frame = future.result()
+					video_manager.write_video_frame(video_writer, temp_vision_frame)
+					frame_pool.release_frame(temp_vision_frame)
+					progress.update()
+
+
+def resolve_segment_frame_total(temp_frame_range : range, temp_video_fps : Fps) -> int:
+	segment_frame_total = math.ceil(len(temp_frame_range) / state_manager.get_item('output_video_segment_count'))
+
+	if has_segment_checkpoints():
+		return max(min(segment_frame_total, round(state_manager.get_item('output_video_segment_duration') * temp_video_fps)), 1)
+	return segment_frame_total
+
+
+def has_segment_checkpoints() -> bool:
+	return bool(state_manager.get_item('output_video_segment_duration') and state_manager.get_item('job_id') and isinstance(state_manager.get_item('step_index'), int))
+
+
+def has_segment_checkpoint(segment_frame_range : range) -> bool:
+	if has_segment_checkpoints():
+		for step_segment in job_manager.get_step_segments(state_manager.get_item('job_id'), state_manager.get_item('step_index')):
+			if step_segment.get('frame_start') == segment_frame_range.start and step_segment.get('frame_end') == segment_frame_range.stop and is_file(step_segment.get('path')):
+				return True
+	return False
+
+
+def get_segment_path(segment_index : int, segment_frame_range : range) -> str:
+	if has_segment_checkpoints():
+		step_segment_path = job_helper.get_step_segment_path(state_manager.get_item('job_id'), state_manager.get_item('step_index'), segment_frame_range.start, segment_frame_range.stop, state_manager.get_item('output_path'))
+
+		if step_segment_path:
+			return step_segment_path
+	return get_temp_segment_path(state_manager.get_item('target_path'), segment_index)
+
+
+def commit_segment_checkpoint(segment_index : int, segment_frame_range : range) -> bool:
+	temp_segment_path = get_temp_segment_path(state_manager.get_item('target_path'), segment_index)
+	segment_path = get_segment_path(segment_index, segment_frame_range)
+
+	if not segment_path == temp_segment_path and move_file(temp_segment_path, segment_path):
+		return job_manager.add_step_segment(state_manager.get_item('job_id'), state_manager.get_item('step_index'),
+		{
+			'frame_start': segment_frame_range.start,
+			'frame_end': segment_frame_range.stop,
+			'path': segment_path
+		})
+	return False
+
+
+def process_memory_segment(segment_index : Optional[int], segment_frame_range : range, segment_slots : Queue[int], process_executors : List[ProcessPoolExecutor], progress : tqdm, temp_video_fps : Fps, temp_video_resolution : Resolution, output_video_resolution : Resolution) -> bool:
+	if not process_manager.is_processing():
+		return True
+
+	segment_slot = segment_slots.get()
+
+	try:
+		video_writer = video_manager.get_writer(state_manager.get_item('target_path'), temp_video_fps, temp_video_resolution, output_video_resolution, state_manager.get_item('output_video_fps'), segment_index)
+
+		try:
+			process_memory_frame_range(process_executors, video_writer, progress, segment_frame_range, temp_video_resolution, segment_slot)
+		finally:
+			is_segment_written = video_manager.close_video_writer(video_writer)
+
+	finally:
+		segment_slots.put(segment_slot)
+	return is_segment_written
 
 
 def process_memory_frames() -> ErrorCode:
@@ -117,36 +449,61 @@ def process_memory_frames() -> ErrorCode:
 	temp_frame_range = range(trim_frame_start, trim_frame_end)
 
 	if temp_frame_range:
-		video_writer = video_manager.get_writer(state_manager.get_item('target_path'), temp_video_fps, temp_video_resolution, output_video_resolution, state_manager.get_item('output_video_fps'))
+		temp_frame_ranges = split_frame_range(trim_frame_start, trim_frame_end, resolve_segment_frame_total(temp_frame_range, temp_video_fps))
+		has_segments = len(temp_frame_ranges) > 1 or has_segment_checkpoints()
+		segment_slots : Queue[int] = Queue()
+
+		for segment_slot in range(state_manager.get_item('output_video_segment_count')):
+			segment_slots.put(segment_slot)
 
 		with tqdm(total = len(temp_frame_range), desc = translator.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
 			progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
 
 			read_static_video_frame(state_manager.get_item('target_path'), state_manager.get_item('reference_frame_number'))
 
-			with ThreadPoolExecutor(max_workers = state_manager.get_item('execution_thread_count')) as executor:
-				futures : Deque[Future[VisionFrame]] = deque()
+			process_executors = create_process_executors()
 
-				for frame_number in temp_frame_range:
-					future = executor.submit(process_memory_frame, frame_number, temp_video_resolution)
-					futures.append(future)
+			try:
+				with ThreadPoolExecutor(max_workers = state_manager.get_item('output_video_segment_count')) as segment_executor:
+					segment_futures : Dict[Future[bool], int] = {}
 
-				while futures:
-					future = futures.popleft()
+					for segment_index, segment_frame_range in enumerate(temp_frame_ranges):
+						if has_segment_checkpoint(segment_frame_range):
+							progress.update(len(segment_frame_range))
+						elif has_segments:
+							segment_futures[segment_executor.submit(process_memory_segment, segment_index, segment_frame_range, segment_slots, process_executors, progress, temp_video_fps, temp_video_resolution, output_video_resolution)] = segment_index
+						else:
+							segment_futures[segment_executor.submit(process_memory_segment, None, segment_frame_range, segment_slots, process_executors, progress, temp_video_fps, temp_video_resolution, output_video_resolution)] = segment_index
 
-					if is_process_stopping():
+					for segment_future in as_completed(segment_futures):
+						segment_index = segment_futures.get(segment_future)
+						segment_exception = segment_future.exception()
 
-						for pending_future in futures:
-							pending_future.cancel()
+						if segment_exception:
+							process_manager.stop()
 
-						futures.clear()
+							for pending_future in segment_futures:
+								pending_future.cancel()
 
-					else:
-						video_manager.write_video_frame(video_writer, future.result())
-						progress.update()
+							raise segment_exception
+
+						if not segment_future.result():
+							process_manager.stop()
+
+						if has_segment_checkpoints() and process_manager.is_processing():
+							commit_segment_checkpoint(segment_index, temp_frame_ranges[segment_index])
+
+			finally:
+				shutdown_process_executors(process_executors)
 
-		if not video_manager.close_video_writer(video_writer):
-			process_manager.stop()
+		if has_segments and process_manager.is_processing():
+			segment_paths = [ get_segment_path(segment_index, segment_frame_range) for segment_index, segment_frame_range in enumerate(temp_frame_ranges) ]
+
+			if ffmpeg.concat_video(get_temp_file_path(state_manager.get_item('target_path')), segment_paths):
+				logger.debug(translator.get('concatenating_video_succeeded'), __name__)
+			else:
+				logger.error(translator.get('concatenating_video_failed'), __name__)
+				process_manager.stop()
 
 		for processor_module in get_processors_modules(state_manager.get_item('processors')):
 			processor_module.post_process()
@@ -162,10 +519,11 @@ def process_memory_frames() -> ErrorCode:
 def merge_frames() -> ErrorCode:
 	trim_frame_start, trim_frame_end = restrict_trim_frame(state_manager.get_item('target_path'), state_manager.get_item('trim_frame_start'), state_manager.get_item('trim_frame_end'))
 	output_video_resolution = scale_resolution(detect_video_resolution(state_manager.get_item('target_path')), state_manager.get_item('output_video_scale'))
+	temp_video_resolution = restrict_video_resolution(state_manager.get_item('target_path'), output_video_resolution)
 	temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
 
 	logger.info(translator.get('merging_video').format(resolution = pack_resolution(output_video_resolution), fps = state_manager.get_item('output_video_fps')), __name__)
-	if ffmpeg.merge_video(state_manager.get_item('target_path'), temp_video_fps, output_video_resolution, state_manager.get_item('output_video_fps'), trim_frame_start, trim_frame_end):
+	if ffmpeg.merge_video(state_manager.get_item('target_path'), temp_video_fps, temp_video_resolution, output_video_resolution, state_manager.get_item('output_video_fps'), trim_frame_start, trim_frame_end):
 		logger.debug(translator.get('merging_video_succeeded'), __name__)
 	else:
 		if is_process_stopping():
@@ -207,6 +565,9 @@ def restore_audio() -> ErrorCode:
 
 
 def finalize_video(start_time : float) -> ErrorCode:
+	face_store_statistics = face_store.get_statistics()
+	logger.debug(translator.get('face_store_statistics').format(hits = face_store_statistics.get('hits'), misses = face_store_statistics.get('misses'), evictions = face_store_statistics.get('evictions'), size = face_store_statistics.get('size') // (1024 * 1024)), __name__)
+
 	if is_video(state_manager.get_item('output_path')):
 		logger.info(translator.get('processing_video_succeeded').format(seconds = calculate_end_time(start_time)), __name__)
 	else:
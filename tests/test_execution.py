@@ -1,4 +1,6 @@
-from facefusion.execution import create_inference_providers, get_available_execution_providers, has_execution_provider
+import onnxruntime
+
+from facefusion.execution import create_inference_providers, create_inference_session_options, create_session_options, get_available_execution_providers, has_execution_provider, resolve_intra_op_thread_count
 
 
 def test_has_execution_provider() -> None:
@@ -22,3 +24,31 @@ def test_create_inference_providers() -> None:
 	]
 
 	assert create_inference_providers(1, [ 'cpu', 'cuda' ]) == inference_providers
+
+
+def test_create_inference_session_options() -> None:
+	assert 'intra_op_thread_count' not in create_inference_session_options(0, 4, 1)
+	assert create_inference_session_options(16, 4, 2).get('intra_op_thread_count') == 2
+
+
+def test_create_session_options() -> None:
+	session_options = create_session_options(
+	{
+		'intra_op_thread_count': 2,
+		'execution_mode': 'parallel',
+		'graph_optimization': 'basic',
+		'enable_memory_pattern': False
+	})
+
+	assert session_options.intra_op_num_threads == 2
+	assert session_options.execution_mode == onnxruntime.ExecutionMode.ORT_PARALLEL
+	assert session_options.graph_optimization_level == onnxruntime.GraphOptimizationLevel.ORT_ENABLE_BASIC
+	assert session_options.enable_mem_pattern is False
+	assert session_options.enable_cpu_mem_arena is True
+
+
+def test_resolve_intra_op_thread_count() -> None:
+	assert resolve_intra_op_thread_count(16, 4, 1) == 4
+	assert resolve_intra_op_thread_count(16, 4, 2) == 2
+	assert resolve_intra_op_thread_count(32, 16, 1) == 2
+	assert resolve_intra_op_thread_count(2, 8, 1) == 1
@@ -0,0 +1,77 @@
+import os
+import tempfile
+
+import numpy
+import pytest
+
+from facefusion import state_manager
+from facefusion.face_cache import FACE_CACHE_LIMIT, read_faces, register_frame_total, resolve_face_cache_directory_path, write_faces
+from facefusion.types import Face
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	state_manager.init_item('download_providers', [ 'github' ])
+	state_manager.init_item('face_cache_path', tempfile.mkdtemp())
+	state_manager.init_item('face_detector_model', 'yolo_face')
+	state_manager.init_item('face_detector_size', '640x640')
+	state_manager.init_item('face_detector_margin', [ 0, 0, 0, 0 ])
+	state_manager.init_item('face_detector_angles', [ 0 ])
+	state_manager.init_item('face_detector_score', 0.5)
+	state_manager.init_item('face_landmarker_model', '2dfan4')
+	state_manager.init_item('face_landmarker_score', 0.5)
+	register_frame_total('target', 10)
+
+
+def test_read_faces() -> None:
+	face = Face(
+		origin = 'detect',
+		bounding_box = numpy.array([ 10, 20, 110, 140 ], numpy.float32),
+		score_set =
+		{
+			'detector': 0.75,
+			'landmarker': 0.5
+		},
+		landmark_set =
+		{
+			'5': numpy.ones((5, 2), numpy.float32),
+			'5/68': numpy.ones((5, 2), numpy.float32),
+			'68': numpy.ones((68, 2), numpy.float32),
+			'68/5': numpy.ones((68, 2), numpy.float32)
+		},
+		angle = 90,
+		embedding = numpy.ones(512, numpy.float32),
+		embedding_norm = numpy.ones(512, numpy.float32),
+		age = range(20, 30),
+		gender = 'female',
+		race = 'white'
+	)
+
+	assert read_faces('target_640x360_0') is None
+
+	write_faces('target_640x360_5', [ face, face ])
+	write_faces('target_640x360_2', [])
+	write_faces('target_640x360_10', [ face ])
+	write_faces('target_640x360_3', [ face ] * (FACE_CACHE_LIMIT + 1))
+	write_faces('target_0', [ face ])
+	cache_faces = read_faces('target_640x360_5')
+
+	assert len(cache_faces) == 2
+	assert numpy.array_equal(cache_faces[0].bounding_box, face.bounding_box)
+	assert numpy.array_equal(cache_faces[0].landmark_set.get('68'), face.landmark_set.get('68'))
+	assert numpy.array_equal(cache_faces[0].embedding_norm, face.embedding_norm)
+	assert cache_faces[0].score_set == face.score_set
+	assert cache_faces[0].angle == face.angle
+	assert cache_faces[0].age == face.age
+	assert cache_faces[0].gender == face.gender
+	assert read_faces('target_640x360_2') == []
+	assert read_faces('target_640x360_4') is None
+	assert read_faces('target_640x360_10') is None
+	assert read_faces('target_640x360_3') is None
+	assert read_faces('target_0') is None
+	assert read_faces(None) is None
+	assert os.listdir(resolve_face_cache_directory_path()) == [ 'target_640x360.npy' ]
+
+	state_manager.init_item('face_detector_score', 0.25)
+
+	assert read_faces('target_640x360_5') is None
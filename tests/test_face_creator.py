@@ -4,8 +4,8 @@ import pytest
 
 from facefusion import face_classifier, face_detector, face_landmarker, face_recognizer, ffmpeg, ffmpeg_builder, process_manager, state_manager
 from facefusion.download import conditional_download
-from facefusion.face_creator import average_face_geometry, get_many_faces, get_one_face, refill_faces
-from facefusion.face_store import clear_faces
+from facefusion.face_creator import analyse_static_faces, average_face_geometry, get_many_faces, get_one_face, refill_faces
+from facefusion.face_store import clear_faces, create_vision_key, get_faces
 from facefusion.vision import read_static_image
 from .helper import get_test_example_file, get_test_examples_directory
 
@@ -32,6 +32,10 @@ def before_all() -> None:
 
 	state_manager.init_item('execution_device_ids', [ 0 ])
 	state_manager.init_item('execution_providers', [ 'cpu' ])
+	state_manager.init_item('execution_thread_count', 1)
+	state_manager.init_item('execution_process_count', 1)
+	state_manager.init_item('execution_thread_budget', 0)
+	state_manager.init_item('execution_replica_count', 1)
 	state_manager.init_item('download_providers', [ 'github' ])
 	state_manager.init_item('face_detector_angles', [ 0 ])
 	state_manager.init_item('face_detector_model', 'many')
@@ -71,6 +75,13 @@ def test_get_many_faces() -> None:
 	assert len(many_faces) == 3
 
 
+def test_analyse_static_faces() -> None:
+	source_vision_frame = read_static_image(get_test_example_file('source.jpg'))
+	analyse_static_faces([ source_vision_frame ])
+
+	assert len(get_faces(create_vision_key(source_vision_frame))) == 1
+
+
 def test_refill_faces() -> None:
 	source_vision_frame = read_static_image(get_test_example_file('source.jpg'))
 	face = get_one_face(get_many_faces([ source_vision_frame ]))
@@ -31,6 +31,10 @@ def before_all() -> None:
 
 	state_manager.init_item('execution_device_ids', [ 0 ])
 	state_manager.init_item('execution_providers', [ 'cpu' ])
+	state_manager.init_item('execution_thread_count', 1)
+	state_manager.init_item('execution_process_count', 1)
+	state_manager.init_item('execution_thread_budget', 0)
+	state_manager.init_item('execution_replica_count', 1)
 	state_manager.init_item('download_providers', [ 'github' ])
 	state_manager.init_item('face_detector_angles', [ 0 ])
 	state_manager.init_item('face_detector_model', 'many')
@@ -53,9 +57,9 @@ def test_detect_with_retinaface() -> None:
 		get_test_example_file('source-60crop.jpg')
 	]
 
-	for source_path in source_paths:
-		source_frame = read_static_image(source_path)
-		bounding_boxes, face_scores, face_landmarks_5 = detect_with_retinaface(source_frame, '320x320')
+	source_frames = [ read_static_image(source_path) for source_path in source_paths ]
+
+	for bounding_boxes, face_scores, face_landmarks_5 in detect_with_retinaface(source_frames, '320x320'):
 		keep_indices = apply_nms(bounding_boxes, face_scores, 0.5, get_nms_threshold('retinaface', [ 0 ]))
 
 		assert len(keep_indices) == 1
@@ -70,9 +74,9 @@ def test_detect_with_scrfd() -> None:
 		get_test_example_file('source-60crop.jpg')
 	]
 
-	for source_path in source_paths:
-		source_frame = read_static_image(source_path)
-		bounding_boxes, face_scores, face_landmarks_5 = detect_with_scrfd(source_frame, '320x320')
+	source_frames = [ read_static_image(source_path) for source_path in source_paths ]
+
+	for bounding_boxes, face_scores, face_landmarks_5 in detect_with_scrfd(source_frames, '320x320'):
 		keep_indices = apply_nms(bounding_boxes, face_scores, 0.5, get_nms_threshold('scrfd', [ 0 ]))
 
 		assert len(keep_indices) == 1
@@ -87,9 +91,9 @@ def test_detect_with_yolo_face() -> None:
 		get_test_example_file('source-60crop.jpg')
 	]
 
-	for source_path in source_paths:
-		source_frame = read_static_image(source_path)
-		bounding_boxes, face_scores, face_landmarks_5 = detect_with_yolo_face(source_frame, '640x640')
+	source_frames = [ read_static_image(source_path) for source_path in source_paths ]
+
+	for bounding_boxes, face_scores, face_landmarks_5 in detect_with_yolo_face(source_frames, '640x640'):
 		keep_indices = apply_nms(bounding_boxes, face_scores, 0.5, get_nms_threshold('yolo_face', [ 0 ]))
 
 		assert len(keep_indices) == 1
@@ -104,9 +108,9 @@ def test_detect_with_yunet() -> None:
 		get_test_example_file('source-60crop.jpg')
 	]
 
-	for source_path in source_paths:
-		source_frame = read_static_image(source_path)
-		bounding_boxes, face_scores, face_landmarks_5 = detect_with_yunet(source_frame, '640x640')
+	source_frames = [ read_static_image(source_path) for source_path in source_paths ]
+
+	for bounding_boxes, face_scores, face_landmarks_5 in detect_with_yunet(source_frames, '640x640'):
 		keep_indices = apply_nms(bounding_boxes, face_scores, 0.5, get_nms_threshold('yunet', [ 0 ]))
 
 		assert len(keep_indices) == 1
@@ -0,0 +1,69 @@
+import numpy
+import pytest
+
+from facefusion import state_manager
+from facefusion.face_store import clear_faces, create_vision_key, get_faces, get_statistics, register_vision_key, set_faces
+from facefusion.hash_helper import create_hash
+from facefusion.types import Face
+
+
+@pytest.fixture(autouse = True)
+def before_each() -> None:
+	state_manager.init_item('face_store_memory_limit', 0)
+	clear_faces()
+
+
+def test_create_vision_key() -> None:
+	vision_frame = numpy.zeros((2, 2, 3), numpy.uint8)
+
+	assert create_vision_key(vision_frame) == create_hash(vision_frame.tobytes())
+
+	register_vision_key(vision_frame, 'target.mp4_0')
+
+	assert create_vision_key(vision_frame) == 'target.mp4_0'
+	assert create_vision_key(vision_frame.copy()) == create_hash(vision_frame.tobytes())
+
+
+def test_set_faces() -> None:
+	set_faces('target.mp4_0', [])
+
+	assert get_faces('target.mp4_0') == []
+	assert get_faces('target.mp4_1') is None
+
+	clear_faces()
+
+	assert get_faces('target.mp4_0') is None
+
+
+def test_reduce_faces() -> None:
+	face = Face(
+		origin = 'detector',
+		bounding_box = numpy.zeros(4),
+		score_set = {},
+		landmark_set = {},
+		angle = 0,
+		embedding = numpy.zeros(65536),
+		embedding_norm = numpy.zeros(65536),
+		age = range(0, 1),
+		gender = 'female',
+		race = 'white'
+	)
+	state_manager.init_item('face_store_memory_limit', 1)
+
+	for frame_number in range(3):
+		set_faces('target.mp4_' + str(frame_number), [ face ])
+
+	assert get_faces('target.mp4_0') is None
+	assert get_faces('target.mp4_1') is None
+	assert get_faces('target.mp4_2') == [ face ]
+
+	face_store_statistics = get_statistics()
+
+	assert face_store_statistics.get('evictions') == 2
+	assert face_store_statistics.get('hits') == 1
+	assert face_store_statistics.get('misses') == 2
+
+	state_manager.init_item('face_store_memory_limit', 0)
+	clear_faces()
+
+	assert get_statistics().get('size') == 0
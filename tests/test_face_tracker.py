@@ -20,6 +20,10 @@ def before_all() -> None:
 
 	state_manager.init_item('execution_device_ids', [ 0 ])
 	state_manager.init_item('execution_providers', [ 'cpu' ])
+	state_manager.init_item('execution_thread_count', 1)
+	state_manager.init_item('execution_process_count', 1)
+	state_manager.init_item('execution_thread_budget', 0)
+	state_manager.init_item('execution_replica_count', 1)
 	state_manager.init_item('download_providers', [ 'github' ])
 	state_manager.init_item('face_detector_angles', [ 0 ])
 	state_manager.init_item('face_detector_model', 'yolo_face')
@@ -3,7 +3,7 @@ import pytest
 
 from facefusion import ffmpeg, ffmpeg_builder, process_manager
 from facefusion.download import conditional_download
-from facefusion.ffprobe import extract_audio_metadata, extract_video_metadata
+from facefusion.ffprobe import extract_audio_metadata, extract_video_keyframes, extract_video_metadata
 from .helper import get_test_example_file, get_test_examples_directory
 
 
@@ -73,3 +73,12 @@ def test_extract_video_metadata() -> None:
 	assert video_metadata.get('fps') == 25.0
 	assert video_metadata.get('duration') == 1.0
 	assert video_metadata.get('resolution') == (426, 226)
+
+
+def test_extract_video_keyframes() -> None:
+	video_keyframes = extract_video_keyframes(get_test_example_file('target-240p.mp4'))
+
+	assert video_keyframes[0] == 0
+	assert video_keyframes == sorted(video_keyframes)
+	assert max(video_keyframes) < 270
+	assert extract_video_keyframes('invalid') == []
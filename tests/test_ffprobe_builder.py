@@ -1,7 +1,7 @@
 from shutil import which
 
 from facefusion import ffprobe_builder
-from facefusion.ffprobe_builder import chain, format_to_key_value, run, select_stream, set_input, show_stream_entries
+from facefusion.ffprobe_builder import chain, format_to_csv, format_to_key_value, run, select_stream, set_input, show_packet_entries, show_stream_entries
 
 
 def test_run() -> None:
@@ -27,10 +27,19 @@ def test_show_stream_entries() -> None:
 	assert show_stream_entries([ 'duration', 'sample_rate' ]) == [ '-show_entries', 'stream=duration,sample_rate' ]
 
 
+def test_show_packet_entries() -> None:
+	assert show_packet_entries([ 'pts_time' ]) == [ '-show_entries', 'packet=pts_time' ]
+	assert show_packet_entries([ 'pts_time', 'flags' ]) == [ '-show_entries', 'packet=pts_time,flags' ]
+
+
 def test_format_to_key_value() -> None:
 	assert format_to_key_value() == [ '-of', 'default=noprint_wrappers=1' ]
 
 
+def test_format_to_csv() -> None:
+	assert format_to_csv() == [ '-of', 'csv=print_section=0' ]
+
+
 def test_set_input() -> None:
 	assert set_input('input.mp3') == [ '-i', 'input.mp3' ]
 	assert set_input('input.wav') == [ '-i', 'input.wav' ]
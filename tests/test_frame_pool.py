@@ -0,0 +1,75 @@
+import numpy
+import pytest
+
+from facefusion.frame_pool import FRAME_BUFFER_SET, FRAME_POOL_SET, acquire_frame, attach_frame_buffer, clear_frame_pool, detach_frame_buffer, get_shared_memory_name, release_frame, retain_frame
+
+
+@pytest.fixture(autouse = True)
+def before_each() -> None:
+	clear_frame_pool()
+
+
+def test_acquire_frame() -> None:
+	vision_frame = acquire_frame('test', (2, 2, 3))
+	vision_frame_id = id(vision_frame)
+
+	assert vision_frame.shape == (2, 2, 3)
+	assert id(acquire_frame('test', (2, 2, 3))) != vision_frame_id
+	assert id(acquire_frame('test', (2, 3, 3))) != vision_frame_id
+
+	release_frame(vision_frame)
+
+	assert id(acquire_frame('test', (2, 2, 3))) == vision_frame_id
+
+
+def test_retain_frame() -> None:
+	vision_frame = acquire_frame('test', (2, 2, 3))
+	vision_frame_view = vision_frame[:, :, ::-1]
+	retain_frame(vision_frame_view)
+	release_frame(vision_frame)
+
+	assert acquire_frame('test', (2, 2, 3)) is not vision_frame
+
+	release_frame(vision_frame_view)
+
+	assert acquire_frame('test', (2, 2, 3)) is vision_frame
+
+
+def test_release_frame() -> None:
+	vision_frame = acquire_frame('test', (2, 2, 3))
+	release_frame(vision_frame)
+	release_frame(vision_frame)
+
+	assert FRAME_POOL_SET.get('test_2x2x3_False')[0].get('reference_total') == 0
+	assert acquire_frame('test', (2, 2, 3)) is vision_frame
+	assert acquire_frame('test', (2, 2, 3)) is not vision_frame
+
+	release_frame(numpy.zeros((2, 2, 3), dtype = numpy.uint8))
+
+	assert FRAME_POOL_SET.get('test_2x2x3_False')[0].get('reference_total') == 1
+
+
+def test_acquire_shared_frame() -> None:
+	vision_frame = acquire_frame('test', (2, 2, 3), True)
+	vision_frame[:] = 255
+
+	assert vision_frame.sum() == 255 * 12
+	assert FRAME_POOL_SET.get('test_2x2x3_True')[0].get('shared_memory').buf[0] == 255
+
+
+def test_attach_frame_buffer() -> None:
+	vision_frame = acquire_frame('test', (2, 2, 3), True)
+	frame_buffer = attach_frame_buffer(get_shared_memory_name(vision_frame), (2, 2, 3))
+	frame_buffer.get('vision_frame')[:] = 128
+	detach_frame_buffer(frame_buffer)
+
+	assert vision_frame.sum() == 128 * 12
+	assert get_shared_memory_name(acquire_frame('test', (2, 2, 3))) is None
+
+
+def test_clear_frame_pool() -> None:
+	acquire_frame('test', (2, 2, 3), True)
+	clear_frame_pool()
+
+	assert FRAME_POOL_SET == {}
+	assert FRAME_BUFFER_SET == {}
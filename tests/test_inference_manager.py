@@ -1,12 +1,19 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
 from types import SimpleNamespace
+from typing import Any, Union
 from unittest.mock import Mock, patch
 
+import numpy
 import pytest
+from onnx import TensorProto, helper
 from onnxruntime import InferenceSession
 
 from facefusion import content_analyser, state_manager
-from facefusion.execution import resolve_cache_path
-from facefusion.inference_manager import get_inference_pool, resolve_static_inference_providers
+from facefusion.execution import create_inference_session_options, resolve_cache_path
+from facefusion.inference_manager import INFERENCE_LOAD_SET, create_inference_session, get_inference_pool, has_dynamic_batch, load_optimized_inference_session, preload_inference_pools, register_inference_semaphore, resolve_inference_limit, resolve_inference_session_options, resolve_static_inference_providers, run_inference, run_inference_batch, run_inference_batches, select_inference_pool
+from facefusion.types import InferenceInputs, InferencePool
 
 
 @pytest.fixture(scope = 'module', autouse = True)
@@ -14,6 +21,46 @@ def before_all() -> None:
 	state_manager.init_item('execution_device_ids', [ 0 ])
 	state_manager.init_item('execution_providers', [ 'cpu' ])
 	state_manager.init_item('download_providers', [ 'github' ])
+	state_manager.init_item('execution_thread_count', 4)
+	state_manager.init_item('execution_process_count', 1)
+	state_manager.init_item('execution_thread_budget', 16)
+	state_manager.init_item('execution_replica_count', 1)
+
+
+def create_double_model(batch_size : Union[int, str]) -> bytes:
+	graph = helper.make_graph(
+	[
+		helper.make_node('Add', [ 'input', 'input' ], [ 'output' ])
+	], 'double',
+	[
+		helper.make_tensor_value_info('input', TensorProto.FLOAT, [ batch_size, 2 ])
+	],
+	[
+		helper.make_tensor_value_info('output', TensorProto.FLOAT, [ batch_size, 2 ])
+	])
+	model = helper.make_model(graph, opset_imports = [ helper.make_opsetid('', 13) ])
+	model.ir_version = 8
+	return model.SerializeToString()
+
+
+def create_double_session(batch_size : Union[int, str]) -> InferenceSession:
+	return InferenceSession(create_double_model(batch_size), providers = [ 'CPUExecutionProvider' ])
+
+
+def create_scalar_session() -> InferenceSession:
+	graph = helper.make_graph(
+	[
+		helper.make_node('Add', [ 'input', 'input' ], [ 'output' ])
+	], 'scalar',
+	[
+		helper.make_tensor_value_info('input', TensorProto.FLOAT, [])
+	],
+	[
+		helper.make_tensor_value_info('output', TensorProto.FLOAT, [])
+	])
+	model = helper.make_model(graph, opset_imports = [ helper.make_opsetid('', 13) ])
+	model.ir_version = 8
+	return InferenceSession(model.SerializeToString(), providers = [ 'CPUExecutionProvider' ])
 
 
 def test_get_inference_pool() -> None:
@@ -45,6 +92,104 @@ def test_get_inference_pool() -> None:
 	assert cli_inference_pool.get('nsfw_1') is ui_inference_pool.get('nsfw_1')
 
 
+def test_get_inference_pool_once() -> None:
+	def create_slow_inference_pool(*args : Any) -> InferencePool:
+		sleep(0.1)
+		return { 'lock': Mock() }
+
+	create_inference_pool = Mock(side_effect = create_slow_inference_pool)
+
+	with patch('facefusion.inference_manager.create_inference_pool', create_inference_pool):
+		with ThreadPoolExecutor(max_workers = 4) as executor:
+			inference_pools = list(executor.map(lambda _ : get_inference_pool('facefusion.content_analyser', [ 'lock' ], {}), range(4)))
+
+	assert create_inference_pool.call_count == 1
+	assert all(inference_pool is inference_pools[0] for inference_pool in inference_pools)
+
+
+def test_select_inference_pool() -> None:
+	inference_pools = [ { 'double': create_double_session('batch') } for _ in range(3) ]
+
+	with patch.dict(INFERENCE_LOAD_SET, { id(inference_pools[0].get('double')): 2, id(inference_pools[2].get('double')): 1 }):
+		assert select_inference_pool(inference_pools) is inference_pools[1]
+
+	with patch.dict(INFERENCE_LOAD_SET, { id(inference_pools[1].get('double')): 1 }):
+		assert select_inference_pool(inference_pools) in [ inference_pools[0], inference_pools[2] ]
+
+
+def test_run_inference() -> None:
+	inference_session = create_double_session('batch')
+	inference_loads = []
+
+	def run_double_session(*args : Any) -> Any:
+		inference_loads.append(INFERENCE_LOAD_SET.get(id(inference_session)))
+		return [ numpy.zeros((1, 2)) ]
+
+	with patch.object(inference_session, 'run', side_effect = run_double_session):
+		run_inference(inference_session, { 'input': numpy.zeros((1, 2), dtype = numpy.float32) })
+
+	assert inference_loads == [ 1 ]
+	assert id(inference_session) not in INFERENCE_LOAD_SET
+
+
+def test_resolve_inference_limit() -> None:
+	limit_module = SimpleNamespace(adjust_inference_limits = Mock(return_value = { 'double': 2 }))
+
+	with patch('facefusion.inference_manager.importlib', Mock(import_module = Mock(return_value = limit_module))):
+		assert resolve_inference_limit('limit_module', 'double', [ 'CPUExecutionProvider' ]) == 2
+		assert resolve_inference_limit('limit_module', 'double', [ ('ROCMExecutionProvider', {}), 'CPUExecutionProvider' ]) == 1
+		assert resolve_inference_limit('limit_module', 'other', [ 'CPUExecutionProvider' ]) == 0
+
+
+def test_run_inference_with_limit() -> None:
+	inference_session = create_double_session('batch')
+	inference_inputs =\
+	{
+		'input': numpy.zeros((1, 2), dtype = numpy.float32)
+	}
+	inference_counts = [ 0 ]
+	inference_peaks = []
+
+	def run_double_session(*args : Any) -> Any:
+		inference_counts[0] += 1
+		inference_peaks.append(inference_counts[0])
+		sleep(0.05)
+		inference_counts[0] -= 1
+		return [ numpy.zeros((1, 2)) ]
+
+	with patch.object(inference_session, 'run', side_effect = run_double_session):
+		register_inference_semaphore(inference_session, 1)
+
+		with ThreadPoolExecutor(max_workers = 4) as executor:
+			list(executor.map(lambda _ : run_inference(inference_session, inference_inputs), range(4)))
+
+		assert inference_peaks == [ 1, 1, 1, 1 ]
+
+		inference_peaks.clear()
+		register_inference_semaphore(inference_session, 0)
+
+		with ThreadPoolExecutor(max_workers = 4) as executor:
+			list(executor.map(lambda _ : run_inference(inference_session, inference_inputs), range(4)))
+
+		assert max(inference_peaks) > 1
+
+
+def test_preload_inference_pools() -> None:
+	modules = [ SimpleNamespace(__name__ = 'module_' + str(index), get_inference_pool = Mock()) for index in range(3) ]
+
+	assert preload_inference_pools(modules) is True #type:ignore[arg-type]
+
+	for module in modules:
+		assert module.get_inference_pool.call_count == 1
+
+	modules[1].get_inference_pool.side_effect = RuntimeError
+
+	assert preload_inference_pools(modules) is False #type:ignore[arg-type]
+
+	for module in modules:
+		assert module.get_inference_pool.call_count == 2
+
+
 @pytest.fixture
 def override_module() -> SimpleNamespace:
 	return SimpleNamespace(override_inference_providers = Mock(return_value = [ ('CoreMLExecutionProvider', { 'ModelFormat': 'MLProgram' }) ]))
@@ -72,3 +217,156 @@ def test_resolve_static_inference_providers(override_module : SimpleNamespace, a
 	inference_providers = resolve_static_inference_providers('test', 0)
 
 	assert inference_providers == [ ('CoreMLExecutionProvider', { 'SpecializationStrategy': 'FastPrediction', 'ModelCacheDirectory': resolve_cache_path() }) ]
+
+
+def test_create_inference_session(tmp_path : str) -> None:
+	model_path = os.path.join(tmp_path, 'double.onnx')
+	cache_path = os.path.join(tmp_path, 'caches')
+	inference_session_options = create_inference_session_options(4, 1, 1)
+
+	with open(model_path, 'wb') as model_file:
+		model_file.write(create_double_model('batch'))
+
+	with patch('facefusion.inference_manager.resolve_cache_path', return_value = cache_path):
+		create_inference_session(model_path, [ 'CPUExecutionProvider' ], inference_session_options)
+		optimized_model_paths = os.listdir(cache_path)
+
+		assert len(optimized_model_paths) == 1
+		assert optimized_model_paths[0].startswith('double.')
+
+		with patch('facefusion.inference_manager.load_optimized_inference_session', wraps = load_optimized_inference_session) as load_optimized_inference_session_mock:
+			inference_session = create_inference_session(model_path, [ 'CPUExecutionProvider' ], inference_session_options)
+
+		assert isinstance(inference_session, InferenceSession)
+		assert load_optimized_inference_session_mock.call_count == 1
+		assert os.listdir(cache_path) == optimized_model_paths
+
+
+def test_create_inference_session_without_move(tmp_path : str) -> None:
+	model_path = os.path.join(tmp_path, 'double.onnx')
+	cache_path = os.path.join(tmp_path, 'caches')
+	inference_session_options = create_inference_session_options(4, 1, 1)
+
+	with open(model_path, 'wb') as model_file:
+		model_file.write(create_double_model('batch'))
+
+	with patch('facefusion.inference_manager.resolve_cache_path', return_value = cache_path), patch('facefusion.inference_manager.move_file', return_value = False):
+		with ThreadPoolExecutor(max_workers = 4) as executor:
+			inference_sessions = list(executor.map(lambda _ : create_inference_session(model_path, [ 'CPUExecutionProvider' ], inference_session_options), range(4)))
+
+	assert all(isinstance(inference_session, InferenceSession) for inference_session in inference_sessions)
+	assert os.listdir(cache_path) == []
+
+
+def test_resolve_inference_session_options() -> None:
+	adjust_module = SimpleNamespace(adjust_inference_session_options = Mock(return_value = { 'graph_optimization': 'extended' }))
+
+	with patch('facefusion.inference_manager.importlib', Mock(import_module = Mock(return_value = adjust_module))):
+		inference_session_options = resolve_inference_session_options('adjust_module')
+
+	assert inference_session_options.get('intra_op_thread_count') == 4
+	assert inference_session_options.get('graph_optimization') == 'extended'
+
+
+def test_has_dynamic_batch() -> None:
+	assert has_dynamic_batch(create_double_session('batch')) is True
+	assert has_dynamic_batch(create_double_session(1)) is False
+	assert has_dynamic_batch(create_scalar_session()) is False
+
+
+def test_run_inference_batch() -> None:
+	inference_session = create_double_session('batch')
+	inference_inputs_list =\
+	[
+		{
+			'input': numpy.full((index + 1, 2), index, dtype = numpy.float32)
+		} for index in range(8)
+	]
+
+	session_run = inference_session.run
+
+	def run_slow_session(*args : Any) -> Any:
+		sleep(0.05)
+		return session_run(*args)
+
+	with patch.object(inference_session, 'run', side_effect = run_slow_session) as inference_session_run:
+		with ThreadPoolExecutor(max_workers = 4) as executor:
+			inference_outputs_list = list(executor.map(lambda inference_inputs: run_inference_batch(inference_session, inference_inputs), inference_inputs_list))
+
+		assert inference_session_run.call_count < 8
+
+	for index, inference_outputs in enumerate(inference_outputs_list):
+		assert inference_outputs[0].shape == (index + 1, 2)
+		assert numpy.all(inference_outputs[0] == index * 2)
+
+
+def test_run_inference_batch_without_wait() -> None:
+	inference_session = create_double_session('batch')
+	inference_inputs =\
+	{
+		'input': numpy.ones((1, 2), dtype = numpy.float32)
+	}
+
+	with patch('facefusion.inference_manager.threading.Event.wait') as event_wait:
+		inference_outputs = run_inference_batch(inference_session, inference_inputs)
+
+	assert event_wait.call_count == 0
+	assert numpy.all(inference_outputs[0] == 2)
+
+
+def test_run_inference_batch_with_error() -> None:
+	inference_session = create_double_session('batch')
+	session_run = inference_session.run
+	inference_inputs_list =\
+	[
+		{
+			'input': numpy.ones((1, 2), dtype = numpy.float32)
+		},
+		{
+			'input': numpy.ones((1, 3), dtype = numpy.float32)
+		},
+		{
+			'input': numpy.ones((1, 2), dtype = numpy.float32)
+		}
+	]
+
+	def run_slow_session(*args : Any) -> Any:
+		sleep(0.05)
+		return session_run(*args)
+
+	def run_batch(inference_inputs : InferenceInputs) -> bool:
+		try:
+			run_inference_batch(inference_session, inference_inputs)
+			return True
+		except Exception:
+			return False
+
+	with patch.object(inference_session, 'run', side_effect = run_slow_session):
+		with ThreadPoolExecutor(max_workers = 3) as executor:
+			batch_results = list(executor.map(run_batch, inference_inputs_list))
+
+	assert False in batch_results
+
+
+def test_run_inference_batches() -> None:
+	inference_session = create_double_session(1)
+	inference_inputs =\
+	{
+		'input': numpy.arange(10, dtype = numpy.float32).reshape(5, 2)
+	}
+
+	with patch.object(inference_session, 'run', wraps = inference_session.run) as inference_session_run:
+		inference_outputs = run_inference_batches(inference_session, inference_inputs, 4)
+
+		assert inference_session_run.call_count == 5
+
+	assert numpy.array_equal(inference_outputs[0], inference_inputs.get('input') * 2)
+
+	inference_session = create_double_session('batch')
+
+	with patch('facefusion.inference_manager.run_inference_batch') as run_inference_batch_mock:
+		inference_outputs = run_inference_batches(inference_session, inference_inputs, 2)
+
+		assert run_inference_batch_mock.call_count == 0
+
+	assert numpy.array_equal(inference_outputs[0], inference_inputs.get('input') * 2)
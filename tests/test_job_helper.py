@@ -1,9 +1,15 @@
 import os
 
-from facefusion.jobs.job_helper import get_step_output_path
+from facefusion.jobs.job_helper import get_step_output_path, get_step_segment_path
 
 
 def test_get_step_output_path() -> None:
 	assert get_step_output_path('test-job', 0, 'test.mp4') == 'test-test-job-0.mp4'
 	assert get_step_output_path('test-job', 0, 'test/test.mp4') == os.path.join('test', 'test-test-job-0.mp4')
 	assert get_step_output_path('test-job', 0, 'invalid') is None
+
+
+def test_get_step_segment_path() -> None:
+	assert get_step_segment_path('test-job', 0, 0, 250, 'test.mp4') == 'test-test-job-0-0-250.mp4'
+	assert get_step_segment_path('test-job', 0, 250, 500, 'test/test.mp4') == os.path.join('test', 'test-test-job-0-250-500.mp4')
+	assert get_step_segment_path('test-job', 0, 0, 250, 'invalid') is None
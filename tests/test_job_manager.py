@@ -3,7 +3,8 @@ from time import sleep
 import pytest
 
 from facefusion.jobs.job_helper import get_step_output_path
-from facefusion.jobs.job_manager import add_step, clear_jobs, count_step_total, create_job, delete_job, delete_jobs, find_job_ids, find_jobs, get_steps, init_jobs, insert_step, move_job_file, remix_step, remove_step, set_step_status, set_steps_status, submit_job, submit_jobs
+from facefusion.jobs.job_manager import add_step, add_step_segment, clear_jobs, count_step_total, create_job, delete_job, delete_jobs, find_job_ids, find_jobs, get_step_segments, get_steps, init_jobs, insert_step, move_job_file, remix_step, remove_step, set_step_status, set_steps_status, submit_job, submit_jobs
+from facefusion.types import JobSegment
 from .helper import get_test_jobs_directory
 
 
@@ -357,6 +358,31 @@ def test_set_step_status() -> None:
 	assert count_step_total('job-test-set-step-status') == 2
 
 
+def test_add_step_segment() -> None:
+	args_1 =\
+	{
+		'source_path': 'source-1.jpg',
+		'target_path': 'target-1.mp4',
+		'output_path': 'output-1.mp4'
+	}
+	step_segment : JobSegment =\
+	{
+		'frame_start': 0,
+		'frame_end': 250,
+		'path': 'output-1-job-test-add-step-segment-0-0-250.mp4'
+	}
+
+	assert add_step_segment('job-invalid', 0, step_segment) is False
+
+	create_job('job-test-add-step-segment')
+	add_step('job-test-add-step-segment', args_1)
+
+	assert get_step_segments('job-test-add-step-segment', 0) == []
+	assert add_step_segment('job-test-add-step-segment', 99, step_segment) is False
+	assert add_step_segment('job-test-add-step-segment', 0, step_segment) is True
+	assert get_step_segments('job-test-add-step-segment', 0) == [ step_segment ]
+
+
 def test_set_steps_status() -> None:
 	args_1 =\
 	{
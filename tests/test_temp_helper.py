@@ -1,11 +1,12 @@
 import os.path
 import tempfile
 
+import numpy
 import pytest
 
 from facefusion import state_manager
 from facefusion.download import conditional_download
-from facefusion.temp_helper import get_temp_directory_path, get_temp_file_path, get_temp_frame_pattern
+from facefusion.temp_helper import create_temp_directory, get_temp_directory_path, get_temp_file_path, get_temp_frame_chunk_path, get_temp_frame_pattern, get_temp_segment_path, resolve_temp_frame_chunk
 from .helper import get_test_example_file, get_test_examples_directory
 
 
@@ -24,6 +25,11 @@ def test_get_temp_file_path() -> None:
 	assert get_temp_file_path(get_test_example_file('target-240p.mp4')) == os.path.join(temp_directory, 'facefusion', 'target-240p', 'temp.mp4')
 
 
+def test_get_temp_segment_path() -> None:
+	temp_directory = tempfile.gettempdir()
+	assert get_temp_segment_path(get_test_example_file('target-240p.mp4'), 2) == os.path.join(temp_directory, 'facefusion', 'target-240p', 'temp-0002.mp4')
+
+
 def test_get_temp_directory_path() -> None:
 	temp_directory = tempfile.gettempdir()
 	assert get_temp_directory_path(get_test_example_file('target-240p.mp4')) == os.path.join(temp_directory, 'facefusion', 'target-240p')
@@ -32,3 +38,19 @@ def test_get_temp_directory_path() -> None:
 def test_get_temp_frame_pattern() -> None:
 	temp_directory = tempfile.gettempdir()
 	assert get_temp_frame_pattern(get_test_example_file('target-240p.mp4'), '%04d') == os.path.join(temp_directory, 'facefusion', 'target-240p', '%04d.png')
+
+
+def test_get_temp_frame_chunk_path() -> None:
+	temp_directory = tempfile.gettempdir()
+	assert get_temp_frame_chunk_path(get_test_example_file('target-240p.mp4')) == os.path.join(temp_directory, 'facefusion', 'target-240p', 'temp.raw')
+
+
+def test_resolve_temp_frame_chunk() -> None:
+	target_path = get_test_example_file('target-240p.mp4')
+	create_temp_directory(target_path)
+	numpy.arange(5 * 2 * 2 * 3, dtype = numpy.uint8).tofile(get_temp_frame_chunk_path(target_path))
+	temp_vision_frames = resolve_temp_frame_chunk(target_path, (2, 2, 3))
+
+	assert temp_vision_frames.shape == (5, 2, 2, 3)
+	assert temp_vision_frames[1, 0, 0, 0] == 12
+	assert resolve_temp_frame_chunk(target_path, (8, 8, 3)) is None
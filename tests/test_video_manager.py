@@ -1,3 +1,4 @@
+import os
 import tempfile
 
 import numpy
@@ -9,7 +10,7 @@ from facefusion.download import conditional_download
 from facefusion.ffprobe import extract_video_metadata
 from facefusion.frame_store import get_frame_store
 from facefusion.temp_helper import create_temp_directory, get_temp_file_path
-from facefusion.video_manager import clear_video_pool, close_video_reader, close_video_writer, collect_video_frames, conditional_seek_video_reader, drain_video_reader, get_reader, get_writer, read_video_frame, read_video_frames, seek_video_reader, write_video_frame
+from facefusion.video_manager import clear_video_pool, close_video_reader, close_video_writer, collect_video_frames, conditional_seek_video_reader, drain_video_reader, get_decoder, get_reader, get_writer, read_decoder_frames, read_video_frame, read_video_frames, resolve_keyframe_number, resolve_reader_thread_count, seek_video_reader, write_video_frame
 from .helper import get_test_example_file, get_test_examples_directory
 
 
@@ -54,6 +55,33 @@ def test_get_reader() -> None:
 	assert get_reader(get_test_example_file('target-240p-25fps.mp4'), 'read_video_frame') is video_reader
 	assert not get_reader(get_test_example_file('target-240p-25fps.mp4'), 'select_video_frames').get('id') == video_reader.get('id')
 
+	video_reader = get_reader(get_test_example_file('target-240p-25fps.mp4'), 'read_video_frame', (212, 112))
+
+	assert video_reader.get('metadata').get('resolution') == (212, 112)
+	assert read_video_frame(video_reader).shape == (112, 212, 3)
+
+
+def test_resolve_reader_thread_count() -> None:
+	state_manager.init_item('execution_thread_budget', 16)
+	state_manager.init_item('output_video_segment_count', 4)
+	state_manager.init_item('execution_process_count', 1)
+
+	assert resolve_reader_thread_count() == 4
+
+	state_manager.init_item('execution_process_count', 8)
+
+	assert resolve_reader_thread_count() == 2
+
+	state_manager.init_item('execution_thread_budget', 4)
+
+	assert resolve_reader_thread_count() == 1
+
+	state_manager.init_item('execution_thread_budget', 0)
+	state_manager.init_item('output_video_segment_count', 1)
+	state_manager.init_item('execution_process_count', 1)
+
+	assert resolve_reader_thread_count() == (os.cpu_count() or 1)
+
 
 def test_conditional_seek_video_reader() -> None:
 	video_reader = get_reader(get_test_example_file('target-240p-25fps.mp4'), 'read_video_frame')
@@ -68,6 +96,14 @@ def test_conditional_seek_video_reader() -> None:
 		assert numpy.array_equal(read_video_frame(video_reader), video_frames.get(frame_number)) is True
 
 
+def test_resolve_keyframe_number() -> None:
+	target_path = get_test_example_file('target-240p-25fps.mp4')
+
+	assert resolve_keyframe_number(target_path, 0) == 0
+	assert resolve_keyframe_number(target_path, 100) <= 100
+	assert resolve_keyframe_number(target_path, 100) >= resolve_keyframe_number(target_path, 50)
+
+
 def test_seek_video_reader() -> None:
 	video_reader = get_reader(get_test_example_file('target-240p-25fps.mp4'), 'read_video_frame')
 	video_frames = {}
@@ -132,6 +168,20 @@ def test_collect_video_frames() -> None:
 	assert video_reader.get('frame_number') == 25
 
 
+def test_read_decoder_frames() -> None:
+	video_reader = get_reader(get_test_example_file('target-240p-25fps.mp4'), 'read_video_frame')
+	video_decoder = get_decoder(get_test_example_file('target-240p-25fps.mp4'), 'select_video_frames')
+
+	assert get_decoder(get_test_example_file('target-240p-25fps.mp4'), 'select_video_frames') is video_decoder
+	assert sorted(read_decoder_frames(video_decoder, 0, 4)) == [ 0, 1, 2, 3, 4 ]
+	assert sorted(read_decoder_frames(video_decoder, 1, 3)) == [ 1, 2, 3 ]
+
+	seek_video_reader(video_reader, 120)
+
+	assert numpy.array_equal(read_decoder_frames(video_decoder, 120, 124).get(120), read_video_frame(video_reader)) is True
+	assert sorted(read_decoder_frames(video_decoder, 268, 275)) == [ 268, 269 ]
+
+
 def test_close_video_reader() -> None:
 	video_reader = get_reader(get_test_example_file('target-240p-25fps.mp4'), 'select_video_frames')
 
@@ -6,7 +6,7 @@ import pytest
 from facefusion import ffmpeg, ffmpeg_builder, process_manager
 from facefusion.common_helper import is_linux
 from facefusion.download import conditional_download
-from facefusion.vision import calculate_histogram_difference, count_trim_frame_total, count_video_frame_total, detect_image_resolution, detect_video_duration, detect_video_fps, detect_video_resolution, match_frame_color, normalize_resolution, pack_resolution, predict_video_frame_total, read_image, read_video_frame, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, scale_resolution, select_video_frames, unpack_resolution, write_image
+from facefusion.vision import calculate_histogram_difference, count_trim_frame_total, count_video_frame_total, create_tile_frames, detect_image_resolution, detect_video_duration, detect_video_fps, detect_video_resolution, match_frame_color, merge_tile_frames, normalize_resolution, pack_resolution, predict_video_frame_total, read_image, read_video_frame, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, scale_resolution, select_video_frame_range, select_video_frames, split_frame_range, unpack_resolution, write_image
 from .helper import get_test_example_file, get_test_examples_directory, get_test_output_file, prepare_test_output_directory
 
 
@@ -142,9 +142,16 @@ def test_select_video_frames() -> None:
 	assert len(select_video_frames(get_test_example_file('target-240p-25fps.mp4'), 50, 5)) == 11
 	assert len(select_video_frames(get_test_example_file('target-240p-25fps.mp4'), 1, 5)) == 11
 	assert len(select_video_frames(get_test_example_file('target-240p-25fps.mp4'), 269, 5)) == 11
+	assert select_video_frames(get_test_example_file('target-240p-25fps.mp4'), 50, 5, (212, 112))[5].shape == (112, 212, 3)
 	assert select_video_frames('invalid', 50, 5) == []
 
 
+def test_select_video_frame_range() -> None:
+	assert len(select_video_frame_range(get_test_example_file('target-240p-25fps.mp4'), 50, 59)) == 10
+	assert len(select_video_frame_range(get_test_example_file('target-240p-25fps.mp4'), 265, 274)) == 5
+	assert select_video_frame_range('invalid', 50, 59) == []
+
+
 def test_count_video_frame_total() -> None:
 	assert count_video_frame_total(get_test_example_file('target-240p-25fps.mp4')) == 270
 	assert count_video_frame_total(get_test_example_file('target-240p-30fps.mp4')) == 324
@@ -200,6 +207,13 @@ def test_restrict_trim_frame() -> None:
 	assert restrict_trim_frame(get_test_example_file('target-240p.mp4'), None, None) == (0, 270)
 
 
+def test_split_frame_range() -> None:
+	assert split_frame_range(0, 270, 270) == [ range(0, 270) ]
+	assert split_frame_range(0, 270, 68) == [ range(0, 68), range(68, 136), range(136, 204), range(204, 270) ]
+	assert split_frame_range(70, 73, 1) == [ range(70, 71), range(71, 72), range(72, 73) ]
+	assert split_frame_range(0, 0, 4) == []
+
+
 @pytest.mark.skipif(os.environ.get('CI') and is_linux(), reason = 'h264 codec not present')
 def test_detect_video_resolution() -> None:
 	assert detect_video_resolution(get_test_example_file('target-240p.mp4')) == (426, 226)
@@ -251,3 +265,20 @@ def test_match_frame_color() -> None:
 	output_vision_frame = match_frame_color(source_vision_frame, target_vision_frame)
 
 	assert calculate_histogram_difference(source_vision_frame, output_vision_frame) > 0.5
+
+
+def test_create_tile_frames() -> None:
+	vision_frame = read_image(get_test_example_file('target-240p.jpg'))
+	tile_vision_frames, pad_width, pad_height = create_tile_frames(vision_frame, (128, 8, 4))
+
+	assert tile_vision_frames.shape == (12, 128, 128, 3)
+	assert (pad_width, pad_height) == (488, 368)
+	assert numpy.array_equal(tile_vision_frames[5, 4:124, 4:124], vision_frame[112:232, 112:232])
+
+
+def test_merge_tile_frames() -> None:
+	vision_frame = read_image(get_test_example_file('target-240p.jpg'))
+	tile_vision_frames, pad_width, pad_height = create_tile_frames(vision_frame, (128, 8, 4))
+	merge_vision_frame = merge_tile_frames(tile_vision_frames, vision_frame.shape[1], vision_frame.shape[0], pad_width, pad_height, (128, 8, 4))
+
+	assert numpy.array_equal(merge_vision_frame, vision_frame)